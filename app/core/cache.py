@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    프로세스 내 TTL 캐시 (최대 개수 초과 시 LRU 방출)
+
+    - 이벤트 루프 단일 스레드에서 사용하므로 락 없음
+    - 만료된 항목은 조회 시점에 제거
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 30.0):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: OrderedDict[K, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: K, default: Optional[V] = None) -> Optional[V]:
+        """값 조회 (없거나 만료되면 default)"""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V, ttl: Optional[float] = None) -> None:
+        """값 저장 (ttl 미지정 시 기본 TTL)"""
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: K) -> None:
+        """값 삭제"""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """전체 삭제"""
+        self._data.clear()
+
+    def __contains__(self, key: object) -> bool:
+        return self.get(key) is not None  # type: ignore[arg-type]
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -0,0 +1,118 @@
+"""조건부 GET (ETag / If-None-Match)
+
+- 응답을 만들기 전에 가벼운 버전 마커(개수, 최대 updated_at 등) 조회로 ETag 계산
+- If-None-Match가 일치하면 응답 생성 없이 304 Not Modified 반환
+- ETag는 약한 ETag (W/"...") - 같은 데이터면 인코딩 차이와 무관하게 같은 의미
+
+사용 예:
+    if conditional.is_not_modified(await service.get_dashboard_version(agency_id)):
+        return conditional.not_modified_response()
+    return await service.get_dashboard(agency_id)
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Optional, TypeVar
+
+from fastapi import Request, Response, status
+
+T = TypeVar("T")
+
+# 브라우저가 매번 재검증하도록 (캐시는 하되 항상 If-None-Match로 확인)
+_CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """버전 마커로 약한 ETag 생성"""
+    digest = hashlib.blake2b(
+        "\x1f".join(repr(part) for part in parts).encode("utf-8"),
+        digest_size=12,
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match 비교 (약한 비교: W/ 접두사 무시)"""
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        if candidate.strip().removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+class ConditionalRequest:
+    """
+    요청 단위 조건부 GET 처리 (Depends로 주입)
+
+    - ETag에는 버전 마커 외에 경로, 쿼리 문자열, Accept, 앱 버전을 포함
+      (필터/페이지/응답 포맷/배포가 다르면 다른 ETag)
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self._request = request
+        self._response = response
+        self.etag: Optional[str] = None
+
+    def is_not_modified(self, *version: Any) -> bool:
+        """
+        ETag 계산 + If-None-Match 비교
+
+        - 계산한 ETag는 정상 응답 헤더에도 설정
+        """
+        request = self._request
+        self.etag = make_etag(
+            request.app.version,
+            request.url.path,
+            request.url.query,
+            request.headers.get("accept", ""),
+            *version,
+        )
+        self._response.headers["ETag"] = self.etag
+        self._response.headers["Cache-Control"] = _CACHE_CONTROL
+
+        if_none_match = request.headers.get("if-none-match")
+        return bool(if_none_match) and _etag_matches(if_none_match, self.etag)
+
+    def _copy_cookies(self, target: Response) -> None:
+        """
+        의존성 Response에 설정된 Set-Cookie 복사
+
+        - 직접 만든 Response는 의존성 Response 헤더와 병합되지 않으므로
+          슬라이딩 만료로 연장한 세션 쿠키가 빠지지 않도록 옮겨 담음
+        """
+        for cookie in self._response.headers.getlist("set-cookie"):
+            target.headers.append("set-cookie", cookie)
+
+    def not_modified_response(self) -> Response:
+        """304 Not Modified 응답 (본문 없음)"""
+        headers = {"Cache-Control": _CACHE_CONTROL}
+        if self.etag is not None:
+            headers["ETag"] = self.etag
+        vary = self._response.headers.get("Vary")
+        if vary is not None:
+            headers["Vary"] = vary
+        response = Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        self._copy_cookies(response)
+        return response
+
+    def attach(self, result: T) -> T:
+        """
+        직접 만든 Response에 ETag / Set-Cookie 헤더 적용
+
+        - 모델 반환 시에는 FastAPI가 의존성 Response 헤더를 병합하므로 그대로 반환
+        """
+        if isinstance(result, Response):
+            if self.etag is not None:
+                result.headers["ETag"] = self.etag
+                result.headers["Cache-Control"] = _CACHE_CONTROL
+            self._copy_cookies(result)
+        return result
+
+
+def get_conditional_request(request: Request, response: Response) -> ConditionalRequest:
+    """ConditionalRequest 의존성"""
+    return ConditionalRequest(request, response)
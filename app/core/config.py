@@ -19,6 +19,13 @@ class SessionStoreType(str, Enum):
     MEMORY = "memory"
 
 
+class SessionCodecType(str, Enum):
+    """세션 직렬화 포맷"""
+    JSON = "json"
+    ORJSON = "orjson"
+    MSGPACK = "msgpack"
+
+
 class StorageType(str, Enum):
     """파일 저장소 타입"""
     LOCAL = "local"
@@ -66,6 +73,10 @@ class Settings(BaseSettings):
 
     # === Session Store ===
     SESSION_STORE_TYPE: SessionStoreType = SessionStoreType.MEMORY
+    # Redis 세션 직렬화 포맷 (기존 JSON 세션은 포맷과 무관하게 계속 읽힘)
+    SESSION_CODEC: SessionCodecType = SessionCodecType.JSON
+    # 메모리 세션 저장소 최대 세션 수 (초과 시 LRU 제거)
+    SESSION_MEMORY_MAX_ENTRIES: int = 200_000
 
     # Redis
     REDIS_HOST: str = "localhost"
@@ -79,6 +90,16 @@ class Settings(BaseSettings):
     SESSION_EXPIRE_SECONDS: int = 60 * 60 * 24  # 24시간
     REMEMBER_ME_EXPIRE_SECONDS: int = 60 * 60 * 24 * 30  # 30일
     SESSION_COOKIE_NAME: str = "session_id"
+    # 슬라이딩 만료: 인증 요청마다 세션/쿠키 만료를 SESSION_EXPIRE_SECONDS 이상으로 연장
+    SESSION_SLIDING_EXPIRATION: bool = False
+    # 프로세스 내 L1 세션 캐시 (Redis 세션 저장소 앞단, pub/sub으로 무효화)
+    SESSION_L1_CACHE_ENABLED: bool = False
+    SESSION_L1_CACHE_TTL_SECONDS: float = 5.0
+    SESSION_L1_CACHE_MAX_ENTRIES: int = 10000
+
+    # === Password Hashing ===
+    BCRYPT_ROUNDS: int = 12  # 변경 시 기존 해시는 다음 로그인 때 재해싱
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt 동시 실행 상한 (스레드 풀 크기)
 
     # === File Upload ===
     UPLOAD_DIR: str = "./uploads"
@@ -90,16 +111,44 @@ class Settings(BaseSettings):
         "application/pdf",
     ]
 
+    # === List / Pagination ===
+    LIST_TOTAL_CACHE_TTL_SECONDS: int = 30  # 필터별 전체 개수 캐시 TTL
+    LIST_TOTAL_CACHE_MAX_ENTRIES: int = 1024
+    USER_PROFILE_CACHE_TTL_SECONDS: int = 300  # 목록 표시용 사용자 이름/회사명 캐시 TTL
+    USER_PROFILE_CACHE_MAX_ENTRIES: int = 10000
+    MAPPING_INDEX_CACHE_TTL_SECONDS: int = 300  # 업체-광고주 매핑 ID 캐시 TTL
+    MAPPING_INDEX_CACHE_MAX_ENTRIES: int = 10000
+    # delta sync: next_cursor를 현재 시각보다 이만큼 이전으로 (커밋이 늦은 트랜잭션의 행 누락 방지)
+    DELTA_SYNC_CURSOR_LAG_SECONDS: int = 60
+
     # === Celery / Batch ===
     CRAWL_SCHEDULE_HOUR: int = 1
     CRAWL_SCHEDULE_MINUTE: int = 0
     CRAWL_DELAY_SECONDS: int = 2
+    CRAWL_COMMIT_CHUNK_SIZE: int = 50  # 배치 결과 커밋 단위 (추적 개수)
+    CELERY_DB_POOL_SIZE: int = 5  # 워커 프로세스당 DB 커넥션 풀 크기
+    CELERY_DB_MAX_OVERFLOW: int = 10
+    SESSION_EXPOSURE_TARGET: int = 25  # 회차 전환 기준 노출 횟수
+
+    # === Rank History Retention ===
+    RANK_HISTORY_RETENTION_MONTHS: int = 6  # 원본 보존 개월 수 (이전 데이터는 주간 집계)
+    RANK_HISTORY_PARTITION_MONTHS_AHEAD: int = 3  # 미리 생성할 월 파티션 수
+    RANK_HISTORY_MAINTENANCE_HOUR: int = 4
+    RANK_HISTORY_MAINTENANCE_MINUTE: int = 0
+    LATEST_RANK_WINDOW_DAYS: int = 7  # 최신 순위 조회 시 우선 탐색 기간
 
     # === Storage ===
     STORAGE_TYPE: StorageType = StorageType.LOCAL
     S3_BUCKET: str = ""
     S3_REGION: str = "ap-northeast-2"
 
+    # === Monitoring ===
+    LOOP_MONITOR_ENABLED: bool = False  # 이벤트 루프 지연 측정 + 정지 시 스택 기록
+    LOOP_MONITOR_INTERVAL_SECONDS: float = 0.05  # 지연 측정 주기
+    LOOP_STALL_THRESHOLD_SECONDS: float = 0.1  # 이 시간 이상 루프가 멈추면 실행 중인 스택 기록
+    LOOP_LAG_LOG_INTERVAL_SECONDS: float = 10.0  # event_loop_lag 경고 로그 최소 간격 (그 사이 건수는 합산)
+    METRICS_ENABLED: bool = False  # /metrics (Prometheus 텍스트 포맷) 노출 - 인증 없음, 내부망에서만 켤 것
+
     @property
     def database_url(self) -> str:
         """비동기 DB URL"""
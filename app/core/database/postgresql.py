@@ -6,6 +6,7 @@ from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.database.database import AbstractDatabase
+from app.core.database.search_index import create_postgresql_search_indexes
 from app.core.timezone import _set_timezone
 from app.models.base import Base
 
@@ -52,6 +53,7 @@ class PostgreSQLDatabase(AbstractDatabase):
                 raise
 
     async def create_tables(self) -> None:
-        """테이블 생성"""
+        """테이블 생성 (검색 인덱스 포함)"""
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await create_postgresql_search_indexes(conn)
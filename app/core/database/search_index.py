@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# 목록 키워드 검색 대상 (테이블 → 컬럼)
+SEARCH_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "rank_trackings": ("keyword", "url"),
+    "blog_postings": ("keyword", "url"),
+    "users": ("company_name",),
+}
+
+
+def fts_table_name(table_name: str) -> str:
+    """SQLite FTS5 섀도 테이블 이름 (<table>_fts)"""
+    return f"{table_name}_fts"
+
+
+# === PostgreSQL: pg_trgm GIN 인덱스 ===
+
+
+def _postgresql_statements() -> List[str]:
+    statements = ["CREATE EXTENSION IF NOT EXISTS pg_trgm"]
+    for table_name, columns in SEARCH_COLUMNS.items():
+        for column_name in columns:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS idx_{table_name}_{column_name}_trgm "
+                f"ON {table_name} USING gin ({column_name} gin_trgm_ops)"
+            )
+    return statements
+
+
+async def create_postgresql_search_indexes(conn: AsyncConnection) -> None:
+    """ILIKE '%term%' 검색용 trigram GIN 인덱스 생성 (sql/app-ddl.sql과 동일)"""
+    for statement in _postgresql_statements():
+        await conn.execute(text(statement))
+
+
+# === SQLite: FTS5 trigram 섀도 테이블 ===
+
+
+def _sqlite_statements(table_name: str, columns: Tuple[str, ...]) -> List[str]:
+    fts_name = fts_table_name(table_name)
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{c}" for c in columns)
+    old_values = ", ".join(f"old.{c}" for c in columns)
+
+    insert_row = (
+        f"INSERT INTO {fts_name}(rowid, {column_list}) VALUES (new.id, {new_values});"
+    )
+    delete_row = (
+        f"INSERT INTO {fts_name}({fts_name}, rowid, {column_list}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+
+    return [
+        f"CREATE VIRTUAL TABLE {fts_name} USING fts5("
+        f"{column_list}, content='{table_name}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ai AFTER INSERT ON {table_name} "
+        f"BEGIN {insert_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_ad AFTER DELETE ON {table_name} "
+        f"BEGIN {delete_row} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_name}_au AFTER UPDATE OF {column_list} "
+        f"ON {table_name} BEGIN {delete_row} {insert_row} END",
+        # 기존 행 색인 (새로 만든 경우에만 실행)
+        f"INSERT INTO {fts_name}({fts_name}) VALUES ('rebuild')",
+    ]
+
+
+async def create_sqlite_search_indexes(conn: AsyncConnection) -> None:
+    """
+    FTS5 trigram 섀도 테이블 + 동기화 트리거 생성
+
+    - external content 테이블이라 원본 데이터는 중복 저장하지 않음
+    - 이미 존재하면 건너뜀 (트리거가 이후 변경을 동기화)
+    """
+    for table_name, columns in SEARCH_COLUMNS.items():
+        exists = await conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": fts_table_name(table_name)},
+        )
+        if exists.first() is not None:
+            continue
+
+        for statement in _sqlite_statements(table_name, columns):
+            await conn.execute(text(statement))
@@ -5,6 +5,7 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.database.database import AbstractDatabase
+from app.core.database.search_index import create_sqlite_search_indexes
 from app.models.base import Base
 
 
@@ -46,6 +47,7 @@ class SQLiteDatabase(AbstractDatabase):
                 raise
 
     async def create_tables(self) -> None:
-        """테이블 생성"""
+        """테이블 생성 (검색 인덱스 포함)"""
         async with self._engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
+            await create_sqlite_search_indexes(conn)
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Optional
+from contextlib import aclosing
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Dict, Optional, Type
 
-from fastapi import Cookie, Depends, HTTPException, status
+from datetime import timedelta
 
-from app.core.config import Settings
+from fastapi import Cookie, Depends, HTTPException, Response, status
+
+from app.core.config import Settings, get_settings
 from app.core.factory import get_database, get_session_store, get_storage
+from app.repositories.advertiser_repository import AdvertiserRepository
+from app.repositories.agency_repository import AgencyRepository
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -52,7 +57,25 @@ async def get_storage_dep() -> AbstractStorage:
     return _storage
 
 
+def set_session_cookie(
+    response: Response,
+    settings: Settings,
+    session_id: str,
+    max_age: int,
+) -> None:
+    """세션 쿠키 설정 (로그인, 슬라이딩 만료 연장)"""
+    response.set_cookie(
+        key=settings.SESSION_COOKIE_NAME,
+        value=session_id,
+        max_age=max_age,
+        httponly=True,
+        samesite="lax",
+        secure=False,
+    )
+
+
 async def get_current_user(
+    response: Response,
     session_id: Optional[str] = Cookie(None, alias="session_id"),
     session_store: AbstractSessionStore = Depends(get_session_store_dep),
 ) -> Dict[str, Any]:
@@ -60,6 +83,7 @@ async def get_current_user(
     현재 로그인한 사용자 정보 반환
 
     인증 필수 엔드포인트에서 사용
+    SESSION_SLIDING_EXPIRATION이면 조회와 만료 연장을 한 번에 처리하고 쿠키도 연장
     """
     if not session_id:
         raise HTTPException(
@@ -67,7 +91,21 @@ async def get_current_user(
             detail="인증이 필요합니다.",
         )
 
-    session_data = await session_store.get(session_id)
+    settings = get_settings()
+    if settings.SESSION_SLIDING_EXPIRATION:
+        result = await session_store.get_and_extend(
+            session_id,
+            expire=timedelta(seconds=settings.SESSION_EXPIRE_SECONDS),
+        )
+        session_data = None
+        if result is not None:
+            session_data, remaining = result
+            set_session_cookie(
+                response, settings, session_id, int(remaining.total_seconds())
+            )
+    else:
+        session_data = await session_store.get(session_id)
+
     if session_data is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -115,6 +153,68 @@ def require_role(*roles: str):
     return checker
 
 
+async def _profile_exists(
+    repository_cls: Type[AgencyRepository] | Type[AdvertiserRepository],
+    user_id: int,
+) -> bool:
+    """프로필 존재 확인 (이전 형식 세션 전용, 이 경우에만 DB 세션을 열어 바로 반납)"""
+    if _database is None:
+        raise RuntimeError("Database not initialized")
+
+    async with aclosing(_database.get_session()) as sessions:
+        async for db in sessions:
+            return await repository_cls(db).exists(user_id)
+    return False
+
+
+async def get_agency_id(
+    current_user: Dict[str, Any] = Depends(require_role("agency")),
+) -> int:
+    """현재 로그인한 업체의 agency_id 반환
+
+    - 로그인 시 검증해 세션에 저장한 값을 사용 (DB 세션 없음)
+    - 회원 삭제 시 세션도 삭제되므로 세션 값은 항상 유효
+    - agency_id가 없는 이전 형식 세션만 DB에서 확인
+    """
+    if "agency_id" in current_user:
+        agency_id = current_user["agency_id"]
+    else:
+        agency_id = current_user["user_id"]
+        if not await _profile_exists(AgencyRepository, agency_id):
+            agency_id = None
+
+    if agency_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="업체 정보를 찾을 수 없습니다.",
+        )
+    return agency_id
+
+
+async def get_advertiser_id(
+    current_user: Dict[str, Any] = Depends(require_role("advertiser")),
+) -> int:
+    """현재 로그인한 광고주의 advertiser_id 반환
+
+    - 로그인 시 검증해 세션에 저장한 값을 사용 (DB 세션 없음)
+    - 회원 삭제 시 세션도 삭제되므로 세션 값은 항상 유효
+    - advertiser_id가 없는 이전 형식 세션만 DB에서 확인
+    """
+    if "advertiser_id" in current_user:
+        advertiser_id = current_user["advertiser_id"]
+    else:
+        advertiser_id = current_user["user_id"]
+        if not await _profile_exists(AdvertiserRepository, advertiser_id):
+            advertiser_id = None
+
+    if advertiser_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="광고주 정보를 찾을 수 없습니다.",
+        )
+    return advertiser_id
+
+
 def require_approved():
     """
     승인된 사용자만 접근 가능 의존성
@@ -63,15 +63,32 @@ async def get_session_store(settings: Settings) -> AbstractSessionStore:
         from app.core.session.redis_store import RedisSessionStore
 
         ssl_cert_reqs = "none" if (settings.REDIS_SSL and not settings.REDIS_SSL_CERT_VERIFY) else None
+        from app.core.session.codec import SessionCodec
+
         _session_store_instance = RedisSessionStore(
             settings.redis_url,
             default_expire=default_expire,
             ssl_cert_reqs=ssl_cert_reqs,
+            codec=SessionCodec(settings.SESSION_CODEC),
         )
+
+        if settings.SESSION_L1_CACHE_ENABLED:
+            from app.core.session.cached_store import CachedSessionStore
+
+            _session_store_instance = CachedSessionStore(
+                _session_store_instance,
+                maxsize=settings.SESSION_L1_CACHE_MAX_ENTRIES,
+                ttl=settings.SESSION_L1_CACHE_TTL_SECONDS,
+                redis_url=settings.redis_url,
+                ssl_cert_reqs=ssl_cert_reqs,
+            )
     else:
         from app.core.session.memory_store import MemorySessionStore
 
-        _session_store_instance = MemorySessionStore(default_expire=default_expire)
+        _session_store_instance = MemorySessionStore(
+            default_expire=default_expire,
+            max_entries=settings.SESSION_MEMORY_MAX_ENTRIES,
+        )
 
     await _session_store_instance.connect()
     return _session_store_instance
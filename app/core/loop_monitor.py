@@ -0,0 +1,183 @@
+"""이벤트 루프 지연/정지 감지
+
+- 루프 안 태스크: 일정 주기로 sleep 후 예정 시각 대비 늦게 깨어난 만큼(지연)을 히스토그램에 기록
+- 감시 스레드: 태스크의 heartbeat가 임계값 이상 멈추면 그 순간 루프 스레드의 스택을 기록
+  (루프가 멈춘 동안에는 루프 안 코드가 실행되지 않으므로 별도 스레드에서 캡처)
+- blocking_section: 알려진 동기 호출 구간의 소요 시간을 호출 이름별로 기록
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+import structlog
+
+from app.core.config import get_settings
+from app.core.metrics import Counter, Histogram, get_metrics_registry
+
+logger = structlog.get_logger()
+
+_registry = get_metrics_registry()
+
+LOOP_LAG = _registry.register(
+    Histogram("event_loop_lag_seconds", "이벤트 루프 지연 (예정 시각 대비 늦게 깨어난 시간)")
+)
+LOOP_STALLS = _registry.register(
+    Counter("event_loop_stalls_total", "임계값 이상 이벤트 루프가 멈춘 횟수")
+)
+BLOCKING_CALLS = _registry.register(
+    Histogram(
+        "event_loop_blocking_call_seconds",
+        "이벤트 루프 스레드에서 실행된 동기 호출 소요 시간",
+        label_name="call",
+    )
+)
+
+# 정지 시 기록할 스택 최대 프레임 수 (가장 안쪽 프레임부터)
+_STACK_LIMIT = 30
+
+
+class LoopLagMonitor:
+    """
+    이벤트 루프 지연 모니터 (앱 lifespan에서 start/stop)
+
+    Args:
+        interval: 지연 측정 주기 (초)
+        stall_threshold: 정지로 판단해 스택을 기록할 지연 (초)
+        lag_log_interval: event_loop_lag 경고 로그 최소 간격 (초)
+    """
+
+    def __init__(self, interval: float, stall_threshold: float, lag_log_interval: float):
+        self._interval = interval
+        self._stall_threshold = stall_threshold
+        self._lag_log_interval = lag_log_interval
+        self._heartbeat = time.monotonic()
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+
+    async def start(self) -> None:
+        """측정 태스크 + 감시 스레드 시작"""
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._measure_loop())
+        self._watchdog = threading.Thread(
+            target=self._watch,
+            name="loop-watchdog",
+            daemon=True,
+        )
+        self._watchdog.start()
+        logger.info(
+            "loop_monitor_started",
+            interval_ms=round(self._interval * 1000, 1),
+            stall_threshold_ms=round(self._stall_threshold * 1000, 1),
+        )
+
+    async def stop(self) -> None:
+        """측정 태스크 + 감시 스레드 종료"""
+        self._stopping.set()
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog:
+            self._watchdog.join(timeout=self._interval * 2)
+            self._watchdog = None
+
+    async def _measure_loop(self) -> None:
+        """주기적으로 깨어나 지연 기록"""
+        loop = asyncio.get_running_loop()
+        last_logged = 0.0
+        suppressed = 0
+        max_lag = 0.0
+        while True:
+            expected = loop.time() + self._interval
+            await asyncio.sleep(self._interval)
+            now = loop.time()
+            lag = max(0.0, now - expected)
+            self._heartbeat = time.monotonic()
+            LOOP_LAG.observe(lag)
+
+            if lag < self._stall_threshold:
+                continue
+
+            # 정지 중 스택은 감시 스레드가 기록, 여기서는 최종 정지 시간만 (간격 제한, 그 사이는 합산)
+            suppressed += 1
+            max_lag = max(max_lag, lag)
+            if now - last_logged >= self._lag_log_interval:
+                logger.warning(
+                    "event_loop_lag",
+                    lag_ms=round(lag * 1000, 1),
+                    max_lag_ms=round(max_lag * 1000, 1),
+                    count=suppressed,
+                )
+                last_logged = now
+                suppressed = 0
+                max_lag = 0.0
+
+    def _watch(self) -> None:
+        """감시 스레드: heartbeat가 멈추면 루프 스레드 스택 기록 (정지 1회당 1번)"""
+        reported_heartbeat = None
+        while not self._stopping.wait(self._interval):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - self._interval
+            if blocked < self._stall_threshold or heartbeat == reported_heartbeat:
+                continue
+
+            reported_heartbeat = heartbeat
+            LOOP_STALLS.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = (
+                "".join(traceback.format_stack(frame, limit=_STACK_LIMIT))
+                if frame is not None
+                else None
+            )
+            logger.warning(
+                "event_loop_stalled",
+                blocked_ms=round(blocked * 1000, 1),
+                stack=stack,
+            )
+
+
+@contextmanager
+def blocking_section(name: str) -> Iterator[None]:
+    """
+    이벤트 루프 스레드에서 실행되는 동기 호출 구간 측정
+
+    사용 예:
+        with blocking_section("local_storage.read_upload"):
+            content = file.read()
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        BLOCKING_CALLS.observe(time.perf_counter() - start, label=name)
+
+
+_loop_monitor: LoopLagMonitor | None = None
+
+
+def get_loop_monitor() -> LoopLagMonitor:
+    """LoopLagMonitor 싱글턴"""
+    global _loop_monitor
+
+    if _loop_monitor is None:
+        settings = get_settings()
+        _loop_monitor = LoopLagMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_SECONDS,
+            stall_threshold=settings.LOOP_STALL_THRESHOLD_SECONDS,
+            lag_log_interval=settings.LOOP_LAG_LOG_INTERVAL_SECONDS,
+        )
+    return _loop_monitor
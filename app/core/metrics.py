@@ -0,0 +1,161 @@
+"""프로세스 내 메트릭 (Prometheus 텍스트 포맷 출력)
+
+- 외부 의존성 없이 히스토그램/카운터만 지원
+- 값은 프로세스(워커) 단위 - 워커가 여러 개면 워커별로 수집
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+# 초 단위 기본 버킷 (1ms ~ 10s)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class _HistogramSeries:
+    """히스토그램 시계열 하나 (레이블 값 단위)"""
+
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size  # 버킷별 개수 (누적 아님, 마지막은 +Inf)
+        self.sum = 0.0
+        self.count = 0
+
+
+class Histogram:
+    """
+    누적 버킷 히스토그램
+
+    - 관측은 이벤트 루프 스레드에서만 (락 없음)
+    - label_name을 지정하면 레이블 값별로 시계열 분리
+    """
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        label_name: Optional[str] = None,
+    ):
+        self.name = name
+        self.description = description
+        self._buckets = tuple(sorted(buckets))
+        self._label_name = label_name
+        self._series: Dict[Optional[str], _HistogramSeries] = {}
+
+    def observe(self, value: float, label: Optional[str] = None) -> None:
+        """값 관측 (초 단위)"""
+        series = self._series.get(label)
+        if series is None:
+            series = _HistogramSeries(len(self._buckets) + 1)
+            self._series[label] = series
+
+        series.counts[bisect.bisect_left(self._buckets, value)] += 1
+        series.sum += value
+        series.count += 1
+
+    def _labels(self, label: Optional[str], le: Optional[float] = None) -> str:
+        pairs = []
+        if self._label_name is not None and label is not None:
+            pairs.append(f'{self._label_name}="{_escape_label(label)}"')
+        if le is not None:
+            pairs.append(f'le="{_format_value(le)}"')
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 포맷 라인"""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        for label, series in list(self._series.items()):
+            cumulative = 0
+            for le, count in zip(self._buckets + (float("inf"),), series.counts):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{self._labels(label, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{self._labels(label)} {_format_value(series.sum)}")
+            lines.append(f"{self.name}_count{self._labels(label)} {series.count}")
+        return lines
+
+
+class Counter:
+    """단조 증가 카운터"""
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """카운터 증가"""
+        self._value += amount
+
+    @property
+    def value(self) -> int:
+        return self._value
+
+    def render(self) -> List[str]:
+        """Prometheus 텍스트 포맷 라인"""
+        return [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} counter",
+            f"{self.name} {self._value}",
+        ]
+
+
+Metric = Union[Histogram, Counter]
+
+
+class MetricsRegistry:
+    """메트릭 등록/출력"""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        """메트릭 등록 (같은 이름이면 기존 메트릭 반환)"""
+        return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> str:
+        """전체 메트릭 (Prometheus 텍스트 포맷)"""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+_registry: MetricsRegistry | None = None
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """MetricsRegistry 싱글턴"""
+    global _registry
+
+    if _registry is None:
+        _registry = MetricsRegistry()
+    return _registry
@@ -1,23 +1,85 @@
 from __future__ import annotations
 
+import asyncio
 import secrets
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 
 from passlib.context import CryptContext
 
+from app.core.config import get_settings
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+_settings = get_settings()
+
+# bcrypt__min_rounds: 설정보다 낮은 cost로 만든 해시는 로그인 시 재해싱 대상
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__rounds=_settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=_settings.BCRYPT_ROUNDS,
+)
+
+# bcrypt 전용 스레드 풀 (bcrypt는 해싱 중 GIL을 놓으므로 스레드로 병렬 처리)
+# - 워커 수가 동시 해싱 상한 → 로그인 폭주 시에도 CPU 사용량 제한, 나머지는 대기
+_hash_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    """비밀번호 해싱 스레드 풀 (첫 사용 시 생성)"""
+    global _hash_executor
+
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=get_settings().PASSWORD_HASH_WORKERS,
+            thread_name_prefix="password-hash",
+        )
+    return _hash_executor
+
+
+def shutdown_hash_executor() -> None:
+    """비밀번호 해싱 스레드 풀 종료 (앱 종료 시)"""
+    global _hash_executor
+
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
 
 
 def hash_password(password: str) -> str:
-    """비밀번호 해싱"""
+    """비밀번호 해싱 (동기, 스크립트용)"""
     return pwd_context.hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """비밀번호 검증"""
+    """비밀번호 검증 (동기, 스크립트용)"""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (스레드 풀에서 실행, 이벤트 루프 블로킹 없음)"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_hash_executor(), pwd_context.hash, password)
+
+
+async def verify_and_update_password(
+    plain_password: str,
+    hashed_password: str,
+) -> Tuple[bool, Optional[str]]:
+    """
+    비밀번호 검증 + 필요 시 재해싱 (스레드 풀에서 실행)
+
+    Returns:
+        (검증 성공 여부, 새 해시) - cost 설정이 바뀐 해시면 새 해시, 아니면 None
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _get_hash_executor(),
+        pwd_context.verify_and_update,
+        plain_password,
+        hashed_password,
+    )
+
+
 def generate_session_id() -> str:
     """안전한 세션 ID 생성 (32바이트 URL-safe)"""
     return secrets.token_urlsafe(32)
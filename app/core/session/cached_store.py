@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+import redis.asyncio as redis
+import structlog
+from redis.asyncio.client import PubSub
+
+from app.core.cache import TTLCache
+from app.core.session.session_store import AbstractSessionStore
+
+logger = structlog.get_logger()
+
+
+class CachedSessionStore(AbstractSessionStore):
+    """
+    2단 세션 저장소 (프로세스 내 L1 캐시 + 원본 저장소)
+
+    - 조회는 L1(짧은 TTL, 최대 개수 제한 LRU)에서 먼저 찾고 없으면 원본 조회
+    - 쓰기/삭제/갱신은 원본에 반영 후 L1 제거 + Redis pub/sub으로 다른 레플리카에 전파
+    - 무효화 메시지가 유실되더라도 다른 레플리카의 불일치는 L1 TTL 이내로 제한
+    - 슬라이딩 만료는 L1 미스(최대 L1 TTL 간격)마다 원본에서 연장
+    """
+
+    _CHANNEL = "session:invalidate"
+
+    def __init__(
+        self,
+        store: AbstractSessionStore,
+        maxsize: int = 10000,
+        ttl: float = 5.0,
+        redis_url: Optional[str] = None,
+        ssl_cert_reqs: Optional[str] = None,
+    ):
+        self._store = store
+        # session_id -> (읽기 전용 세션 데이터, 원본 만료 시각(epoch 초, 모르면 None))
+        self._cache: TTLCache[str, Tuple[Mapping[str, Any], Optional[float]]] = (
+            TTLCache(maxsize=maxsize, ttl=ttl)
+        )
+        self._redis_url = redis_url
+        self._ssl_cert_reqs = ssl_cert_reqs
+        self._client: Optional[redis.Redis] = None
+        self._listener_task: Optional[asyncio.Task] = None
+
+    async def connect(self) -> None:
+        """원본 저장소 연결 + 무효화 채널 구독"""
+        await self._store.connect()
+
+        if self._redis_url:
+            kwargs: dict[str, Any] = {
+                "encoding": "utf-8",
+                "decode_responses": True,
+            }
+            if self._ssl_cert_reqs:
+                kwargs["ssl_cert_reqs"] = self._ssl_cert_reqs
+            self._client = redis.from_url(self._redis_url, **kwargs)
+            pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            await pubsub.subscribe(self._CHANNEL)
+            self._listener_task = asyncio.create_task(self._listen(pubsub))
+
+    async def disconnect(self) -> None:
+        """구독 종료 + 원본 저장소 연결 해제"""
+        if self._listener_task:
+            self._listener_task.cancel()
+            try:
+                await self._listener_task
+            except asyncio.CancelledError:
+                pass
+            self._listener_task = None
+
+        if self._client:
+            await self._client.close()
+            self._client = None
+
+        self._cache.clear()
+        await self._store.disconnect()
+
+    async def _listen(self, pubsub: PubSub) -> None:
+        """무효화 메시지 수신 루프 (연결이 끊기면 L1 비우고 재구독)"""
+        while True:
+            try:
+                async for message in pubsub.listen():
+                    self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                await pubsub.close()
+                raise
+            except Exception:
+                # 끊긴 동안 받지 못한 무효화가 있을 수 있으므로 전체 제거
+                self._cache.clear()
+                logger.warning("session_invalidation_listener_error", exc_info=True)
+                await asyncio.sleep(1)
+
+    def _apply_invalidation(self, data: str) -> None:
+        """
+        무효화 메시지 반영
+
+        - "s:<session_id>": 해당 세션만 제거
+        - "u:<user_id>": 사용자 세션 전체 삭제 (드물어서 L1 전체 제거)
+        """
+        kind, _, value = data.partition(":")
+        if kind == "s":
+            self._cache.delete(value)
+        else:
+            self._cache.clear()
+
+    async def _publish(self, data: str) -> None:
+        """다른 레플리카에 무효화 전파 (실패해도 TTL 이내로 정리됨)"""
+        if self._client is None:
+            return
+        try:
+            await self._client.publish(self._CHANNEL, data)
+        except Exception:
+            logger.warning("session_invalidation_publish_failed", exc_info=True)
+
+    async def _invalidate(self, session_id: str) -> None:
+        """세션 1건 L1 제거 + 전파"""
+        self._cache.delete(session_id)
+        await self._publish(f"s:{session_id}")
+
+    async def get(self, session_id: str) -> Optional[Mapping[str, Any]]:
+        """세션 데이터 조회 (L1 → 원본, 복사 없이 읽기 전용 뷰 반환)"""
+        cached = self._cache.get(session_id)
+        if cached is not None:
+            return cached[0]
+
+        data = await self._store.get(session_id)
+        if data is None:
+            return None
+        data = MappingProxyType(dict(data))
+        self._cache.set(session_id, (data, None))
+        return data
+
+    async def get_and_extend(
+        self,
+        session_id: str,
+        expire: Optional[timedelta] = None,
+    ) -> Optional[Tuple[Mapping[str, Any], timedelta]]:
+        """세션 조회 + 만료 연장 (L1 적중 시 원본 연장 생략)"""
+        cached = self._cache.get(session_id)
+        if cached is not None and cached[1] is not None:
+            data, expires_at = cached
+            return data, timedelta(seconds=max(expires_at - time.time(), 0))
+
+        result = await self._store.get_and_extend(session_id, expire=expire)
+        if result is None:
+            return None
+
+        data, remaining = result
+        data = MappingProxyType(dict(data))
+        self._cache.set(session_id, (data, time.time() + remaining.total_seconds()))
+        return data, remaining
+
+    async def set(
+        self,
+        session_id: str,
+        data: Dict[str, Any],
+        expire: Optional[timedelta] = None,
+    ) -> None:
+        """세션 데이터 저장"""
+        await self._store.set(session_id, data, expire=expire)
+        await self._invalidate(session_id)
+
+    async def delete(self, session_id: str) -> None:
+        """세션 삭제"""
+        await self._store.delete(session_id)
+        await self._invalidate(session_id)
+
+    async def delete_by_user(self, user_id: int) -> int:
+        """사용자의 모든 세션 삭제"""
+        deleted = await self._store.delete_by_user(user_id)
+        self._cache.clear()
+        await self._publish(f"u:{user_id}")
+        return deleted
+
+    async def exists(self, session_id: str) -> bool:
+        """세션 존재 여부 확인"""
+        if session_id in self._cache:
+            return True
+        return await self._store.exists(session_id)
+
+    async def refresh(self, session_id: str, expire: Optional[timedelta] = None) -> bool:
+        """세션 만료 시간 갱신"""
+        refreshed = await self._store.refresh(session_id, expire=expire)
+        await self._invalidate(session_id)
+        return refreshed
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Callable, Dict
+
+import msgpack
+import orjson
+
+from app.core.config import SessionCodecType
+
+# 포맷 태그 (페이로드 첫 바이트)
+# - 태그 없음: 기존 JSON 텍스트 ('{'로 시작) → 기존 세션도 그대로 읽힘
+# - 태그는 JSON 첫 글자로 올 수 없는 제어 문자로 지정
+_TAG_ORJSON = b"\x01"
+_TAG_MSGPACK = b"\x02"
+
+
+def _json_dumps(data: Dict[str, Any]) -> bytes:
+    return json.dumps(data).encode("utf-8")
+
+
+def _orjson_dumps(data: Dict[str, Any]) -> bytes:
+    return _TAG_ORJSON + orjson.dumps(data)
+
+
+def _msgpack_dumps(data: Dict[str, Any]) -> bytes:
+    return _TAG_MSGPACK + msgpack.packb(data, use_bin_type=True)
+
+
+def _msgpack_loads(body: bytes) -> Dict[str, Any]:
+    return msgpack.unpackb(body, raw=False)
+
+
+_ENCODERS: Dict[SessionCodecType, Callable[[Dict[str, Any]], bytes]] = {
+    SessionCodecType.JSON: _json_dumps,
+    SessionCodecType.ORJSON: _orjson_dumps,
+    SessionCodecType.MSGPACK: _msgpack_dumps,
+}
+
+
+class SessionCodec:
+    """
+    세션 페이로드 직렬화 (버전 태그 포함)
+
+    - 인코딩은 설정된 포맷 하나만 사용
+    - 디코딩은 태그를 보고 모든 포맷을 읽음 (포맷 전환 중 기존 세션 유지)
+    - 태그 없는 페이로드는 기존 JSON으로 간주
+    """
+
+    def __init__(self, codec_type: SessionCodecType = SessionCodecType.JSON):
+        self.codec_type = codec_type
+        self._encode = _ENCODERS[codec_type]
+
+    def encode(self, data: Dict[str, Any]) -> bytes:
+        """세션 데이터 → 태그가 붙은 바이트"""
+        return self._encode(data)
+
+    def decode(self, payload: bytes) -> Dict[str, Any]:
+        """태그가 붙은 바이트 → 세션 데이터"""
+        tag = payload[:1]
+        if tag == _TAG_ORJSON:
+            return orjson.loads(payload[1:])
+        if tag == _TAG_MSGPACK:
+            return _msgpack_loads(payload[1:])
+        # 태그 없는 JSON도 orjson으로 읽음 (결과 동일, 더 빠름)
+        return orjson.loads(payload)
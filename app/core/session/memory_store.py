@@ -1,29 +1,47 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Set, Tuple
 
 from app.core.session.session_store import AbstractSessionStore
-from app.core.timezone import now_utc
 
 
 @dataclass
 class SessionEntry:
     """세션 엔트리"""
 
-    data: Dict[str, Any]
-    expires_at: datetime
+    data: Mapping[str, Any]  # 저장 시 복사한 읽기 전용 뷰
+    expires_at: float  # time.monotonic() 기준
 
 
 class MemorySessionStore(AbstractSessionStore):
-    """인메모리 세션 저장소 (개발/테스트용)"""
+    """
+    인메모리 세션 저장소 (단일 노드/테스트용)
 
-    def __init__(self, default_expire: timedelta = timedelta(hours=24)):
-        self._store: Dict[str, SessionEntry] = {}
+    - 이벤트 루프 단일 스레드에서만 접근하고 메서드 안에 await가 없으므로 락 없음
+    - 만료는 최소 힙으로 관리해 만료된 것만 꺼내 정리 (전체 순회 없음)
+    - 최대 개수를 넘으면 가장 오래 사용하지 않은 세션부터 제거 (LRU)
+    """
+
+    _CLEANUP_INTERVAL_SECONDS = 60
+
+    def __init__(
+        self,
+        default_expire: timedelta = timedelta(hours=24),
+        max_entries: Optional[int] = None,
+    ):
+        self._store: OrderedDict[str, SessionEntry] = OrderedDict()  # LRU 순서
+        self._user_sessions: Dict[int, Set[str]] = {}  # user_id -> 세션 ID 목록
+        # (만료 시각, 세션 ID) - 갱신/삭제된 항목은 꺼낼 때 건너뜀
+        self._expiry_heap: List[Tuple[float, str]] = []
         self._default_expire = default_expire
-        self._lock = asyncio.Lock()
+        self._max_entries = max_entries
         self._cleanup_task: Optional[asyncio.Task] = None
 
     async def connect(self) -> None:
@@ -39,36 +57,74 @@ class MemorySessionStore(AbstractSessionStore):
             except asyncio.CancelledError:
                 pass
         self._store.clear()
+        self._user_sessions.clear()
+        self._expiry_heap.clear()
 
     async def _cleanup_loop(self) -> None:
         """주기적으로 만료된 세션 정리"""
         while True:
-            await asyncio.sleep(60)  # 1분마다 정리
-            await self._cleanup_expired()
-
-    async def _cleanup_expired(self) -> None:
-        """만료된 세션 삭제"""
-        now = now_utc()
-        async with self._lock:
-            expired_keys = [
-                key for key, entry in self._store.items() if entry.expires_at <= now
-            ]
-            for key in expired_keys:
-                del self._store[key]
-
-    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
-        """세션 데이터 조회"""
-        async with self._lock:
+            await asyncio.sleep(self._CLEANUP_INTERVAL_SECONDS)
+            self._cleanup_expired()
+
+    def _cleanup_expired(self) -> None:
+        """만료된 세션 삭제 (힙에서 만료 시각이 지난 항목만 꺼냄)"""
+        now = time.monotonic()
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= now:
+            expires_at, session_id = heapq.heappop(heap)
             entry = self._store.get(session_id)
-            if entry is None:
-                return None
-
-            # 만료 확인
-            if entry.expires_at <= now_utc():
-                del self._store[session_id]
-                return None
+            # 연장/재설정된 세션은 힙에 새 항목이 있으므로 옛 항목은 무시
+            if entry is not None and entry.expires_at == expires_at:
+                self._remove(session_id)
+
+        # 연장으로 쌓인 옛 항목이 너무 많으면 힙 재구성
+        if len(heap) > 2 * len(self._store) + 1024:
+            self._expiry_heap = [
+                (entry.expires_at, session_id)
+                for session_id, entry in self._store.items()
+            ]
+            heapq.heapify(self._expiry_heap)
+
+    def _remove(self, session_id: str) -> None:
+        """세션 및 사용자 인덱스에서 제거 (힙 항목은 정리 시 건너뜀)"""
+        entry = self._store.pop(session_id, None)
+        if entry is None:
+            return
+
+        user_id = entry.data.get("user_id")
+        sessions = self._user_sessions.get(user_id)
+        if sessions is not None:
+            sessions.discard(session_id)
+            if not sessions:
+                del self._user_sessions[user_id]
+
+    def _get_entry(self, session_id: str) -> Optional[SessionEntry]:
+        """유효한 엔트리 조회 (만료 시 제거, 조회 시 LRU 갱신)"""
+        entry = self._store.get(session_id)
+        if entry is None:
+            return None
+
+        if entry.expires_at <= time.monotonic():
+            self._remove(session_id)
+            return None
+
+        self._store.move_to_end(session_id)
+        return entry
+
+    def _set_expiry(
+        self,
+        session_id: str,
+        entry: SessionEntry,
+        expires_at: float,
+    ) -> None:
+        """만료 시각 변경 + 힙 등록"""
+        entry.expires_at = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, session_id))
 
-            return entry.data.copy()
+    async def get(self, session_id: str) -> Optional[Mapping[str, Any]]:
+        """세션 데이터 조회 (복사 없이 읽기 전용 뷰 반환)"""
+        entry = self._get_entry(session_id)
+        return entry.data if entry is not None else None
 
     async def set(
         self,
@@ -76,43 +132,64 @@ class MemorySessionStore(AbstractSessionStore):
         data: Dict[str, Any],
         expire: Optional[timedelta] = None,
     ) -> None:
-        """세션 데이터 저장"""
+        """세션 데이터 저장 (최대 개수 초과 시 LRU 제거)"""
         expire = expire or self._default_expire
-        expires_at = now_utc() + expire
 
-        async with self._lock:
-            self._store[session_id] = SessionEntry(
-                data=data.copy(),
-                expires_at=expires_at,
-            )
+        self._remove(session_id)
+        entry = SessionEntry(data=MappingProxyType(dict(data)), expires_at=0.0)
+        self._store[session_id] = entry
+        self._set_expiry(session_id, entry, time.monotonic() + expire.total_seconds())
+
+        user_id = data.get("user_id")
+        if user_id is not None:
+            self._user_sessions.setdefault(user_id, set()).add(session_id)
+
+        if self._max_entries is not None and len(self._store) > self._max_entries:
+            # 만료된 것부터 정리하고, 그래도 넘치면 가장 오래 사용하지 않은 세션 제거
+            self._cleanup_expired()
+            while len(self._store) > self._max_entries:
+                self._remove(next(iter(self._store)))
 
     async def delete(self, session_id: str) -> None:
         """세션 삭제"""
-        async with self._lock:
+        self._remove(session_id)
+
+    async def delete_by_user(self, user_id: int) -> int:
+        """사용자의 모든 세션 삭제"""
+        session_ids = self._user_sessions.pop(user_id, set())
+        for session_id in session_ids:
             self._store.pop(session_id, None)
+        return len(session_ids)
 
     async def exists(self, session_id: str) -> bool:
         """세션 존재 여부 확인"""
-        async with self._lock:
-            entry = self._store.get(session_id)
-            if entry is None:
-                return False
-
-            if entry.expires_at <= now_utc():
-                del self._store[session_id]
-                return False
-
-            return True
+        return self._get_entry(session_id) is not None
 
     async def refresh(self, session_id: str, expire: Optional[timedelta] = None) -> bool:
         """세션 만료 시간 갱신"""
         expire = expire or self._default_expire
-        expires_at = now_utc() + expire
 
-        async with self._lock:
-            entry = self._store.get(session_id)
-            if entry is None:
-                return False
+        entry = self._get_entry(session_id)
+        if entry is None:
+            return False
+
+        self._set_expiry(session_id, entry, time.monotonic() + expire.total_seconds())
+        return True
+
+    async def get_and_extend(
+        self,
+        session_id: str,
+        expire: Optional[timedelta] = None,
+    ) -> Optional[Tuple[Mapping[str, Any], timedelta]]:
+        """세션 조회 + 만료 연장"""
+        expire = expire or self._default_expire
+
+        entry = self._get_entry(session_id)
+        if entry is None:
+            return None
 
-            entry.expires_at = expires_at
-            return True
+        now = time.monotonic()
+        extended = now + expire.total_seconds()
+        if entry.expires_at < extended:
+            self._set_expiry(session_id, entry, extended)
+        return entry.data, timedelta(seconds=entry.expires_at - now)
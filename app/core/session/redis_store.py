@@ -1,13 +1,71 @@
 from __future__ import annotations
 
-import json
 from datetime import timedelta
-from typing import Any, Optional
+from typing import Any, Mapping, Optional, Tuple
 
 import redis.asyncio as redis
+from redis.commands.core import AsyncScript
 
+from app.core.session.codec import SessionCodec
 from app.core.session.session_store import AbstractSessionStore
 
+# 사용자 인덱스(SET) 만료를 세션 만료 이상으로 유지 (세션 연장 스크립트 공용)
+# - 세션 값의 user_id로 인덱스 키를 만듦 (태그: \x01 orjson, \x02 msgpack, 없음 JSON)
+# - 인덱스 키는 KEYS로 선언하지 않음 (단일 Redis 전용, 클러스터 미지원)
+# - 디코딩 실패 시 연장만 생략 (세션 조회/연장은 그대로 진행)
+_EXTEND_USER_INDEX_LUA = """
+local function extend_user_index(value, user_prefix, expire_ms)
+    local ok, data = pcall(function()
+        local tag = string.byte(value, 1)
+        if tag == 2 then
+            return cmsgpack.unpack(string.sub(value, 2))
+        elseif tag == 1 then
+            return cjson.decode(string.sub(value, 2))
+        end
+        return cjson.decode(value)
+    end)
+    if not ok or type(data) ~= 'table' or type(data['user_id']) ~= 'number' then
+        return
+    end
+    local user_key = user_prefix .. string.format('%d', data['user_id'])
+    local user_ttl = redis.call('PTTL', user_key)
+    if user_ttl ~= -2 and user_ttl < expire_ms then
+        redis.call('PEXPIRE', user_key, expire_ms)
+    end
+end
+"""
+
+# 조회 + 만료 연장을 한 번의 왕복으로 처리
+# - 남은 만료 시간이 요청 값보다 짧을 때만 연장 (Remember Me 세션을 줄이지 않음)
+# - 연장하면 사용자 인덱스 만료도 함께 연장
+# - 반환: {값, 연장 후 남은 만료 시간(ms)} / 세션이 없으면 nil
+_GET_AND_EXTEND_LUA = _EXTEND_USER_INDEX_LUA + """
+local value = redis.call('GET', KEYS[1])
+if not value then
+    return nil
+end
+local ttl = redis.call('PTTL', KEYS[1])
+local expire_ms = tonumber(ARGV[1])
+if ttl >= 0 and ttl < expire_ms then
+    redis.call('PEXPIRE', KEYS[1], expire_ms)
+    ttl = expire_ms
+    extend_user_index(value, ARGV[2], expire_ms)
+end
+return {value, ttl}
+"""
+
+# 만료 시간 재설정 + 사용자 인덱스 만료 연장 (세션이 없으면 0)
+_REFRESH_LUA = _EXTEND_USER_INDEX_LUA + """
+local value = redis.call('GET', KEYS[1])
+if not value then
+    return 0
+end
+local expire_ms = tonumber(ARGV[1])
+redis.call('PEXPIRE', KEYS[1], expire_ms)
+extend_user_index(value, ARGV[2], expire_ms)
+return 1
+"""
+
 
 class RedisSessionStore(AbstractSessionStore):
     """Redis 기반 세션 저장소"""
@@ -17,24 +75,30 @@ class RedisSessionStore(AbstractSessionStore):
         redis_url: str,
         default_expire: timedelta = timedelta(hours=24),
         ssl_cert_reqs: Optional[str] = None,
+        codec: Optional[SessionCodec] = None,
     ):
         self._redis_url = redis_url
         self._default_expire = default_expire
         self._ssl_cert_reqs = ssl_cert_reqs
+        self._codec = codec or SessionCodec()
         self._client: Optional[redis.Redis] = None
+        self._get_and_extend_script: Optional[AsyncScript] = None
+        self._refresh_script: Optional[AsyncScript] = None
         self._prefix = "session:"
+        self._user_prefix = "user_sessions:"
 
     async def connect(self) -> None:
-        """Redis 연결"""
-        kwargs: dict[str, Any] = {
-            "encoding": "utf-8",
-            "decode_responses": True,
-        }
+        """Redis 연결 (세션 값은 바이너리 코덱을 쓰므로 응답을 디코딩하지 않음)"""
+        kwargs: dict[str, Any] = {"decode_responses": False}
         if self._ssl_cert_reqs:
             kwargs["ssl_cert_reqs"] = self._ssl_cert_reqs
         self._client = redis.from_url(self._redis_url, **kwargs)
         # 연결 테스트
         await self._client.ping()
+        self._get_and_extend_script = self._client.register_script(
+            _GET_AND_EXTEND_LUA
+        )
+        self._refresh_script = self._client.register_script(_REFRESH_LUA)
 
     async def disconnect(self) -> None:
         """Redis 연결 해제"""
@@ -46,7 +110,11 @@ class RedisSessionStore(AbstractSessionStore):
         """세션 키 생성"""
         return f"{self._prefix}{session_id}"
 
-    async def get(self, session_id: str) -> Optional[dict[str, Any]]:
+    def _make_user_key(self, user_id: int) -> str:
+        """사용자별 세션 ID 인덱스(SET) 키 생성"""
+        return f"{self._user_prefix}{user_id}"
+
+    async def get(self, session_id: str) -> Optional[Mapping[str, Any]]:
         """세션 데이터 조회"""
         if not self._client:
             raise RuntimeError("Redis not connected")
@@ -55,7 +123,7 @@ class RedisSessionStore(AbstractSessionStore):
         if data is None:
             return None
 
-        return json.loads(data)
+        return self._codec.decode(data)
 
     async def set(
         self,
@@ -68,11 +136,53 @@ class RedisSessionStore(AbstractSessionStore):
             raise RuntimeError("Redis not connected")
 
         expire = expire or self._default_expire
-        await self._client.setex(
-            self._make_key(session_id),
-            expire,
-            json.dumps(data),
-        )
+        user_id = data.get("user_id")
+        if user_id is None:
+            await self._client.setex(
+                self._make_key(session_id),
+                expire,
+                self._codec.encode(data),
+            )
+            return
+
+        # 세션 저장 + 사용자 인덱스 등록 (한 번의 왕복)
+        user_key = self._make_user_key(user_id)
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.setex(self._make_key(session_id), expire, self._codec.encode(data))
+            pipe.sadd(user_key, session_id)
+            pipe.smembers(user_key)
+            pipe.pttl(user_key)
+            _, _, session_ids, user_ttl_ms = await pipe.execute()
+        await self._prune_user_index(user_key, session_ids, user_ttl_ms, expire)
+
+    async def _prune_user_index(
+        self,
+        user_key: str,
+        session_ids: set[bytes],
+        user_ttl_ms: int,
+        expire: timedelta,
+    ) -> None:
+        """
+        사용자 인덱스 정리 (로그인 시 실행)
+
+        - 만료/로그아웃된 세션 ID 제거 (사용자당 크기 제한)
+        - 인덱스 만료를 새 세션 만료 이상으로 연장
+          (세션 연장 시에도 스크립트가 함께 연장하므로, 모든 세션이 만료되면 인덱스도 만료)
+        """
+        session_ids = [session_id.decode() for session_id in session_ids]
+        async with self._client.pipeline(transaction=False) as pipe:
+            for session_id in session_ids:
+                pipe.exists(self._make_key(session_id))
+            alive = await pipe.execute()
+
+        stale = [sid for sid, exists in zip(session_ids, alive) if not exists]
+        expire_ms = int(expire.total_seconds() * 1000)
+        async with self._client.pipeline(transaction=False) as pipe:
+            if stale:
+                pipe.srem(user_key, *stale)
+            if user_ttl_ms < expire_ms:
+                pipe.pexpire(user_key, expire_ms)
+            await pipe.execute()
 
     async def delete(self, session_id: str) -> None:
         """세션 삭제"""
@@ -81,6 +191,25 @@ class RedisSessionStore(AbstractSessionStore):
 
         await self._client.delete(self._make_key(session_id))
 
+    async def delete_by_user(self, user_id: int) -> int:
+        """사용자의 모든 세션 삭제 (사용자 인덱스 기준)"""
+        if not self._client:
+            raise RuntimeError("Redis not connected")
+
+        user_key = self._make_user_key(user_id)
+        session_ids = await self._client.smembers(user_key)
+        if not session_ids:
+            return 0
+
+        # 로그아웃/만료로 이미 없는 세션 ID는 삭제 수에서 제외됨
+        async with self._client.pipeline(transaction=False) as pipe:
+            pipe.delete(
+                *(self._make_key(session_id.decode()) for session_id in session_ids)
+            )
+            pipe.delete(user_key)
+            deleted, _ = await pipe.execute()
+        return deleted
+
     async def exists(self, session_id: str) -> bool:
         """세션 존재 여부 확인"""
         if not self._client:
@@ -94,7 +223,29 @@ class RedisSessionStore(AbstractSessionStore):
             raise RuntimeError("Redis not connected")
 
         expire = expire or self._default_expire
-        return await self._client.expire(
-            self._make_key(session_id),
-            int(expire.total_seconds()),
+        refreshed = await self._refresh_script(
+            keys=[self._make_key(session_id)],
+            args=[int(expire.total_seconds() * 1000), self._user_prefix],
         )
+        return bool(refreshed)
+
+    async def get_and_extend(
+        self,
+        session_id: str,
+        expire: Optional[timedelta] = None,
+    ) -> Optional[Tuple[Mapping[str, Any], timedelta]]:
+        """세션 조회 + 만료 연장 (Lua 스크립트, 단일 왕복)"""
+        if not self._client:
+            raise RuntimeError("Redis not connected")
+
+        expire = expire or self._default_expire
+        result = await self._get_and_extend_script(
+            keys=[self._make_key(session_id)],
+            args=[int(expire.total_seconds() * 1000), self._user_prefix],
+        )
+        if result is None:
+            return None
+
+        data, ttl_ms = result
+        remaining = timedelta(milliseconds=ttl_ms) if ttl_ms >= 0 else expire
+        return self._codec.decode(data), remaining
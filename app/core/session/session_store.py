@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from datetime import timedelta
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 
 class AbstractSessionStore(ABC):
@@ -19,7 +19,7 @@ class AbstractSessionStore(ABC):
         pass
 
     @abstractmethod
-    async def get(self, session_id: str) -> Optional[Dict[str, Any]]:
+    async def get(self, session_id: str) -> Optional[Mapping[str, Any]]:
         """
         세션 데이터 조회
 
@@ -27,7 +27,7 @@ class AbstractSessionStore(ABC):
             session_id: 세션 ID
 
         Returns:
-            세션 데이터 딕셔너리 또는 None (없거나 만료됨)
+            세션 데이터 (읽기 전용으로 사용) 또는 None (없거나 만료됨)
         """
         pass
 
@@ -71,6 +71,19 @@ class AbstractSessionStore(ABC):
         """
         pass
 
+    @abstractmethod
+    async def delete_by_user(self, user_id: int) -> int:
+        """
+        사용자의 모든 세션 삭제 (회원 삭제 등 세션 정보가 무효해진 경우)
+
+        Args:
+            user_id: 사용자 ID (세션 데이터의 user_id)
+
+        Returns:
+            삭제된 세션 수
+        """
+        pass
+
     @abstractmethod
     async def refresh(self, session_id: str, expire: Optional[timedelta] = None) -> bool:
         """
@@ -84,3 +97,23 @@ class AbstractSessionStore(ABC):
             성공하면 True
         """
         pass
+
+    @abstractmethod
+    async def get_and_extend(
+        self,
+        session_id: str,
+        expire: Optional[timedelta] = None,
+    ) -> Optional[Tuple[Mapping[str, Any], timedelta]]:
+        """
+        세션 조회 + 만료 연장 (슬라이딩 만료용, 원자적으로 처리)
+
+        - 남은 만료 시간이 expire보다 짧을 때만 연장 (긴 세션을 줄이지 않음)
+
+        Args:
+            session_id: 세션 ID
+            expire: 연장할 만료 시간 (None이면 기본값 사용)
+
+        Returns:
+            (세션 데이터, 연장 후 남은 만료 시간) 또는 None (없거나 만료됨)
+        """
+        pass
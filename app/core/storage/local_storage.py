@@ -6,6 +6,7 @@ from typing import BinaryIO, Optional
 
 import aiofiles
 
+from app.core.loop_monitor import blocking_section
 from app.core.storage.abstract_storage import AbstractStorage
 from app.core.timezone import now_kst
 
@@ -42,10 +43,12 @@ class LocalStorage(AbstractStorage):
         full_path = self._base_path / storage_path
 
         # 디렉토리 생성
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        with blocking_section("local_storage.mkdir"):
+            full_path.parent.mkdir(parents=True, exist_ok=True)
 
         # 파일 저장
-        content = file.read()
+        with blocking_section("local_storage.read_upload"):
+            content = file.read()
         async with aiofiles.open(full_path, "wb") as f:
             await f.write(content)
 
@@ -55,7 +58,9 @@ class LocalStorage(AbstractStorage):
         """파일 다운로드"""
         full_path = self._base_path / storage_path
 
-        if not full_path.exists():
+        with blocking_section("local_storage.exists"):
+            found = full_path.exists()
+        if not found:
             return None
 
         async with aiofiles.open(full_path, "rb") as f:
@@ -65,11 +70,13 @@ class LocalStorage(AbstractStorage):
         """파일 삭제"""
         full_path = self._base_path / storage_path
 
-        if full_path.exists():
-            full_path.unlink()
-            return True
+        with blocking_section("local_storage.unlink"):
+            if full_path.exists():
+                full_path.unlink()
+                return True
         return False
 
     async def exists(self, storage_path: str) -> bool:
         """파일 존재 여부 확인"""
-        return (self._base_path / storage_path).exists()
+        with blocking_section("local_storage.exists"):
+            return (self._base_path / storage_path).exists()
@@ -7,6 +7,7 @@ from typing import BinaryIO, Optional
 import aioboto3
 from botocore.exceptions import ClientError
 
+from app.core.loop_monitor import blocking_section
 from app.core.storage.abstract_storage import AbstractStorage
 from app.core.timezone import now_kst
 
@@ -50,7 +51,8 @@ class S3Storage(AbstractStorage):
     ) -> str:
         """파일 업로드"""
         storage_path = self._generate_storage_path(filename)
-        content = file.read()
+        with blocking_section("s3_storage.read_upload"):
+            content = file.read()
 
         await self._client.put_object(
             Bucket=self._bucket,
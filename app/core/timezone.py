@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, time
 from zoneinfo import ZoneInfo
 
 KST = ZoneInfo("Asia/Seoul")
@@ -22,6 +22,18 @@ def today_kst() -> date:
     return datetime.now(KST).date()
 
 
+def to_utc(value: datetime) -> datetime:
+    """시각을 UTC로 변환 (tzinfo가 없으면 KST로 간주)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=KST)
+    return value.astimezone(UTC)
+
+
+def kst_day_start_utc(day: date) -> datetime:
+    """KST 기준 날짜의 시작 시각 (UTC)"""
+    return datetime.combine(day, time.min, tzinfo=KST).astimezone(UTC)
+
+
 def _set_timezone(dbapi_conn, connection_record):
     """DB 세션 timezone을 KST로 설정하는 이벤트 핸들러"""
     cursor = dbapi_conn.cursor()
@@ -0,0 +1,160 @@
+"""응답 전송 포맷 협상 (Accept 헤더)
+
+- application/json (기본): 기존 객체 배열 그대로 (FastAPI response_model 직렬화)
+- application/vnd.announce.columnar+json: 객체 배열 필드를 열 단위 병렬 배열로 변환
+- application/msgpack: 기존 객체 구조를 MessagePack으로 인코딩
+- application/vnd.announce.columnar+msgpack: 열 단위 + MessagePack
+
+열 단위 예시 (histories):
+    [{"id": 1, "rank": 3, ...}, {"id": 2, "rank": 5, ...}]
+    → {"id": [1, 2], "rank": [3, 5], ...}
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Type, Union, get_args, get_origin
+
+import msgpack
+import orjson
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+MEDIA_TYPE_JSON = "application/json"
+MEDIA_TYPE_COLUMNAR_JSON = "application/vnd.announce.columnar+json"
+MEDIA_TYPE_MSGPACK = "application/msgpack"
+MEDIA_TYPE_COLUMNAR_MSGPACK = "application/vnd.announce.columnar+msgpack"
+
+
+@dataclass(frozen=True)
+class WireFormat:
+    """협상된 응답 포맷"""
+
+    media_type: str
+    columnar: bool = False
+    msgpack: bool = False
+
+    @property
+    def is_default(self) -> bool:
+        return not (self.columnar or self.msgpack)
+
+
+WIRE_FORMAT_JSON = WireFormat(MEDIA_TYPE_JSON)
+
+_WIRE_FORMATS: Dict[str, WireFormat] = {
+    MEDIA_TYPE_JSON: WIRE_FORMAT_JSON,
+    MEDIA_TYPE_COLUMNAR_JSON: WireFormat(MEDIA_TYPE_COLUMNAR_JSON, columnar=True),
+    MEDIA_TYPE_MSGPACK: WireFormat(MEDIA_TYPE_MSGPACK, msgpack=True),
+    "application/x-msgpack": WireFormat(MEDIA_TYPE_MSGPACK, msgpack=True),
+    MEDIA_TYPE_COLUMNAR_MSGPACK: WireFormat(
+        MEDIA_TYPE_COLUMNAR_MSGPACK, columnar=True, msgpack=True
+    ),
+}
+
+# OpenAPI 문서용 (라우터 responses 인자)
+WIRE_FORMAT_RESPONSES: Dict[Union[int, str], Dict[str, Any]] = {
+    200: {
+        "description": "Accept 헤더로 열 단위(columnar) 또는 MessagePack 응답 선택 가능",
+        "content": {
+            MEDIA_TYPE_COLUMNAR_JSON: {},
+            MEDIA_TYPE_MSGPACK: {},
+            MEDIA_TYPE_COLUMNAR_MSGPACK: {},
+        },
+    },
+}
+
+
+def _parse_accept(accept: str) -> List[Tuple[str, float]]:
+    """Accept 헤더 → (미디어 타입, q) 목록 (q 내림차순, 같은 q는 헤더 순서)"""
+    ranges = []
+    for part in accept.split(","):
+        media_type, _, params = part.partition(";")
+        media_type = media_type.strip().lower()
+        if not media_type:
+            continue
+
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        ranges.append((media_type, q))
+
+    return sorted(ranges, key=lambda r: -r[1])
+
+
+def get_wire_format(request: Request, response: Response) -> WireFormat:
+    """
+    응답 포맷 협상 (Depends로 사용)
+
+    - 지원하는 타입 중 q가 가장 높은 것 선택, 없거나 */*면 기본 JSON
+    - 캐시가 포맷별로 나뉘도록 항상 Vary: Accept 설정
+    """
+    response.headers["Vary"] = "Accept"
+
+    accept = request.headers.get("accept")
+    if not accept:
+        return WIRE_FORMAT_JSON
+
+    for media_type, q in _parse_accept(accept):
+        if q <= 0:
+            continue
+        wire_format = _WIRE_FORMATS.get(media_type)
+        if wire_format is None:
+            continue
+        return wire_format
+
+    return WIRE_FORMAT_JSON
+
+
+@lru_cache(maxsize=None)
+def _columnar_fields(model_type: Type[BaseModel]) -> Dict[str, Tuple[str, ...]]:
+    """모델 필드 중 List[BaseModel] 필드 → 항목 모델의 열 이름 (빈 목록에도 열 유지)"""
+    fields = {}
+    for name, field in model_type.model_fields.items():
+        annotation = field.annotation
+        if get_origin(annotation) not in (list, List):
+            continue
+        args = get_args(annotation)
+        if args and isinstance(args[0], type) and issubclass(args[0], BaseModel):
+            fields[name] = tuple(args[0].model_fields)
+    return fields
+
+
+def to_columnar(model: BaseModel) -> Dict[str, Any]:
+    """객체 배열 필드를 열 단위 병렬 배열로 변환한 JSON 호환 dict"""
+    data = model.model_dump(mode="json")
+    for name, columns in _columnar_fields(type(model)).items():
+        rows = data[name]
+        data[name] = {column: [row[column] for row in rows] for column in columns}
+    return data
+
+
+def render(
+    model: Optional[BaseModel],
+    wire_format: WireFormat,
+) -> Union[BaseModel, Response, None]:
+    """
+    협상된 포맷으로 응답 생성
+
+    - 기본 JSON이면 모델을 그대로 반환 (FastAPI 직렬화 경로 유지)
+    - 그 외에는 인코딩된 Response 반환 (response_model 직렬화 생략)
+    """
+    if model is None or wire_format.is_default:
+        return model
+
+    data = to_columnar(model) if wire_format.columnar else model.model_dump(mode="json")
+    if wire_format.msgpack:
+        content = msgpack.packb(data, use_bin_type=True)
+    else:
+        content = orjson.dumps(data)
+
+    return Response(
+        content=content,
+        media_type=wire_format.media_type,
+        headers={"Vary": "Accept"},
+    )
@@ -3,12 +3,15 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 
 import structlog
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 from app.core.config import DatabaseType, get_settings
 from app.core.dependencies import init_dependencies
 from app.core.factory import close_all, get_database
 from app.core.logging import configure_logging
+from app.core.loop_monitor import get_loop_monitor
+from app.core.metrics import get_metrics_registry
+from app.core.security import shutdown_hash_executor
 from app.core.openapi import setup_openapi
 from app.routers import (
     common_router,
@@ -42,10 +45,17 @@ async def lifespan(app: FastAPI):
         await db.create_tables()
         logger.info("sqlite_tables_created")
 
+    # 이벤트 루프 지연/정지 감지
+    if settings.LOOP_MONITOR_ENABLED:
+        await get_loop_monitor().start()
+
     yield
 
     # 종료: 정리
+    if settings.LOOP_MONITOR_ENABLED:
+        await get_loop_monitor().stop()
     await close_all()
+    shutdown_hash_executor()
     logger.info("app_shutdown")
 
 
@@ -74,6 +84,17 @@ async def health_check():
     return {"status": "ok"}
 
 
+if get_settings().METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        """프로세스(워커) 메트릭 (Prometheus 텍스트 포맷)"""
+        return Response(
+            content=get_metrics_registry().render(),
+            media_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+
 @app.get("/")
 async def root():
     """루트"""
@@ -4,7 +4,14 @@ from app.models.file import File, FileType
 from app.models.advertiser import Advertiser
 from app.models.agency import Agency, AgencyCategory
 from app.models.agency_advertiser_mapping import AgencyAdvertiserMapping
-from app.models.tracking import RankHistory, RankTracking, RankType, TrackingStatus
+from app.models.tracking import (
+    RankHistory,
+    RankHistoryRollup,
+    RankTracking,
+    RankType,
+    TrackingSessionSummary,
+    TrackingStatus,
+)
 from app.models.work_records import BlogPosting, CafeInfiltration, PressArticle
 
 __all__ = [
@@ -21,8 +28,10 @@ __all__ = [
     "AgencyAdvertiserMapping",
     "RankTracking",
     "RankHistory",
+    "RankHistoryRollup",
     "RankType",
     "TrackingStatus",
+    "TrackingSessionSummary",
     "BlogPosting",
     "PressArticle",
     "CafeInfiltration",
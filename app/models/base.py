@@ -30,9 +30,14 @@ class KSTDateTime(types.TypeDecorator):
 
 
 class Base(DeclarativeBase):
-    """모든 모델의 기본 클래스"""
+    """
+    모든 모델의 기본 클래스
 
-    pass
+    - eager_defaults: INSERT/UPDATE 시 서버 기본값(id, created_at, updated_at)을
+      RETURNING으로 함께 받아옴 (flush 후 refresh 불필요)
+    """
+
+    __mapper_args__ = {"eager_defaults": True}
 
 
 class TimestampMixin:
@@ -1,13 +1,17 @@
+from app.models.tracking.rank_history_rollup import RankHistoryRollup
 from app.models.tracking.rank_tracking import (
     RankHistory,
     RankTracking,
     RankType,
     TrackingStatus,
 )
+from app.models.tracking.tracking_session_summary import TrackingSessionSummary
 
 __all__ = [
     "RankTracking",
     "RankHistory",
+    "RankHistoryRollup",
     "RankType",
     "TrackingStatus",
+    "TrackingSessionSummary",
 ]
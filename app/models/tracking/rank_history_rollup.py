@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Date, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class RankHistoryRollup(Base):
+    """
+    순위 히스토리 주간 집계 모델
+
+    - 보존 기간이 지난 rank_histories를 (추적, 회차, 주) 단위로 집계해 보관
+    - 원본 파티션은 집계 후 분리/삭제
+    - 평균 순위 = rank_sum / exposure_count
+    """
+
+    __tablename__ = "rank_history_rollups"
+
+    # 복합 Primary Key (FK 제약 없음)
+    tracking_id: Mapped[int] = mapped_column(
+        primary_key=True,
+    )  # references: rank_trackings.id
+    session_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+    period_start: Mapped[date] = mapped_column(Date, primary_key=True)  # 주 시작일 (KST 월요일)
+
+    check_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    exposure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    best_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    worst_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    rank_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RankHistoryRollup(tracking_id={self.tracking_id}, "
+            f"session_number={self.session_number}, period_start={self.period_start})>"
+        )
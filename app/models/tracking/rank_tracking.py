@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Integer, String, Text, func, literal_column
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -81,16 +81,24 @@ class RankTracking(Base, TimestampMixin):
         default=1,
     )
 
-    # Relationships (FK 제약 없이 primaryjoin으로 연결)
+    # 변경 카운터 (UPDATE마다 +1, 조건부 GET 버전 마커)
+    # - updated_at은 트랜잭션 시작 시각이라 같은 시각/늦게 커밋된 변경을 구분하지 못함
+    version: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        default=1,
+        server_default="1",
+        onupdate=literal_column("version + 1"),
+    )
+
+    # Relationships (FK 제약 없이 primaryjoin으로 연결, 로딩 방식은 리포지토리 LoadProfile로 지정)
     agency: Mapped["Agency"] = relationship(
         "Agency",
-        lazy="joined",
         primaryjoin="RankTracking.agency_id == Agency.id",
         foreign_keys="RankTracking.agency_id",
     )
     advertiser: Mapped["Advertiser"] = relationship(
         "Advertiser",
-        lazy="joined",
         primaryjoin="RankTracking.advertiser_id == Advertiser.id",
         foreign_keys="RankTracking.advertiser_id",
     )
@@ -138,6 +146,14 @@ class RankHistory(Base):
         nullable=False,
     )
 
+    # 변경 일시 (생성/같은 날 재크롤링 갱신, delta sync 커서 기준)
+    updated_at: Mapped[datetime] = mapped_column(
+        KSTDateTime(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
     # Relationships (FK 제약 없이 primaryjoin으로 연결)
     tracking: Mapped["RankTracking"] = relationship(
         "RankTracking",
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import Integer, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base, KSTDateTime
+
+
+class TrackingSessionSummary(Base):
+    """
+    추적 회차별 요약 모델
+
+    - 히스토리 저장 시 증분 갱신 (회차 전환 판단, 진행률 표시용)
+    - 평균 순위 = rank_sum / exposure_count
+    """
+
+    __tablename__ = "tracking_session_summaries"
+
+    # 복합 Primary Key (FK 제약 없음)
+    tracking_id: Mapped[int] = mapped_column(
+        primary_key=True,
+    )  # references: rank_trackings.id
+    session_number: Mapped[int] = mapped_column(Integer, primary_key=True)
+
+    check_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    exposure_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    best_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    worst_rank: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    rank_sum: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    first_checked_at: Mapped[datetime] = mapped_column(KSTDateTime(), nullable=False)
+    last_checked_at: Mapped[datetime] = mapped_column(KSTDateTime(), nullable=False)
+
+    # 변경 일시 (upsert/재계산 시 갱신, 목록 delta sync에서 새 순위 반영 여부 판단)
+    updated_at: Mapped[datetime] = mapped_column(
+        KSTDateTime(),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+        index=True,
+    )
+
+    @property
+    def avg_rank(self) -> Optional[float]:
+        """평균 순위 (노출 기준)"""
+        if not self.exposure_count:
+            return None
+        return round(self.rank_sum / self.exposure_count, 2)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TrackingSessionSummary(tracking_id={self.tracking_id}, "
+            f"session_number={self.session_number}, exposure_count={self.exposure_count})>"
+        )
@@ -44,16 +44,14 @@ class BlogPosting(Base, TimestampMixin):
     url: Mapped[str] = mapped_column(Text, nullable=False)
     posting_date: Mapped[date] = mapped_column(Date, nullable=False, index=True)
 
-    # Relationships (FK 제약 없이 primaryjoin으로 연결)
+    # Relationships (FK 제약 없이 primaryjoin으로 연결, 로딩 방식은 리포지토리 LoadProfile로 지정)
     agency: Mapped["Agency"] = relationship(
         "Agency",
-        lazy="joined",
         primaryjoin="BlogPosting.agency_id == Agency.id",
         foreign_keys="BlogPosting.agency_id",
     )
     advertiser: Mapped["Advertiser"] = relationship(
         "Advertiser",
-        lazy="joined",
         primaryjoin="BlogPosting.advertiser_id == Advertiser.id",
         foreign_keys="BlogPosting.advertiser_id",
     )
@@ -39,10 +39,9 @@ class CafeInfiltration(Base, TimestampMixin):
     cafe_name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Relationships (FK 제약 없이 primaryjoin으로 연결)
+    # Relationships (FK 제약 없이 primaryjoin으로 연결, 로딩 방식은 리포지토리 LoadProfile로 지정)
     advertiser: Mapped["Advertiser"] = relationship(
         "Advertiser",
-        lazy="joined",
         primaryjoin="CafeInfiltration.advertiser_id == Advertiser.id",
         foreign_keys="CafeInfiltration.advertiser_id",
     )
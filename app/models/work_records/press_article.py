@@ -38,10 +38,9 @@ class PressArticle(Base, TimestampMixin):
     content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     url: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    # Relationships (FK 제약 없이 primaryjoin으로 연결)
+    # Relationships (FK 제약 없이 primaryjoin으로 연결, 로딩 방식은 리포지토리 LoadProfile로 지정)
     advertiser: Mapped["Advertiser"] = relationship(
         "Advertiser",
-        lazy="joined",
         primaryjoin="PressArticle.advertiser_id == Advertiser.id",
         foreign_keys="PressArticle.advertiser_id",
     )
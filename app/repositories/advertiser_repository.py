@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import Select, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.advertiser import Advertiser
 from app.models.user import ApprovalStatus, User
+from app.repositories.helpers import (
+    estimate_table_count,
+    fetch_page_with_total,
+    invalidate_list_totals,
+)
 
 
 class AdvertiserRepository:
@@ -33,14 +38,31 @@ class AdvertiserRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def get_all(
+    def _apply_filters(
         self,
+        stmt: Select,
         approval_status: Optional[ApprovalStatus] = None,
         search: Optional[str] = None,
-        skip: int = 0,
-        limit: int = 100,
-    ) -> List[Advertiser]:
-        """광고주 목록 조회"""
+    ) -> Select:
+        """목록/개수 조회 공통 필터 적용 (User 조인 필요)"""
+        if approval_status:
+            stmt = stmt.where(User.approval_status == approval_status)
+
+        if search:
+            stmt = stmt.where(
+                (User.name.ilike(f"%{search}%"))
+                | (User.company_name.ilike(f"%{search}%"))
+                | (User.email.ilike(f"%{search}%"))
+            )
+
+        return stmt
+
+    def _list_stmt(
+        self,
+        approval_status: Optional[ApprovalStatus] = None,
+        search: Optional[str] = None,
+    ) -> Select:
+        """목록 조회 쿼리 (정렬 포함, 페이징 제외)"""
         stmt = (
             select(Advertiser)
             .options(
@@ -50,21 +72,45 @@ class AdvertiserRepository:
             )
             .join(Advertiser.user)
         )
+        stmt = self._apply_filters(stmt, approval_status, search)
+        return stmt.order_by(User.created_at.desc())
 
-        if approval_status:
-            stmt = stmt.where(User.approval_status == approval_status)
-
-        if search:
-            stmt = stmt.where(
-                (User.name.ilike(f"%{search}%"))
-                | (User.company_name.ilike(f"%{search}%"))
-                | (User.email.ilike(f"%{search}%"))
-            )
+    async def exists(self, advertiser_id: int) -> bool:
+        """광고주 존재 여부 (관계 로딩 없음)"""
+        stmt = select(Advertiser.id).where(Advertiser.id == advertiser_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
 
-        stmt = stmt.order_by(User.created_at.desc()).offset(skip).limit(limit)
+    async def get_all(
+        self,
+        approval_status: Optional[ApprovalStatus] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[Advertiser]:
+        """광고주 목록 조회"""
+        stmt = self._list_stmt(approval_status, search).offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().unique().all())
 
+    async def get_all_with_total(
+        self,
+        approval_status: Optional[ApprovalStatus] = None,
+        search: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> Tuple[List[Advertiser], int]:
+        """광고주 목록 + 전체 개수 조회 (단일 왕복)"""
+        return await fetch_page_with_total(
+            self._session,
+            self._list_stmt(approval_status, search),
+            skip=skip,
+            limit=limit,
+            namespace=Advertiser.__tablename__,
+            signature=(approval_status, search),
+            count_fallback=lambda: self.count_all(approval_status, search),
+        )
+
     async def count_all(
         self,
         approval_status: Optional[ApprovalStatus] = None,
@@ -72,20 +118,18 @@ class AdvertiserRepository:
     ) -> int:
         """광고주 수 조회"""
         stmt = select(func.count(Advertiser.id)).join(Advertiser.user)
-
-        if approval_status:
-            stmt = stmt.where(User.approval_status == approval_status)
-
-        if search:
-            stmt = stmt.where(
-                (User.name.ilike(f"%{search}%"))
-                | (User.company_name.ilike(f"%{search}%"))
-                | (User.email.ilike(f"%{search}%"))
-            )
-
+        stmt = self._apply_filters(stmt, approval_status, search)
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    async def estimate_count(self) -> int:
+        """필터 없는 전체 광고주 수 추정 (관리자 목록용)"""
+        return await estimate_table_count(
+            self._session,
+            Advertiser.__tablename__,
+            exact_count=self.count_all,
+        )
+
     async def create(self, advertiser: Advertiser) -> Advertiser:
         """광고주 생성
 
@@ -93,12 +137,32 @@ class AdvertiserRepository:
         """
         self._session.add(advertiser)
         await self._session.flush()
-        await self._session.refresh(advertiser)
+        invalidate_list_totals(Advertiser.__tablename__)
         return advertiser
 
+    async def get_existing_ids(self, advertiser_ids: List[int]) -> List[int]:
+        """존재하는 광고주 ID만 반환 (단일 쿼리, 관계 로딩 없음)"""
+        if not advertiser_ids:
+            return []
+
+        stmt = select(Advertiser.id).where(Advertiser.id.in_(set(advertiser_ids)))
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_file_ids(self, advertiser_id: int) -> List[int]:
+        """광고주에 연결된 파일 ID 목록 (사업자등록증, 로고)"""
+        stmt = select(
+            Advertiser.business_license_file_id,
+            Advertiser.logo_file_id,
+        ).where(Advertiser.id == advertiser_id)
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None:
+            return []
+        return [file_id for file_id in row if file_id is not None]
+
     async def delete(self, advertiser_id: int) -> None:
-        """광고주 삭제"""
-        advertiser = await self.get_by_id(advertiser_id)
-        if advertiser:
-            await self._session.delete(advertiser)
-            await self._session.flush()
+        """광고주 삭제 (DELETE 한 번, 엔티티 로딩 없음)"""
+        await self._session.execute(
+            delete(Advertiser).where(Advertiser.id == advertiser_id)
+        )
+        invalidate_list_totals(Advertiser.__tablename__)
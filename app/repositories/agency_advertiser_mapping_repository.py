@@ -2,13 +2,14 @@ from __future__ import annotations
 
 from typing import List, Tuple
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, delete, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
 from app.models.advertiser import Advertiser
 from app.models.agency import Agency
 from app.models.agency_advertiser_mapping import AgencyAdvertiserMapping
+from app.repositories.helpers import dialect_insert
 
 
 class AgencyAdvertiserMappingRepository:
@@ -68,6 +69,14 @@ class AgencyAdvertiserMappingRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().unique().all())
 
+    async def get_advertiser_ids(self, agency_id: int) -> List[int]:
+        """업체에 매핑된 광고주 ID 목록 (ID만 조회, join 없음)"""
+        stmt = select(AgencyAdvertiserMapping.advertiser_id).where(
+            AgencyAdvertiserMapping.agency_id == agency_id
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
     async def exists(self, agency_id: int, advertiser_id: int) -> bool:
         """매핑 존재 여부 확인"""
         stmt = select(AgencyAdvertiserMapping.agency_id).where(
@@ -83,18 +92,32 @@ class AgencyAdvertiserMappingRepository:
         """매핑 생성"""
         self._session.add(mapping)
         await self._session.flush()
-        await self._session.refresh(mapping)
         return mapping
 
-    async def create_bulk(
-        self, mappings: List[AgencyAdvertiserMapping]
-    ) -> List[AgencyAdvertiserMapping]:
-        """매핑 일괄 생성"""
-        self._session.add_all(mappings)
-        await self._session.flush()
-        for mapping in mappings:
-            await self._session.refresh(mapping)
-        return mappings
+    async def create_bulk(self, agency_id: int, advertiser_ids: List[int]) -> int:
+        """
+        매핑 일괄 생성 (INSERT ... ON CONFLICT DO NOTHING, 단일 문)
+
+        - 이미 있는 매핑은 건너뜀 (존재 여부 사전 조회 불필요)
+
+        Returns:
+            새로 생성된 매핑 수
+        """
+        if not advertiser_ids:
+            return 0
+
+        stmt = (
+            dialect_insert(self._session)(AgencyAdvertiserMapping)
+            .values(
+                [
+                    {"agency_id": agency_id, "advertiser_id": advertiser_id}
+                    for advertiser_id in dict.fromkeys(advertiser_ids)
+                ]
+            )
+            .on_conflict_do_nothing(index_elements=["agency_id", "advertiser_id"])
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
 
     async def delete(self, mapping: AgencyAdvertiserMapping) -> None:
         """매핑 삭제"""
@@ -112,20 +135,28 @@ class AgencyAdvertiserMappingRepository:
             return True
         return False
 
-    async def delete_by_agency_or_advertiser_id(self, user_id: int) -> int:
-        """agency_id 또는 advertiser_id가 user_id인 모든 매핑 삭제
+    async def delete_by_agency_or_advertiser_id(
+        self, user_id: int
+    ) -> List[Tuple[int, int]]:
+        """agency_id 또는 advertiser_id가 user_id인 모든 매핑 삭제 (DELETE 한 번)
 
         Note: CASCADE DELETE 대체용 (애플리케이션 레벨 삭제)
-        """
-        # agency_id가 user_id인 매핑 조회 및 삭제
-        agency_mappings = await self.get_by_agency_id(user_id)
-        for mapping in agency_mappings:
-            await self._session.delete(mapping)
-
-        # advertiser_id가 user_id인 매핑 조회 및 삭제
-        advertiser_mappings = await self.get_by_advertiser_id(user_id)
-        for mapping in advertiser_mappings:
-            await self._session.delete(mapping)
 
-        await self._session.flush()
-        return len(agency_mappings) + len(advertiser_mappings)
+        Returns:
+            삭제된 (agency_id, advertiser_id) 목록 (매핑 캐시 무효화용)
+        """
+        stmt = (
+            delete(AgencyAdvertiserMapping)
+            .where(
+                or_(
+                    AgencyAdvertiserMapping.agency_id == user_id,
+                    AgencyAdvertiserMapping.advertiser_id == user_id,
+                )
+            )
+            .returning(
+                AgencyAdvertiserMapping.agency_id,
+                AgencyAdvertiserMapping.advertiser_id,
+            )
+        )
+        result = await self._session.execute(stmt)
+        return [(row.agency_id, row.advertiser_id) for row in result.all()]
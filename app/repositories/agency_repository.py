@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -29,6 +29,12 @@ class AgencyRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def exists(self, agency_id: int) -> bool:
+        """대행사 존재 여부 (관계 로딩 없음)"""
+        stmt = select(Agency.id).where(Agency.id == agency_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() is not None
+
     async def get_all(
         self,
         approval_status: Optional[ApprovalStatus] = None,
@@ -81,12 +87,8 @@ class AgencyRepository:
         """
         self._session.add(agency)
         await self._session.flush()
-        await self._session.refresh(agency)
         return agency
 
     async def delete(self, agency_id: int) -> None:
-        """대행사 삭제"""
-        agency = await self.get_by_id(agency_id)
-        if agency:
-            await self._session.delete(agency)
-            await self._session.flush()
+        """대행사 삭제 (DELETE 한 번, 엔티티 로딩 없음)"""
+        await self._session.execute(delete(Agency).where(Agency.id == agency_id))
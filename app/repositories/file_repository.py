@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+from typing import List
+
+from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.file import File
@@ -28,10 +30,27 @@ class FileRepository:
         """파일 메타데이터 생성"""
         self._session.add(file)
         await self._session.flush()
-        await self._session.refresh(file)
         return file
 
     async def delete(self, file: File) -> None:
         """파일 메타데이터 삭제"""
         await self._session.delete(file)
         await self._session.flush()
+
+    async def delete_by_ids(self, file_ids: List[int]) -> List[str]:
+        """파일 메타데이터 일괄 삭제
+
+        Returns:
+            삭제된 파일의 저장 경로 목록 (스토리지 정리용)
+        """
+        if not file_ids:
+            return []
+
+        stmt = (
+            delete(File)
+            .where(File.id.in_(file_ids))
+            .returning(File.storage_path)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+from sqlalchemy import Select, func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Load, joinedload
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.models.user import User
+
+
+def get_dialect_name(session: AsyncSession) -> str:
+    """세션에 바인딩된 DB 방언 이름 (postgresql / sqlite)"""
+    return session.get_bind().dialect.name
+
+
+def dialect_insert(session: AsyncSession):
+    """ON CONFLICT(upsert)를 지원하는 방언별 insert 생성자"""
+    if get_dialect_name(session) == "postgresql":
+        return pg_insert
+    return sqlite_insert
+
+
+def scalar_least_greatest(session: AsyncSession) -> Tuple[Any, Any]:
+    """
+    NULL을 무시하는 2-인자 최소/최대 함수
+
+    - PostgreSQL: least / greatest (NULL 무시)
+    - SQLite: 스칼라 min / max (NULL이면 NULL → 호출 측에서 coalesce)
+    """
+    if get_dialect_name(session) == "postgresql":
+        return func.least, func.greatest
+    return func.min, func.max
+
+
+# === 관계 로딩 프로필 ===
+
+
+class LoadProfile(str, Enum):
+    """
+    조회 시 관계 로딩 프로필 (모델은 eager loading 없음)
+
+    - LEAN: 컬럼만 (배치, 존재/권한 확인, 상태 변경, 삭제)
+    - LIST: 목록 응답에 필요한 표시용 관계 (업체명/광고주명)
+    - DETAIL: 상세/단건 응답에 필요한 관계
+    """
+
+    LEAN = "lean"
+    LIST = "list"
+    DETAIL = "detail"
+
+
+def company_name_loader(relationship, profile_model) -> Load:
+    """
+    업체/광고주 관계의 회사명만 로딩 (agency.id = user.id, advertiser.id = user.id)
+
+    Args:
+        relationship: 엔티티의 agency/advertiser 관계 속성
+        profile_model: Agency 또는 Advertiser 모델
+    """
+    return (
+        joinedload(relationship)
+        .load_only(profile_model.id)
+        .joinedload(profile_model.user)
+        .load_only(User.id, User.company_name)
+    )
+
+
+# === 목록 전체 개수 (total) ===
+
+
+class ListTotalCache:
+    """
+    목록 전체 개수 캐시 (테이블 네임스페이스 + 필터 시그니처 단위)
+
+    - 짧은 TTL로 여러 API 레플리카 간 불일치 범위 제한
+    - 같은 프로세스의 쓰기는 네임스페이스 단위로 즉시 무효화
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._caches: Dict[str, TTLCache[Hashable, int]] = {}
+
+    def _cache(self, namespace: str) -> TTLCache[Hashable, int]:
+        cache = self._caches.get(namespace)
+        if cache is None:
+            cache = TTLCache(maxsize=self._maxsize, ttl=self._ttl)
+            self._caches[namespace] = cache
+        return cache
+
+    def get(self, namespace: str, signature: Hashable) -> Optional[int]:
+        """캐시된 전체 개수 조회"""
+        return self._cache(namespace).get(signature)
+
+    def set(self, namespace: str, signature: Hashable, total: int) -> None:
+        """전체 개수 저장"""
+        self._cache(namespace).set(signature, total)
+
+    def invalidate(self, namespace: str) -> None:
+        """네임스페이스(테이블) 단위 무효화"""
+        cache = self._caches.get(namespace)
+        if cache is not None:
+            cache.clear()
+
+
+_list_total_cache: ListTotalCache | None = None
+
+
+def get_list_total_cache() -> ListTotalCache:
+    """ListTotalCache 싱글턴"""
+    global _list_total_cache
+
+    if _list_total_cache is None:
+        settings = get_settings()
+        _list_total_cache = ListTotalCache(
+            maxsize=settings.LIST_TOTAL_CACHE_MAX_ENTRIES,
+            ttl=settings.LIST_TOTAL_CACHE_TTL_SECONDS,
+        )
+    return _list_total_cache
+
+
+def invalidate_list_totals(namespace: str) -> None:
+    """쓰기 후 해당 테이블의 전체 개수 캐시 무효화"""
+    get_list_total_cache().invalidate(namespace)
+
+
+async def fetch_page_with_total(
+    session: AsyncSession,
+    stmt: Select,
+    skip: int,
+    limit: int,
+    namespace: str,
+    signature: Hashable,
+    count_fallback: Callable[[], Awaitable[int]],
+) -> Tuple[List[Any], int]:
+    """
+    페이지 조회 + 전체 개수를 한 번의 왕복으로 조회
+
+    - 캐시된 전체 개수가 있으면 목록만 조회
+    - 없으면 COUNT(*) OVER () 윈도 함수로 같은 쿼리에서 전체 개수 계산
+    - 범위를 벗어난 페이지(결과 없음)만 별도 count 쿼리로 보정
+
+    Args:
+        session: DB 세션
+        stmt: 필터/정렬이 적용된 엔티티 select (offset/limit 제외)
+        skip: 건너뛸 개수
+        limit: 가져올 개수
+        namespace: 캐시 네임스페이스 (테이블명)
+        signature: 필터 시그니처 (캐시 키)
+        count_fallback: 별도 count 쿼리
+
+    Returns:
+        (엔티티 목록, 전체 개수)
+    """
+    cache = get_list_total_cache()
+    cached_total = cache.get(namespace, signature)
+
+    if cached_total is not None:
+        result = await session.execute(stmt.offset(skip).limit(limit))
+        return list(result.scalars().all()), cached_total
+
+    windowed = stmt.add_columns(func.count().over().label("total"))
+    result = await session.execute(windowed.offset(skip).limit(limit))
+    rows = result.all()
+
+    if rows:
+        total = rows[0].total
+    elif skip == 0:
+        total = 0
+    else:
+        total = await count_fallback()
+
+    cache.set(namespace, signature, total)
+    return [row[0] for row in rows], total
+
+
+async def estimate_table_count(
+    session: AsyncSession,
+    table_name: str,
+    exact_count: Callable[[], Awaitable[int]],
+) -> int:
+    """
+    테이블 전체 행 수 추정 (필터 없는 관리자 목록용)
+
+    - PostgreSQL: pg_class.reltuples (통계 기반, 스캔 없음)
+    - 통계가 없거나 다른 DB: 정확한 count로 대체
+    """
+    if get_dialect_name(session) == "postgresql":
+        result = await session.execute(
+            text(
+                "SELECT reltuples::bigint FROM pg_class "
+                "WHERE oid = to_regclass(:table_name)"
+            ),
+            {"table_name": table_name},
+        )
+        estimate = result.scalar_one_or_none()
+        if estimate is not None and estimate >= 0:
+            return int(estimate)
+
+    return await exact_count()
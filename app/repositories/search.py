@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+from sqlalchemy import ColumnElement, column, literal, literal_column, select, table, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.database.search_index import fts_table_name
+from app.models.user import User
+from app.repositories.helpers import get_dialect_name
+
+# SQLite FTS5 trigram 토크나이저는 3글자 이상만 인덱스로 매칭 가능
+FTS_TRIGRAM_MIN_LENGTH = 3
+
+
+def _fts_phrase(keyword: str) -> str:
+    """FTS5 MATCH용 구문(phrase) 쿼리 (따옴표 이스케이프)"""
+    return '"' + keyword.replace('"', '""') + '"'
+
+
+def _fts_rowids(table_name: str, keyword: str):
+    """FTS5 섀도 테이블에서 매칭되는 rowid 서브쿼리"""
+    fts_name = fts_table_name(table_name)
+    fts = table(fts_name, column("rowid"))
+    return select(fts.c.rowid).where(
+        literal_column(fts_name).op("MATCH")(literal(_fts_phrase(keyword)))
+    )
+
+
+def keyword_search_clause(
+    session: AsyncSession,
+    model,
+    keyword: str,
+    text_columns: Sequence[InstrumentedAttribute],
+    user_id_columns: Sequence[InstrumentedAttribute],
+) -> ColumnElement[bool]:
+    """
+    목록 키워드 검색 조건 (인덱스 기반)
+
+    - 대상: text_columns (키워드, URL) + user_id_columns가 가리키는 User.company_name
+    - 조건마다 인덱스를 타는 id 서브쿼리를 만들어 UNION ALL → model.id IN (...)
+      (OR + IN 서브쿼리 혼합은 BitmapOr로 합쳐지지 않아 순차 스캔으로 떨어짐)
+    - PostgreSQL: pg_trgm GIN 인덱스가 ILIKE '%term%'을 처리
+    - SQLite: FTS5 trigram 섀도 테이블 MATCH (3글자 미만은 LIKE로 대체)
+
+    Args:
+        session: DB 세션 (방언 판별용)
+        model: 검색 대상 모델 (id 컬럼 필요)
+        keyword: 검색어
+        text_columns: 모델의 텍스트 검색 컬럼
+        user_id_columns: 회사명 검색 대상 사용자 ID 컬럼 (agency_id, advertiser_id)
+    """
+    if (
+        get_dialect_name(session) == "sqlite"
+        and len(keyword) >= FTS_TRIGRAM_MIN_LENGTH
+    ):
+        text_ids = [_fts_rowids(model.__tablename__, keyword)]
+        company_user_ids = _fts_rowids(User.__tablename__, keyword)
+    else:
+        search_term = f"%{keyword}%"
+        text_ids = [select(model.id).where(col.ilike(search_term)) for col in text_columns]
+        company_user_ids = select(User.id).where(User.company_name.ilike(search_term))
+
+    # 회사명 매칭: users에서 찾은 id → agency_id / advertiser_id 인덱스로 역조회
+    company_ids = [
+        select(model.id).where(col.in_(company_user_ids)) for col in user_id_columns
+    ]
+    return model.id.in_(union_all(*text_ids, *company_ids))
@@ -1,7 +1,19 @@
+from app.repositories.tracking.rank_history_partition_repository import (
+    RankHistoryPartitionRepository,
+)
 from app.repositories.tracking.rank_history_repository import RankHistoryRepository
+from app.repositories.tracking.rank_history_rollup_repository import (
+    RankHistoryRollupRepository,
+)
 from app.repositories.tracking.rank_tracking_repository import RankTrackingRepository
+from app.repositories.tracking.tracking_session_summary_repository import (
+    TrackingSessionSummaryRepository,
+)
 
 __all__ = [
     "RankTrackingRepository",
     "RankHistoryRepository",
+    "RankHistoryRollupRepository",
+    "RankHistoryPartitionRepository",
+    "TrackingSessionSummaryRepository",
 ]
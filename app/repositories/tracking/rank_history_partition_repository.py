@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import re
+from datetime import date
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tracking import RankHistory
+
+# 월 파티션 이름 규칙: rank_histories_YYYYMM
+_PARTITION_NAME = re.compile(rf"^{RankHistory.__tablename__}_(\d{{4}})(\d{{2}})$")
+
+
+def partition_name(month_start: date) -> str:
+    """월 파티션 이름"""
+    return f"{RankHistory.__tablename__}_{month_start:%Y%m}"
+
+
+def default_partition_name() -> str:
+    """DEFAULT 파티션 이름 (sql/app-ddl.sql)"""
+    return f"{RankHistory.__tablename__}_default"
+
+
+def _bound(month_start: date) -> str:
+    """KST 월 경계 (파티션 범위 리터럴)"""
+    return f"{month_start.isoformat()} 00:00:00+09"
+
+
+def next_month(month_start: date) -> date:
+    """다음 달 1일"""
+    if month_start.month == 12:
+        return date(month_start.year + 1, 1, 1)
+    return date(month_start.year, month_start.month + 1, 1)
+
+
+class RankHistoryPartitionRepository:
+    """
+    rank_histories 월 파티션 관리 (PostgreSQL 전용)
+
+    - 파티션 경계는 KST 월 단위 (checked_at 범위 파티셔닝, sql/app-ddl.sql 참고)
+    - 파티셔닝되지 않은 테이블(SQLite, create_all로 만든 개발 DB)에서는 사용하지 않음
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def is_partitioned(self) -> bool:
+        """rank_histories가 파티션 테이블인지 여부"""
+        result = await self._session.execute(
+            text(
+                "SELECT 1 FROM pg_partitioned_table "
+                "WHERE partrelid = to_regclass(:table_name)"
+            ),
+            {"table_name": RankHistory.__tablename__},
+        )
+        return result.first() is not None
+
+    async def get_month_partitions(self) -> List[date]:
+        """연결된 월 파티션 목록 (월 시작일, 오름차순, DEFAULT 파티션 제외)"""
+        result = await self._session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = to_regclass(:table_name)"
+            ),
+            {"table_name": RankHistory.__tablename__},
+        )
+        months = []
+        for (name,) in result.all():
+            match = _PARTITION_NAME.match(name)
+            if match:
+                months.append(date(int(match.group(1)), int(match.group(2)), 1))
+        return sorted(months)
+
+    async def create_month_partition(self, month_start: date) -> int:
+        """
+        월 파티션 생성 (이미 있으면 무시)
+
+        - DEFAULT 파티션에 해당 월 행이 이미 있으면 PostgreSQL이 생성을 거부하므로
+          DEFAULT 분리 → 월 파티션 생성 → 해당 월 행 이동 → DEFAULT 재연결
+        - 호출자가 같은 트랜잭션에서 커밋/롤백
+
+        Returns:
+            int: DEFAULT 파티션에서 옮긴 행 수
+        """
+        table_name = RankHistory.__tablename__
+        name = partition_name(month_start)
+        lower, upper = _bound(month_start), _bound(next_month(month_start))
+        create_sql = text(
+            f"CREATE TABLE IF NOT EXISTS {name} "
+            f"PARTITION OF {table_name} "
+            f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+        )
+
+        if not await self._default_has_rows(lower, upper):
+            await self._session.execute(create_sql)
+            return 0
+
+        default_name = default_partition_name()
+        columns = ", ".join(column.name for column in RankHistory.__table__.columns)
+        range_filter = "checked_at >= CAST(:lower AS timestamptz) AND checked_at < CAST(:upper AS timestamptz)"
+        bounds = {"lower": lower, "upper": upper}
+
+        await self._session.execute(
+            text(f"ALTER TABLE {table_name} DETACH PARTITION {default_name}")
+        )
+        await self._session.execute(create_sql)
+        await self._session.execute(
+            text(
+                f"INSERT INTO {name} ({columns}) "
+                f"SELECT {columns} FROM {default_name} WHERE {range_filter}"
+            ),
+            bounds,
+        )
+        moved = await self._session.execute(
+            text(f"DELETE FROM {default_name} WHERE {range_filter}"),
+            bounds,
+        )
+        await self._session.execute(
+            text(f"ALTER TABLE {table_name} ATTACH PARTITION {default_name} DEFAULT")
+        )
+        return moved.rowcount or 0
+
+    async def _default_has_rows(self, lower: str, upper: str) -> bool:
+        """DEFAULT 파티션에 [lower, upper) 범위 행이 있는지 여부"""
+        default_name = default_partition_name()
+        exists = await self._session.execute(
+            text("SELECT to_regclass(:name) IS NOT NULL"),
+            {"name": default_name},
+        )
+        if not exists.scalar():
+            return False
+
+        result = await self._session.execute(
+            text(
+                f"SELECT 1 FROM {default_name} "
+                "WHERE checked_at >= CAST(:lower AS timestamptz) "
+                "AND checked_at < CAST(:upper AS timestamptz) LIMIT 1"
+            ),
+            {"lower": lower, "upper": upper},
+        )
+        return result.first() is not None
+
+    async def drop_month_partition(self, month_start: date) -> None:
+        """월 파티션 분리 후 삭제"""
+        name = partition_name(month_start)
+        await self._session.execute(
+            text(f"ALTER TABLE {RankHistory.__tablename__} DETACH PARTITION {name}")
+        )
+        await self._session.execute(text(f"DROP TABLE {name}"))
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import Select, and_, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.timezone import today_kst
+from app.core.config import get_settings
+from app.core.timezone import kst_day_start_utc, now_utc, today_kst
 from app.models.tracking import RankHistory
 
 
@@ -26,20 +27,20 @@ class RankHistoryRepository:
         """히스토리 생성"""
         self._session.add(history)
         await self._session.flush()
-        await self._session.refresh(history)
         return history
 
     async def get_today_by_tracking_id(
         self, tracking_id: int, session_number: int
     ) -> Optional[RankHistory]:
         """오늘 날짜의 해당 tracking 히스토리 조회"""
-        today = today_kst()
+        # checked_at 범위 조건 (인덱스/최신 파티션만 탐색)
+        today_start = kst_day_start_utc(today_kst())
         result = await self._session.execute(
             select(RankHistory).where(
                 and_(
                     RankHistory.tracking_id == tracking_id,
                     RankHistory.session_number == session_number,
-                    func.date(RankHistory.checked_at) == today,
+                    RankHistory.checked_at >= today_start,
                 )
             )
         )
@@ -62,16 +63,126 @@ class RankHistoryRepository:
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
-    async def get_all_by_tracking_id(self, tracking_id: int) -> List[RankHistory]:
-        """추적 ID로 히스토리 전체 조회 (최신순)"""
-        stmt = (
-            select(RankHistory)
-            .where(RankHistory.tracking_id == tracking_id)
-            .order_by(RankHistory.checked_at.desc())
+    def _apply_range_filters(
+        self,
+        stmt: Select,
+        tracking_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        session_number: Optional[int] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> Select:
+        """상세 조회 공통 필터 (기간은 KST 날짜 기준, end_date 포함)"""
+        stmt = stmt.where(RankHistory.tracking_id == tracking_id)
+
+        if start_date:
+            stmt = stmt.where(RankHistory.checked_at >= kst_day_start_utc(start_date))
+
+        if end_date:
+            stmt = stmt.where(
+                RankHistory.checked_at < kst_day_start_utc(end_date + timedelta(days=1))
+            )
+
+        if session_number:
+            stmt = stmt.where(RankHistory.session_number == session_number)
+
+        if updated_since:
+            # delta sync: 커서 이후 생성/갱신된 히스토리만
+            stmt = stmt.where(RankHistory.updated_at >= updated_since)
+
+        return stmt
+
+    async def get_filtered_by_tracking_id(
+        self,
+        tracking_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        session_number: Optional[int] = None,
+        updated_since: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100,
+    ) -> List[RankHistory]:
+        """
+        추적 ID로 히스토리 조회 (기간/회차 필터, 최신순, 페이징)
+
+        Args:
+            tracking_id: 추적 ID
+            start_date: 시작 날짜 (KST, 포함)
+            end_date: 종료 날짜 (KST, 포함)
+            session_number: 회차 번호
+            updated_since: 이 시각 이후 생성/갱신된 것만 (delta sync)
+            skip: 건너뛸 개수
+            limit: 가져올 개수
+        """
+        stmt = self._apply_range_filters(
+            select(RankHistory),
+            tracking_id,
+            start_date=start_date,
+            end_date=end_date,
+            session_number=session_number,
+            updated_since=updated_since,
         )
+        stmt = stmt.order_by(RankHistory.checked_at.desc()).offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
 
+    async def count_filtered_by_tracking_id(
+        self,
+        tracking_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        session_number: Optional[int] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> int:
+        """추적 ID로 히스토리 개수 조회 (기간/회차/변경 시각 필터)"""
+        stmt = self._apply_range_filters(
+            select(func.count(RankHistory.id)),
+            tracking_id,
+            start_date=start_date,
+            end_date=end_date,
+            session_number=session_number,
+            updated_since=updated_since,
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
+
+    async def get_session_summaries(
+        self,
+        tracking_id: int,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        session_number: Optional[int] = None,
+    ) -> List[Dict]:
+        """
+        회차별 집계 (SQL GROUP BY, 최신 회차순)
+
+        Returns:
+            회차별 dict (session_number, check_count, exposure_count,
+            best_rank, worst_rank, avg_rank, first_checked_at, last_checked_at)
+        """
+        stmt = select(
+            RankHistory.session_number.label("session_number"),
+            func.count(RankHistory.id).label("check_count"),
+            func.count(RankHistory.rank).label("exposure_count"),
+            func.min(RankHistory.rank).label("best_rank"),
+            func.max(RankHistory.rank).label("worst_rank"),
+            func.avg(RankHistory.rank).label("avg_rank"),
+            func.min(RankHistory.checked_at).label("first_checked_at"),
+            func.max(RankHistory.checked_at).label("last_checked_at"),
+        )
+        stmt = self._apply_range_filters(
+            stmt,
+            tracking_id,
+            start_date=start_date,
+            end_date=end_date,
+            session_number=session_number,
+        )
+        stmt = stmt.group_by(RankHistory.session_number).order_by(
+            RankHistory.session_number.desc()
+        )
+        result = await self._session.execute(stmt)
+        return [dict(row) for row in result.mappings().all()]
+
     async def count_by_tracking_id(self, tracking_id: int) -> int:
         """추적 ID로 히스토리 개수 조회"""
         stmt = select(func.count(RankHistory.id)).where(
@@ -110,16 +221,30 @@ class RankHistoryRepository:
         if not tracking_ids:
             return {}
 
+        # 최근 기간만 먼저 탐색 (최신 파티션), 없는 추적만 전체 기간으로 재조회
+        since = now_utc() - timedelta(days=get_settings().LATEST_RANK_WINDOW_DAYS)
+        latest = await self._get_latest_since(tracking_ids, since)
+
+        missing_ids = [tid for tid in tracking_ids if tid not in latest]
+        if missing_ids:
+            latest.update(await self._get_latest_since(missing_ids, None))
+
+        return latest
+
+    async def _get_latest_since(
+        self,
+        tracking_ids: List[int],
+        since: Optional[datetime],
+    ) -> Dict[int, RankHistory]:
+        """since 이후 tracking_id별 최신 히스토리 (since=None이면 전체 기간)"""
         # Subquery: tracking_id별 최신 checked_at
-        subq = (
-            select(
-                RankHistory.tracking_id,
-                func.max(RankHistory.checked_at).label("max_checked_at"),
-            )
-            .where(RankHistory.tracking_id.in_(tracking_ids))
-            .group_by(RankHistory.tracking_id)
-            .subquery()
-        )
+        subq = select(
+            RankHistory.tracking_id,
+            func.max(RankHistory.checked_at).label("max_checked_at"),
+        ).where(RankHistory.tracking_id.in_(tracking_ids))
+        if since is not None:
+            subq = subq.where(RankHistory.checked_at >= since)
+        subq = subq.group_by(RankHistory.tracking_id).subquery()
 
         # Main query: 서브쿼리와 조인하여 실제 RankHistory 조회
         stmt = select(RankHistory).join(
@@ -129,27 +254,14 @@ class RankHistoryRepository:
                 RankHistory.checked_at == subq.c.max_checked_at,
             ),
         )
+        if since is not None:
+            stmt = stmt.where(RankHistory.checked_at >= since)
 
         result = await self._session.execute(stmt)
         histories = result.scalars().all()
 
         return {h.tracking_id: h for h in histories}
 
-    async def count_exposures_in_session(
-        self,
-        tracking_id: int,
-        session_number: int,
-    ) -> int:
-        """특정 회차의 노출 횟수 (rank가 null이 아닌 경우)"""
-        stmt = (
-            select(func.count(RankHistory.id))
-            .where(RankHistory.tracking_id == tracking_id)
-            .where(RankHistory.session_number == session_number)
-            .where(RankHistory.rank.isnot(None))
-        )
-        result = await self._session.execute(stmt)
-        return result.scalar_one()
-
     async def get_by_session_number(
         self,
         tracking_id: int,
@@ -181,3 +293,20 @@ class RankHistoryRepository:
         )
         result = await self._session.execute(stmt)
         return list(result.scalars().all())
+
+    async def delete_before(self, cutoff: datetime) -> int:
+        """cutoff 이전 히스토리 삭제 (파티션이 없는 DB의 보존 정책용)"""
+        result = await self._session.execute(
+            delete(RankHistory).where(RankHistory.checked_at < cutoff)
+        )
+        return result.rowcount or 0
+
+    async def delete_by_tracking_ids(self, tracking_ids: Select | List[int]) -> int:
+        """추적 ID 목록(또는 서브쿼리)에 해당하는 히스토리 일괄 삭제"""
+        stmt = (
+            delete(RankHistory)
+            .where(RankHistory.tracking_id.in_(tracking_ids))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
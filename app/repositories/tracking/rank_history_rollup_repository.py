@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import Select, delete, func, literal_column, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tracking import RankHistory, RankHistoryRollup
+from app.repositories.helpers import (
+    dialect_insert,
+    get_dialect_name,
+    scalar_least_greatest,
+)
+
+
+class RankHistoryRollupRepository:
+    """순위 히스토리 주간 집계 저장소"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    def _week_start(self):
+        """checked_at → KST 기준 주 시작일(월요일)"""
+        # GROUP BY에 같은 식이 반복되므로 상수는 바인드 파라미터 대신 리터럴로 렌더링
+        if get_dialect_name(self._session) == "postgresql":
+            return func.date_trunc(
+                literal_column("'week'"),
+                func.timezone(literal_column("'Asia/Seoul'"), RankHistory.checked_at),
+            ).cast(RankHistoryRollup.period_start.type)
+        # SQLite: UTC 문자열 → KST → 다음 일요일(당일 포함) - 6일 = 월요일
+        return func.date(
+            RankHistory.checked_at,
+            literal_column("'+9 hours'"),
+            literal_column("'weekday 0'"),
+            literal_column("'-6 days'"),
+        )
+
+    async def rollup_range(
+        self,
+        start: Optional[datetime],
+        end: datetime,
+    ) -> int:
+        """
+        [start, end) 구간의 히스토리를 (추적, 회차, 주) 단위로 집계 저장
+
+        - 같은 주가 두 파티션에 걸칠 수 있으므로 기존 집계에 누적(upsert)
+        - 같은 구간을 두 번 집계하지 않도록 호출 측에서 원본 삭제와 같은 트랜잭션으로 실행
+
+        Returns:
+            집계 행 수
+        """
+        week_start = self._week_start().label("period_start")
+        source = select(
+            RankHistory.tracking_id,
+            RankHistory.session_number,
+            week_start,
+            func.count(RankHistory.id),
+            func.count(RankHistory.rank),
+            func.min(RankHistory.rank),
+            func.max(RankHistory.rank),
+            func.coalesce(func.sum(RankHistory.rank), 0),
+        ).where(RankHistory.checked_at < end)
+        if start is not None:
+            source = source.where(RankHistory.checked_at >= start)
+        source = source.group_by(
+            RankHistory.tracking_id, RankHistory.session_number, week_start
+        )
+
+        least, greatest = scalar_least_greatest(self._session)
+        stmt = dialect_insert(self._session)(RankHistoryRollup).from_select(
+            [
+                "tracking_id",
+                "session_number",
+                "period_start",
+                "check_count",
+                "exposure_count",
+                "best_rank",
+                "worst_rank",
+                "rank_sum",
+            ],
+            source,
+        )
+        current = RankHistoryRollup.__table__.c
+        added = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tracking_id", "session_number", "period_start"],
+            set_={
+                "check_count": current.check_count + added.check_count,
+                "exposure_count": current.exposure_count + added.exposure_count,
+                "best_rank": func.coalesce(
+                    least(current.best_rank, added.best_rank),
+                    current.best_rank,
+                    added.best_rank,
+                ),
+                "worst_rank": func.coalesce(
+                    greatest(current.worst_rank, added.worst_rank),
+                    current.worst_rank,
+                    added.worst_rank,
+                ),
+                "rank_sum": current.rank_sum + added.rank_sum,
+            },
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
+    async def delete_by_tracking_ids(self, tracking_ids: Select | List[int]) -> int:
+        """추적 ID 목록(또는 서브쿼리)에 해당하는 주간 집계 일괄 삭제"""
+        stmt = (
+            delete(RankHistoryRollup)
+            .where(RankHistoryRollup.tracking_id.in_(tracking_ids))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
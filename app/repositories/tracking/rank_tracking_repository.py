@@ -1,15 +1,28 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import List, Optional, Tuple
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Row, Select, and_, delete, func, or_, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased, joinedload
 
 from app.models.advertiser import Advertiser
 from app.models.agency import Agency
-from app.models.tracking import RankTracking, RankType, TrackingStatus
+from app.models.tracking import (
+    RankTracking,
+    RankType,
+    TrackingSessionSummary,
+    TrackingStatus,
+)
 from app.models.user import User
+from app.repositories.helpers import (
+    LoadProfile,
+    company_name_loader,
+    fetch_page_with_total,
+    invalidate_list_totals,
+)
+from app.repositories.search import keyword_search_clause
 
 
 class RankTrackingRepository:
@@ -18,14 +31,24 @@ class RankTrackingRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_by_id(self, tracking_id: int) -> RankTracking | None:
+    def _loader_options(self, profile: LoadProfile) -> list:
+        """로딩 프로필별 관계 옵션 (목록/상세 모두 업체명·광고주명만 사용)"""
+        if profile == LoadProfile.LEAN:
+            return []
+        return [
+            company_name_loader(RankTracking.agency, Agency),
+            company_name_loader(RankTracking.advertiser, Advertiser),
+        ]
+
+    async def get_by_id(
+        self,
+        tracking_id: int,
+        profile: LoadProfile = LoadProfile.DETAIL,
+    ) -> RankTracking | None:
         """ID로 추적 조회"""
         stmt = (
             select(RankTracking)
-            .options(
-                joinedload(RankTracking.agency).joinedload(Agency.user),
-                joinedload(RankTracking.advertiser).joinedload(Advertiser.user),
-            )
+            .options(*self._loader_options(profile))
             .where(RankTracking.id == tracking_id)
         )
         result = await self._session.execute(stmt)
@@ -40,8 +63,7 @@ class RankTrackingRepository:
         stmt = (
             select(RankTracking)
             .options(
-                joinedload(RankTracking.agency).joinedload(Agency.user),
-                joinedload(RankTracking.advertiser).joinedload(Advertiser.user),
+                *self._loader_options(LoadProfile.DETAIL),
                 joinedload(RankTracking.histories),
             )
             .where(RankTracking.id == tracking_id)
@@ -53,15 +75,74 @@ class RankTrackingRepository:
         """추적 생성"""
         self._session.add(tracking)
         await self._session.flush()
-        await self._session.refresh(tracking)
+        invalidate_list_totals(RankTracking.__tablename__)
         return tracking
 
     async def update(self, tracking: RankTracking) -> RankTracking:
         """추적 업데이트"""
         await self._session.flush()
-        await self._session.refresh(tracking)
+        invalidate_list_totals(RankTracking.__tablename__)
         return tracking
 
+    def _apply_filters(
+        self,
+        stmt: Select,
+        rank_type: RankType,
+        status: Optional[TrackingStatus] = None,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+        keyword: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> Select:
+        """목록/개수 조회 공통 필터 적용"""
+        stmt = stmt.where(RankTracking.type == rank_type)
+
+        if status:
+            stmt = stmt.where(RankTracking.status == status)
+
+        if agency_id:
+            stmt = stmt.where(RankTracking.agency_id == agency_id)
+
+        if advertiser_id:
+            stmt = stmt.where(RankTracking.advertiser_id == advertiser_id)
+
+        if keyword:
+            # 검색어로 키워드, URL, 광고주명, 업체명 검색 (인덱스 기반, join 없음)
+            stmt = stmt.where(
+                keyword_search_clause(
+                    self._session,
+                    RankTracking,
+                    keyword,
+                    text_columns=(RankTracking.keyword, RankTracking.url),
+                    user_id_columns=(RankTracking.agency_id, RankTracking.advertiser_id),
+                )
+            )
+
+        if updated_since:
+            # delta sync: 추적 자체 변경(상태/회차) 또는 커서 이후 새 순위가 기록된 추적
+            stmt = stmt.where(
+                or_(
+                    RankTracking.updated_at >= updated_since,
+                    RankTracking.id.in_(
+                        select(TrackingSessionSummary.tracking_id).where(
+                            TrackingSessionSummary.updated_at >= updated_since
+                        )
+                    ),
+                )
+            )
+
+        return stmt
+
+    def _list_stmt(
+        self,
+        profile: LoadProfile = LoadProfile.LIST,
+        **filters,
+    ) -> Select:
+        """목록 조회 쿼리 (정렬 포함, 페이징 제외)"""
+        stmt = select(RankTracking).options(*self._loader_options(profile))
+        stmt = self._apply_filters(stmt, **filters)
+        return stmt.order_by(RankTracking.created_at.desc())
+
     async def get_list(
         self,
         rank_type: RankType,
@@ -71,6 +152,7 @@ class RankTrackingRepository:
         keyword: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        profile: LoadProfile = LoadProfile.LIST,
     ) -> List[RankTracking]:
         """
         추적 목록 조회
@@ -83,50 +165,58 @@ class RankTrackingRepository:
             keyword: 검색어 (키워드, URL, 광고주명, 업체명으로 검색)
             skip: 건너뛸 개수
             limit: 가져올 개수
+            profile: 관계 로딩 프로필
         """
-        stmt = (
-            select(RankTracking)
-            .options(
-                joinedload(RankTracking.agency).joinedload(Agency.user),
-                joinedload(RankTracking.advertiser).joinedload(Advertiser.user),
-            )
-            .where(RankTracking.type == rank_type)
+        stmt = self._list_stmt(
+            profile,
+            rank_type=rank_type,
+            status=status,
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
         )
+        stmt = stmt.offset(skip).limit(limit)
+        result = await self._session.execute(stmt)
+        return list(result.unique().scalars().all())
 
-        if status:
-            stmt = stmt.where(RankTracking.status == status)
-
-        if agency_id:
-            stmt = stmt.where(RankTracking.agency_id == agency_id)
-
-        if advertiser_id:
-            stmt = stmt.where(RankTracking.advertiser_id == advertiser_id)
+    async def get_list_with_total(
+        self,
+        rank_type: RankType,
+        status: Optional[TrackingStatus] = None,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+        keyword: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
+        skip: int = 0,
+        limit: int = 100,
+        profile: LoadProfile = LoadProfile.LIST,
+    ) -> Tuple[List[RankTracking], int]:
+        """
+        추적 목록 + 전체 개수 조회 (단일 왕복)
 
-        if keyword:
-            # 검색어로 키워드, URL, 광고주명, 업체명 검색
-            # Note: agency.id = user.id, advertiser.id = user.id
-            AgencyUser = aliased(User)
-            AdvertiserUser = aliased(User)
-            search_term = f"%{keyword}%"
-
-            stmt = (
-                stmt.outerjoin(Agency, RankTracking.agency_id == Agency.id)
-                .outerjoin(AgencyUser, Agency.id == AgencyUser.id)  # agency.id = user.id
-                .outerjoin(Advertiser, RankTracking.advertiser_id == Advertiser.id)
-                .outerjoin(AdvertiserUser, Advertiser.id == AdvertiserUser.id)  # advertiser.id = user.id
-                .where(
-                    or_(
-                        RankTracking.keyword.ilike(search_term),
-                        RankTracking.url.ilike(search_term),
-                        AgencyUser.company_name.ilike(search_term),
-                        AdvertiserUser.company_name.ilike(search_term),
-                    )
-                )
-            )
+        Args:
+            updated_since: 이 시각 이후 변경/새 순위 기록된 추적만 (delta sync)
 
-        stmt = stmt.order_by(RankTracking.created_at.desc()).offset(skip).limit(limit)
-        result = await self._session.execute(stmt)
-        return list(result.unique().scalars().all())
+        Returns:
+            (추적 목록, 필터 적용 전체 개수)
+        """
+        filters = dict(
+            rank_type=rank_type,
+            status=status,
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
+            updated_since=updated_since,
+        )
+        return await fetch_page_with_total(
+            self._session,
+            self._list_stmt(profile, **filters),
+            skip=skip,
+            limit=limit,
+            namespace=RankTracking.__tablename__,
+            signature=tuple(filters.values()),
+            count_fallback=lambda: self.count(**filters),
+        )
 
     async def count(
         self,
@@ -135,79 +225,209 @@ class RankTrackingRepository:
         agency_id: Optional[int] = None,
         advertiser_id: Optional[int] = None,
         keyword: Optional[str] = None,
+        updated_since: Optional[datetime] = None,
     ) -> int:
         """추적 개수 조회"""
-        stmt = select(func.count(RankTracking.id)).where(RankTracking.type == rank_type)
+        stmt = self._apply_filters(
+            select(func.count(RankTracking.id)),
+            rank_type=rank_type,
+            status=status,
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
+            updated_since=updated_since,
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one()
 
-        if status:
-            stmt = stmt.where(RankTracking.status == status)
+    # === 조건부 GET 버전 마커 ===
 
-        if agency_id:
-            stmt = stmt.where(RankTracking.agency_id == agency_id)
+    async def get_list_version(
+        self,
+        rank_type: RankType,
+        status: Optional[TrackingStatus] = None,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+        keyword: Optional[str] = None,
+    ) -> Tuple:
+        """
+        목록 버전 마커 (집계 쿼리 한 번, 목록 응답 생성 없이 변경 여부 판단)
 
-        if advertiser_id:
-            stmt = stmt.where(RankTracking.advertiser_id == advertiser_id)
+        - 추적 추가/삭제: 개수, 상태 변경/회차 전환: 변경 카운터 합계
+        - 배치 순위 체크: 현재 회차 요약의 최근 체크 시각
+        - 업체명/광고주명 변경: 참조 사용자의 최대 updated_at
 
-        if keyword:
-            # 검색어로 키워드, URL, 광고주명, 업체명 검색
-            # Note: agency.id = user.id, advertiser.id = user.id
-            AgencyUser = aliased(User)
-            AdvertiserUser = aliased(User)
-            search_term = f"%{keyword}%"
-
-            stmt = (
-                stmt.outerjoin(Agency, RankTracking.agency_id == Agency.id)
-                .outerjoin(AgencyUser, Agency.id == AgencyUser.id)  # agency.id = user.id
-                .outerjoin(Advertiser, RankTracking.advertiser_id == Advertiser.id)
-                .outerjoin(AdvertiserUser, Advertiser.id == AdvertiserUser.id)  # advertiser.id = user.id
-                .where(
-                    or_(
-                        RankTracking.keyword.ilike(search_term),
-                        RankTracking.url.ilike(search_term),
-                        AgencyUser.company_name.ilike(search_term),
-                        AdvertiserUser.company_name.ilike(search_term),
-                    )
-                )
+        Returns:
+            (개수, 변경 카운터 합계, 최근 체크 시각, 업체 사용자 최대 updated_at,
+             광고주 사용자 최대 updated_at)
+        """
+        agency_user = aliased(User)
+        advertiser_user = aliased(User)
+        stmt = (
+            select(
+                func.count(RankTracking.id),
+                func.sum(RankTracking.version),
+                func.max(TrackingSessionSummary.last_checked_at),
+                func.max(agency_user.updated_at),
+                func.max(advertiser_user.updated_at),
             )
+            .outerjoin(
+                TrackingSessionSummary,
+                and_(
+                    TrackingSessionSummary.tracking_id == RankTracking.id,
+                    TrackingSessionSummary.session_number
+                    == RankTracking.current_session,
+                ),
+            )
+            .outerjoin(agency_user, agency_user.id == RankTracking.agency_id)
+            .outerjoin(advertiser_user, advertiser_user.id == RankTracking.advertiser_id)
+        )
+        stmt = self._apply_filters(
+            stmt,
+            rank_type=rank_type,
+            status=status,
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
+        )
+        result = await self._session.execute(stmt)
+        return tuple(result.one())
 
+    async def get_detail_version(self, tracking_id: int) -> Optional[Row]:
+        """
+        상세 버전 마커 (추적 + 회차 요약 + 참조 사용자 집계, 쿼리 한 번)
+
+        Returns:
+            Row(agency_id, advertiser_id, version, last_checked_at, check_count,
+                agency_updated_at, advertiser_updated_at)
+            또는 None (추적 없음)
+        """
+        agency_user = aliased(User)
+        advertiser_user = aliased(User)
+        stmt = (
+            select(
+                RankTracking.agency_id,
+                RankTracking.advertiser_id,
+                RankTracking.version,
+                func.max(TrackingSessionSummary.last_checked_at).label("last_checked_at"),
+                func.sum(TrackingSessionSummary.check_count).label("check_count"),
+                func.max(agency_user.updated_at).label("agency_updated_at"),
+                func.max(advertiser_user.updated_at).label("advertiser_updated_at"),
+            )
+            .outerjoin(
+                TrackingSessionSummary,
+                TrackingSessionSummary.tracking_id == RankTracking.id,
+            )
+            .outerjoin(agency_user, agency_user.id == RankTracking.agency_id)
+            .outerjoin(advertiser_user, advertiser_user.id == RankTracking.advertiser_id)
+            .where(RankTracking.id == tracking_id)
+            .group_by(RankTracking.id)
+        )
+        result = await self._session.execute(stmt)
+        return result.one_or_none()
+
+    async def count_active_by_type(self, rank_type: RankType) -> int:
+        """활성 추적 개수 (배치 로그용)"""
+        stmt = (
+            select(func.count(RankTracking.id))
+            .where(RankTracking.type == rank_type)
+            .where(RankTracking.status == TrackingStatus.ACTIVE)
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
-    async def get_active_trackings_by_type(
+    async def get_active_chunk(
         self,
         rank_type: RankType,
-    ) -> List[RankTracking]:
-        """활성 추적 목록 조회 (배치용)"""
+        after_id: int = 0,
+        limit: int = 500,
+    ) -> List[Row]:
+        """
+        활성 추적 키셋 청크 조회 (배치 전용)
+
+        - id > after_id 인 항목을 id 오름차순으로 limit개 (OFFSET 없이 다음 청크 이어 읽기)
+        - 크롤링에 필요한 컬럼만 조회 (ORM 엔티티/관계 로딩 없음)
+        - 청크마다 짧은 세션에서 호출하므로 크롤링 동안 연결/스냅샷을 잡고 있지 않음
+
+        Returns:
+            List[Row(id, type, keyword, url, current_session)]
+        """
         stmt = (
-            select(RankTracking)
+            select(
+                RankTracking.id,
+                RankTracking.type,
+                RankTracking.keyword,
+                RankTracking.url,
+                RankTracking.current_session,
+            )
             .where(RankTracking.type == rank_type)
             .where(RankTracking.status == TrackingStatus.ACTIVE)
+            .where(RankTracking.id > after_id)
+            .order_by(RankTracking.id)
+            .limit(limit)
         )
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        return list(result.all())
 
-    async def get_all_active_trackings(self) -> List[RankTracking]:
-        """모든 활성 추적 목록 조회 (배치용)"""
-        stmt = select(RankTracking).where(RankTracking.status == TrackingStatus.ACTIVE)
+    async def get_active_ids(self, tracking_ids: List[int]) -> set[int]:
+        """
+        주어진 ID 중 아직 활성 상태인 추적 ID (배치 결과 저장 직전 재확인용)
+
+        - 조회 후 저장 사이에 중단/삭제된 추적을 걸러냄
+        - 행 잠금으로 같은 트랜잭션이 끝날 때까지 중단/삭제와 경합하지 않음 (PostgreSQL)
+        """
+        if not tracking_ids:
+            return set()
+
+        stmt = (
+            select(RankTracking.id)
+            .where(RankTracking.id.in_(tracking_ids))
+            .where(RankTracking.status == TrackingStatus.ACTIVE)
+            .with_for_update()
+        )
         result = await self._session.execute(stmt)
-        return list(result.scalars().all())
+        return set(result.scalars().all())
+
+    async def advance_session(self, tracking_id: int, current_session: int) -> bool:
+        """
+        회차 전환 (current_session + 1, 엔티티 로딩 없이 UPDATE 한 번)
+
+        - current_session이 읽은 값과 같을 때만 갱신 (중복 전환 방지)
+
+        Returns:
+            갱신 여부
+        """
+        stmt = (
+            update(RankTracking)
+            .where(RankTracking.id == tracking_id)
+            .where(RankTracking.current_session == current_session)
+            .values(current_session=RankTracking.current_session + 1)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount == 1
+
+    @staticmethod
+    def owned_ids_stmt(user_id: int) -> Select:
+        """agency_id 또는 advertiser_id가 user_id인 추적 ID 서브쿼리 (하위 테이블 일괄 삭제용)"""
+        return select(RankTracking.id).where(
+            or_(
+                RankTracking.agency_id == user_id,
+                RankTracking.advertiser_id == user_id,
+            )
+        )
 
     async def delete_by_agency_or_advertiser_id(self, user_id: int) -> int:
-        """agency_id 또는 advertiser_id가 user_id인 모든 추적 삭제
+        """agency_id 또는 advertiser_id가 user_id인 모든 추적 삭제 (DELETE 한 번)
 
         Note: CASCADE DELETE 대체용 (애플리케이션 레벨 삭제)
+              히스토리/요약은 호출자가 owned_ids_stmt로 먼저 삭제해야 함
         """
-        stmt = select(RankTracking).where(
+        stmt = delete(RankTracking).where(
             or_(
                 RankTracking.agency_id == user_id,
                 RankTracking.advertiser_id == user_id,
             )
         )
         result = await self._session.execute(stmt)
-        trackings = list(result.scalars().all())
-
-        for tracking in trackings:
-            await self._session.delete(tracking)
-
-        await self._session.flush()
-        return len(trackings)
+        invalidate_list_totals(RankTracking.__tablename__)
+        return result.rowcount or 0
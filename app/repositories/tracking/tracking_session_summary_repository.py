@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from sqlalchemy import Select, delete, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.tracking import RankHistory, RankTracking, TrackingSessionSummary
+from app.repositories.helpers import dialect_insert, scalar_least_greatest
+
+
+class TrackingSessionSummaryRepository:
+    """추적 회차별 요약 저장소"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def record_check(
+        self,
+        tracking_id: int,
+        session_number: int,
+        rank: Optional[int],
+        checked_at: datetime,
+    ) -> int:
+        """
+        새 히스토리 1건을 회차 요약에 누적 (upsert, 단일 왕복)
+
+        - 히스토리는 호출 전에 flush되어 있어야 함
+        - 요약 행이 새로 만들어진 경우 요약 도입 전에 쌓인 히스토리가 있을 수 있으므로
+          해당 회차를 히스토리에서 재계산 (추적·회차당 1회)
+
+        Returns:
+            누적 후 해당 회차 노출 횟수
+        """
+        exposed = 1 if rank is not None else 0
+        stmt = dialect_insert(self._session)(TrackingSessionSummary).values(
+            tracking_id=tracking_id,
+            session_number=session_number,
+            check_count=1,
+            exposure_count=exposed,
+            best_rank=rank,
+            worst_rank=rank,
+            rank_sum=rank or 0,
+            first_checked_at=checked_at,
+            last_checked_at=checked_at,
+        )
+
+        least, greatest = scalar_least_greatest(self._session)
+        current = TrackingSessionSummary.__table__.c
+        added = stmt.excluded
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tracking_id", "session_number"],
+            set_={
+                "check_count": current.check_count + 1,
+                "exposure_count": current.exposure_count + added.exposure_count,
+                "best_rank": func.coalesce(
+                    least(current.best_rank, added.best_rank),
+                    current.best_rank,
+                    added.best_rank,
+                ),
+                "worst_rank": func.coalesce(
+                    greatest(current.worst_rank, added.worst_rank),
+                    current.worst_rank,
+                    added.worst_rank,
+                ),
+                "rank_sum": current.rank_sum + added.rank_sum,
+                "last_checked_at": added.last_checked_at,
+                "updated_at": func.now(),
+            },
+        ).returning(current.exposure_count, current.check_count)
+
+        result = await self._session.execute(stmt)
+        exposure_count, check_count = result.one()
+        if check_count > 1:
+            return exposure_count
+
+        await self.rebuild(tracking_id, session_number)
+        summary = await self.get(tracking_id, session_number)
+        return summary.exposure_count if summary else exposure_count
+
+    async def rebuild(
+        self,
+        tracking_id: Optional[int] = None,
+        session_number: Optional[int] = None,
+    ) -> int:
+        """
+        히스토리에서 회차 요약 재계산 (기존 값 덮어쓰기)
+
+        - 같은 날 재크롤링으로 기존 히스토리 순위가 바뀐 경우 (해당 회차만)
+        - 전체 재구축 스크립트 (tracking_id=None)
+        - 보존 기간이 지나 원본이 삭제된 구간은 반영되지 않음
+
+        Returns:
+            재계산된 회차 수
+        """
+        source = select(
+            RankHistory.tracking_id,
+            RankHistory.session_number,
+            func.count(RankHistory.id),
+            func.count(RankHistory.rank),
+            func.min(RankHistory.rank),
+            func.max(RankHistory.rank),
+            func.coalesce(func.sum(RankHistory.rank), 0),
+            func.min(RankHistory.checked_at),
+            func.max(RankHistory.checked_at),
+        )
+        if tracking_id is not None:
+            source = source.where(RankHistory.tracking_id == tracking_id)
+        if session_number is not None:
+            source = source.where(RankHistory.session_number == session_number)
+        if tracking_id is None and session_number is None:
+            # SQLite INSERT ... SELECT ... ON CONFLICT 구문 모호성 회피
+            source = source.where(RankHistory.tracking_id.isnot(None))
+        source = source.group_by(RankHistory.tracking_id, RankHistory.session_number)
+
+        columns = [
+            "tracking_id",
+            "session_number",
+            "check_count",
+            "exposure_count",
+            "best_rank",
+            "worst_rank",
+            "rank_sum",
+            "first_checked_at",
+            "last_checked_at",
+        ]
+        stmt = dialect_insert(self._session)(TrackingSessionSummary).from_select(
+            columns, source
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["tracking_id", "session_number"],
+            set_={
+                **{name: stmt.excluded[name] for name in columns[2:]},
+                "updated_at": func.now(),
+            },
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
+
+    async def get(
+        self,
+        tracking_id: int,
+        session_number: int,
+    ) -> TrackingSessionSummary | None:
+        """회차 요약 조회 (upsert로 갱신된 값을 반영하도록 항상 DB 값으로 채움)"""
+        stmt = (
+            select(TrackingSessionSummary)
+            .where(
+                TrackingSessionSummary.tracking_id == tracking_id,
+                TrackingSessionSummary.session_number == session_number,
+            )
+            .execution_options(populate_existing=True)
+        )
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def get_by_tracking_id(
+        self,
+        tracking_id: int,
+        session_number: Optional[int] = None,
+    ) -> List[TrackingSessionSummary]:
+        """추적의 회차 요약 목록 (최신 회차순)"""
+        stmt = select(TrackingSessionSummary).where(
+            TrackingSessionSummary.tracking_id == tracking_id
+        )
+        if session_number is not None:
+            stmt = stmt.where(TrackingSessionSummary.session_number == session_number)
+        stmt = stmt.order_by(TrackingSessionSummary.session_number.desc())
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def get_current_by_trackings(
+        self,
+        trackings: List[RankTracking],
+    ) -> Dict[int, TrackingSessionSummary]:
+        """
+        여러 추적의 현재 회차 요약 일괄 조회 (목록 진행률용)
+
+        Returns:
+            Dict[int, TrackingSessionSummary]: tracking_id -> 현재 회차 요약
+        """
+        if not trackings:
+            return {}
+
+        stmt = select(TrackingSessionSummary).where(
+            tuple_(
+                TrackingSessionSummary.tracking_id,
+                TrackingSessionSummary.session_number,
+            ).in_([(t.id, t.current_session) for t in trackings])
+        )
+        result = await self._session.execute(stmt)
+        return {s.tracking_id: s for s in result.scalars().all()}
+
+    async def delete_by_tracking_ids(self, tracking_ids: Select | List[int]) -> int:
+        """추적 ID 목록(또는 서브쿼리)에 해당하는 회차 요약 일괄 삭제"""
+        stmt = (
+            delete(TrackingSessionSummary)
+            .where(TrackingSessionSummary.tracking_id.in_(tracking_ids))
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return result.rowcount or 0
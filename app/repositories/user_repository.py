@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional
 
-from sqlalchemy import func, select
+from sqlalchemy import Row, delete, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -25,7 +25,7 @@ class UserRepository:
         """로그인 ID로 사용자 조회"""
         stmt = (
             select(User)
-            .options(joinedload(User.agency))
+            .options(joinedload(User.agency), joinedload(User.advertiser))
             .where(User.login_id == login_id)
         )
         result = await self._session.execute(stmt)
@@ -37,11 +37,26 @@ class UserRepository:
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
 
+    async def get_profiles(self, user_ids: List[int]) -> List[Row]:
+        """
+        표시용 프로필 일괄 조회 (단일 쿼리)
+
+        Returns:
+            List[Row(id, name, company_name, login_id)]
+        """
+        if not user_ids:
+            return []
+
+        stmt = select(User.id, User.name, User.company_name, User.login_id).where(
+            User.id.in_(user_ids)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.all())
+
     async def create(self, user: User) -> User:
         """사용자 생성"""
         self._session.add(user)
         await self._session.flush()
-        await self._session.refresh(user)
         return user
 
     async def exists_by_login_id(self, login_id: str) -> bool:
@@ -94,5 +109,35 @@ class UserRepository:
     async def update(self, user: User) -> User:
         """사용자 업데이트"""
         await self._session.flush()
-        await self._session.refresh(user)
         return user
+
+    async def set_status_for_pending(
+        self,
+        user_ids: List[int],
+        approval_status: ApprovalStatus,
+    ) -> List[int]:
+        """
+        승인 대기 사용자들의 상태 일괄 변경 (UPDATE ... RETURNING, 단일 문)
+
+        - 대기 상태가 아닌 사용자는 변경하지 않음
+
+        Returns:
+            변경된 사용자 ID 목록
+        """
+        if not user_ids:
+            return []
+
+        stmt = (
+            update(User)
+            .where(User.id.in_(set(user_ids)))
+            .where(User.approval_status == ApprovalStatus.PENDING)
+            .values(approval_status=approval_status)
+            .returning(User.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def delete(self, user_id: int) -> None:
+        """사용자 삭제 (DELETE 한 번, 엔티티 로딩 없음)"""
+        await self._session.execute(delete(User).where(User.id == user_id))
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
 from datetime import date
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Select, delete, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, joinedload
 
 from app.models.advertiser import Advertiser
 from app.models.agency import Agency
-from app.models.user import User
 from app.models.work_records import BlogPosting
+from app.repositories.helpers import (
+    LoadProfile,
+    company_name_loader,
+    estimate_table_count,
+    fetch_page_with_total,
+    invalidate_list_totals,
+)
+from app.repositories.search import keyword_search_clause
 
 
 class BlogPostingRepository:
@@ -19,14 +25,24 @@ class BlogPostingRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_by_id(self, posting_id: int) -> BlogPosting | None:
+    def _loader_options(self, profile: LoadProfile) -> list:
+        """로딩 프로필별 관계 옵션 (목록/상세 모두 업체명·광고주명만 사용)"""
+        if profile == LoadProfile.LEAN:
+            return []
+        return [
+            company_name_loader(BlogPosting.agency, Agency),
+            company_name_loader(BlogPosting.advertiser, Advertiser),
+        ]
+
+    async def get_by_id(
+        self,
+        posting_id: int,
+        profile: LoadProfile = LoadProfile.DETAIL,
+    ) -> BlogPosting | None:
         """ID로 포스팅 조회"""
         stmt = (
             select(BlogPosting)
-            .options(
-                joinedload(BlogPosting.agency).joinedload(Agency.user),
-                joinedload(BlogPosting.advertiser).joinedload(Advertiser.user),
-            )
+            .options(*self._loader_options(profile))
             .where(BlogPosting.id == posting_id)
         )
         result = await self._session.execute(stmt)
@@ -36,19 +52,58 @@ class BlogPostingRepository:
         """포스팅 생성"""
         self._session.add(posting)
         await self._session.flush()
-        await self._session.refresh(posting)
+        invalidate_list_totals(BlogPosting.__tablename__)
         return posting
 
     async def update(self, posting: BlogPosting) -> BlogPosting:
         """포스팅 업데이트"""
         await self._session.flush()
-        await self._session.refresh(posting)
+        invalidate_list_totals(BlogPosting.__tablename__)
         return posting
 
     async def delete(self, posting: BlogPosting) -> None:
         """포스팅 삭제"""
         await self._session.delete(posting)
         await self._session.flush()
+        invalidate_list_totals(BlogPosting.__tablename__)
+
+    def _apply_filters(
+        self,
+        stmt: Select,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+        keyword: Optional[str] = None,
+    ) -> Select:
+        """목록/개수 조회 공통 필터 적용"""
+        if agency_id:
+            stmt = stmt.where(BlogPosting.agency_id == agency_id)
+
+        if advertiser_id:
+            stmt = stmt.where(BlogPosting.advertiser_id == advertiser_id)
+
+        if keyword:
+            # 키워드, URL, 광고주명, 업체명 검색 (인덱스 기반, join 없음)
+            stmt = stmt.where(
+                keyword_search_clause(
+                    self._session,
+                    BlogPosting,
+                    keyword,
+                    text_columns=(BlogPosting.keyword, BlogPosting.url),
+                    user_id_columns=(BlogPosting.agency_id, BlogPosting.advertiser_id),
+                )
+            )
+
+        return stmt
+
+    def _list_stmt(
+        self,
+        profile: LoadProfile = LoadProfile.LIST,
+        **filters,
+    ) -> Select:
+        """목록 조회 쿼리 (정렬 포함, 페이징 제외)"""
+        stmt = select(BlogPosting).options(*self._loader_options(profile))
+        stmt = self._apply_filters(stmt, **filters)
+        return stmt.order_by(BlogPosting.posting_date.desc())
 
     async def get_list(
         self,
@@ -57,6 +112,7 @@ class BlogPostingRepository:
         keyword: Optional[str] = None,
         skip: int = 0,
         limit: int = 100,
+        profile: LoadProfile = LoadProfile.LIST,
     ) -> List[BlogPosting]:
         """
         포스팅 목록 조회
@@ -67,42 +123,48 @@ class BlogPostingRepository:
             keyword: 검색어 (키워드, URL, 광고주명, 업체명으로 검색)
             skip: 건너뛸 개수
             limit: 가져올 개수
+            profile: 관계 로딩 프로필
         """
-        stmt = select(BlogPosting).options(
-            joinedload(BlogPosting.agency).joinedload(Agency.user),
-            joinedload(BlogPosting.advertiser).joinedload(Advertiser.user),
+        stmt = self._list_stmt(
+            profile,
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
         )
-
-        if agency_id:
-            stmt = stmt.where(BlogPosting.agency_id == agency_id)
-
-        if advertiser_id:
-            stmt = stmt.where(BlogPosting.advertiser_id == advertiser_id)
-
-        if keyword:
-            AgencyUser = aliased(User)
-            AdvertiserUser = aliased(User)
-            search_term = f"%{keyword}%"
-
-            stmt = (
-                stmt.outerjoin(Agency, BlogPosting.agency_id == Agency.id)
-                .outerjoin(AgencyUser, Agency.id == AgencyUser.id)
-                .outerjoin(Advertiser, BlogPosting.advertiser_id == Advertiser.id)
-                .outerjoin(AdvertiserUser, Advertiser.id == AdvertiserUser.id)
-                .where(
-                    or_(
-                        BlogPosting.keyword.ilike(search_term),
-                        BlogPosting.url.ilike(search_term),
-                        AgencyUser.company_name.ilike(search_term),
-                        AdvertiserUser.company_name.ilike(search_term),
-                    )
-                )
-            )
-
-        stmt = stmt.order_by(BlogPosting.posting_date.desc()).offset(skip).limit(limit)
+        stmt = stmt.offset(skip).limit(limit)
         result = await self._session.execute(stmt)
         return list(result.unique().scalars().all())
 
+    async def get_list_with_total(
+        self,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+        keyword: Optional[str] = None,
+        skip: int = 0,
+        limit: int = 100,
+        profile: LoadProfile = LoadProfile.LIST,
+    ) -> Tuple[List[BlogPosting], int]:
+        """
+        포스팅 목록 + 전체 개수 조회 (단일 왕복)
+
+        Returns:
+            (포스팅 목록, 필터 적용 전체 개수)
+        """
+        filters = dict(
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
+        )
+        return await fetch_page_with_total(
+            self._session,
+            self._list_stmt(profile, **filters),
+            skip=skip,
+            limit=limit,
+            namespace=BlogPosting.__tablename__,
+            signature=tuple(filters.values()),
+            count_fallback=lambda: self.count(**filters),
+        )
+
     async def count(
         self,
         agency_id: Optional[int] = None,
@@ -110,53 +172,34 @@ class BlogPostingRepository:
         keyword: Optional[str] = None,
     ) -> int:
         """포스팅 개수 조회"""
-        stmt = select(func.count(BlogPosting.id))
-
-        if agency_id:
-            stmt = stmt.where(BlogPosting.agency_id == agency_id)
-
-        if advertiser_id:
-            stmt = stmt.where(BlogPosting.advertiser_id == advertiser_id)
-
-        if keyword:
-            AgencyUser = aliased(User)
-            AdvertiserUser = aliased(User)
-            search_term = f"%{keyword}%"
-
-            stmt = (
-                stmt.outerjoin(Agency, BlogPosting.agency_id == Agency.id)
-                .outerjoin(AgencyUser, Agency.id == AgencyUser.id)
-                .outerjoin(Advertiser, BlogPosting.advertiser_id == Advertiser.id)
-                .outerjoin(AdvertiserUser, Advertiser.id == AdvertiserUser.id)
-                .where(
-                    or_(
-                        BlogPosting.keyword.ilike(search_term),
-                        BlogPosting.url.ilike(search_term),
-                        AgencyUser.company_name.ilike(search_term),
-                        AdvertiserUser.company_name.ilike(search_term),
-                    )
-                )
-            )
-
+        stmt = self._apply_filters(
+            select(func.count(BlogPosting.id)),
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
+        )
         result = await self._session.execute(stmt)
         return result.scalar_one()
 
+    async def estimate_count(self) -> int:
+        """필터 없는 전체 포스팅 수 추정 (관리자 목록용)"""
+        return await estimate_table_count(
+            self._session,
+            BlogPosting.__tablename__,
+            exact_count=self.count,
+        )
+
     async def delete_by_agency_or_advertiser_id(self, user_id: int) -> int:
-        """agency_id 또는 advertiser_id가 user_id인 모든 포스팅 삭제
+        """agency_id 또는 advertiser_id가 user_id인 모든 포스팅 삭제 (DELETE 한 번)
 
         Note: CASCADE DELETE 대체용 (애플리케이션 레벨 삭제)
         """
-        stmt = select(BlogPosting).where(
+        stmt = delete(BlogPosting).where(
             or_(
                 BlogPosting.agency_id == user_id,
                 BlogPosting.advertiser_id == user_id,
             )
         )
         result = await self._session.execute(stmt)
-        postings = list(result.scalars().all())
-
-        for posting in postings:
-            await self._session.delete(posting)
-
-        await self._session.flush()
-        return len(postings)
+        invalidate_list_totals(BlogPosting.__tablename__)
+        return result.rowcount or 0
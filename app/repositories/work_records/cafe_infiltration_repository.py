@@ -4,12 +4,12 @@ import calendar
 from datetime import date
 from typing import List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from app.models.advertiser import Advertiser
 from app.models.work_records import CafeInfiltration
+from app.repositories.helpers import LoadProfile, company_name_loader
 
 
 class CafeInfiltrationRepository:
@@ -18,13 +18,21 @@ class CafeInfiltrationRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_by_id(self, infiltration_id: int) -> CafeInfiltration | None:
+    def _loader_options(self, profile: LoadProfile) -> list:
+        """로딩 프로필별 관계 옵션 (목록/상세 모두 광고주명만 사용)"""
+        if profile == LoadProfile.LEAN:
+            return []
+        return [company_name_loader(CafeInfiltration.advertiser, Advertiser)]
+
+    async def get_by_id(
+        self,
+        infiltration_id: int,
+        profile: LoadProfile = LoadProfile.DETAIL,
+    ) -> CafeInfiltration | None:
         """ID로 침투 기록 조회"""
         stmt = (
             select(CafeInfiltration)
-            .options(
-                joinedload(CafeInfiltration.advertiser).joinedload(Advertiser.user),
-            )
+            .options(*self._loader_options(profile))
             .where(CafeInfiltration.id == infiltration_id)
         )
         result = await self._session.execute(stmt)
@@ -34,13 +42,11 @@ class CafeInfiltrationRepository:
         """침투 기록 생성"""
         self._session.add(infiltration)
         await self._session.flush()
-        await self._session.refresh(infiltration)
         return infiltration
 
     async def update(self, infiltration: CafeInfiltration) -> CafeInfiltration:
         """침투 기록 업데이트"""
         await self._session.flush()
-        await self._session.refresh(infiltration)
         return infiltration
 
     async def delete(self, infiltration: CafeInfiltration) -> None:
@@ -54,6 +60,7 @@ class CafeInfiltrationRepository:
         month: int,
         advertiser_id: Optional[int] = None,
         advertiser_ids: Optional[List[int]] = None,
+        profile: LoadProfile = LoadProfile.LIST,
     ) -> List[CafeInfiltration]:
         """
         캘린더용 침투 목록 조회 (페이지네이션 없음)
@@ -63,10 +70,9 @@ class CafeInfiltrationRepository:
             month: 월 (필수)
             advertiser_id: 광고주 필터 (단일)
             advertiser_ids: 광고주 필터 (다중, 업체용)
+            profile: 관계 로딩 프로필
         """
-        stmt = select(CafeInfiltration).options(
-            joinedload(CafeInfiltration.advertiser).joinedload(Advertiser.user),
-        )
+        stmt = select(CafeInfiltration).options(*self._loader_options(profile))
 
         if advertiser_id:
             stmt = stmt.where(CafeInfiltration.advertiser_id == advertiser_id)
@@ -142,18 +148,10 @@ class CafeInfiltrationRepository:
         return result.scalar_one()
 
     async def delete_by_advertiser_id(self, advertiser_id: int) -> int:
-        """advertiser_id가 일치하는 모든 침투 기록 삭제
+        """advertiser_id가 일치하는 모든 침투 기록 삭제 (DELETE 한 번)
 
         Note: CASCADE DELETE 대체용 (애플리케이션 레벨 삭제)
         """
-        stmt = select(CafeInfiltration).where(
-            CafeInfiltration.advertiser_id == advertiser_id
-        )
+        stmt = delete(CafeInfiltration).where(CafeInfiltration.advertiser_id == advertiser_id)
         result = await self._session.execute(stmt)
-        infiltrations = list(result.scalars().all())
-
-        for infiltration in infiltrations:
-            await self._session.delete(infiltration)
-
-        await self._session.flush()
-        return len(infiltrations)
+        return result.rowcount or 0
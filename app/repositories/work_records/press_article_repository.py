@@ -4,12 +4,12 @@ import calendar
 from datetime import date
 from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import joinedload
 
 from app.models.advertiser import Advertiser
 from app.models.work_records import PressArticle
+from app.repositories.helpers import LoadProfile, company_name_loader
 
 
 class PressArticleRepository:
@@ -18,13 +18,21 @@ class PressArticleRepository:
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_by_id(self, article_id: int) -> PressArticle | None:
+    def _loader_options(self, profile: LoadProfile) -> list:
+        """로딩 프로필별 관계 옵션 (목록/상세 모두 광고주명만 사용)"""
+        if profile == LoadProfile.LEAN:
+            return []
+        return [company_name_loader(PressArticle.advertiser, Advertiser)]
+
+    async def get_by_id(
+        self,
+        article_id: int,
+        profile: LoadProfile = LoadProfile.DETAIL,
+    ) -> PressArticle | None:
         """ID로 기사 조회"""
         stmt = (
             select(PressArticle)
-            .options(
-                joinedload(PressArticle.advertiser).joinedload(Advertiser.user),
-            )
+            .options(*self._loader_options(profile))
             .where(PressArticle.id == article_id)
         )
         result = await self._session.execute(stmt)
@@ -34,13 +42,11 @@ class PressArticleRepository:
         """기사 생성"""
         self._session.add(article)
         await self._session.flush()
-        await self._session.refresh(article)
         return article
 
     async def update(self, article: PressArticle) -> PressArticle:
         """기사 업데이트"""
         await self._session.flush()
-        await self._session.refresh(article)
         return article
 
     async def delete(self, article: PressArticle) -> None:
@@ -54,6 +60,7 @@ class PressArticleRepository:
         month: int,
         advertiser_id: Optional[int] = None,
         advertiser_ids: Optional[List[int]] = None,
+        profile: LoadProfile = LoadProfile.LIST,
     ) -> List[PressArticle]:
         """
         캘린더용 기사 목록 조회 (페이지네이션 없음)
@@ -63,10 +70,9 @@ class PressArticleRepository:
             month: 월 (필수)
             advertiser_id: 광고주 필터 (단일)
             advertiser_ids: 광고주 필터 (다중, 업체용)
+            profile: 관계 로딩 프로필
         """
-        stmt = select(PressArticle).options(
-            joinedload(PressArticle.advertiser).joinedload(Advertiser.user),
-        )
+        stmt = select(PressArticle).options(*self._loader_options(profile))
 
         if advertiser_id:
             stmt = stmt.where(PressArticle.advertiser_id == advertiser_id)
@@ -138,16 +144,10 @@ class PressArticleRepository:
         return result.scalar_one()
 
     async def delete_by_advertiser_id(self, advertiser_id: int) -> int:
-        """advertiser_id가 일치하는 모든 기사 삭제
+        """advertiser_id가 일치하는 모든 기사 삭제 (DELETE 한 번)
 
         Note: CASCADE DELETE 대체용 (애플리케이션 레벨 삭제)
         """
-        stmt = select(PressArticle).where(PressArticle.advertiser_id == advertiser_id)
+        stmt = delete(PressArticle).where(PressArticle.advertiser_id == advertiser_id)
         result = await self._session.execute(stmt)
-        articles = list(result.scalars().all())
-
-        for article in articles:
-            await self._session.delete(article)
-
-        await self._session.flush()
-        return len(articles)
+        return result.rowcount or 0
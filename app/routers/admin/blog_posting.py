@@ -30,6 +30,7 @@ async def list_blog_postings(
     keyword: Optional[str] = Query(None, description="키워드 검색"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=1000, description="페이지당 항목 수"),
+    estimate_total: bool = Query(False, description="검색어가 없을 때 추정 전체 개수 사용"),
     service: BlogPostingService = Depends(get_blog_posting_service),
 ) -> BlogPostingListResponse:
     """블로그 포스팅 목록 (전체 조회)
@@ -41,4 +42,5 @@ async def list_blog_postings(
         keyword=keyword,
         page=page,
         page_size=page_size,
+        estimate_total=estimate_total,
     )
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Union
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
+from app.core.conditional import ConditionalRequest, get_conditional_request
 from app.core.dependencies import get_db_session, require_role
 from app.schemas.dashboard import AdminDashboardResponse
 from app.services.dashboard import AdminDashboardService
@@ -27,11 +28,14 @@ def get_dashboard_service(
     dependencies=[Depends(require_role("admin"))],
 )
 async def get_dashboard(
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     service: AdminDashboardService = Depends(get_dashboard_service),
-) -> AdminDashboardResponse:
+) -> Union[AdminDashboardResponse, Response]:
     """관리자 대시보드 (통계 + 최근 승인 요청 5건)
 
     Response:
-        AdminDashboardResponse
+        AdminDashboardResponse (If-None-Match 일치 시 304)
     """
+    if conditional.is_not_modified(await service.get_dashboard_version()):
+        return conditional.not_modified_response()
     return await service.get_dashboard()
@@ -2,10 +2,19 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from app.core.dependencies import get_db_session, require_role
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, status
+
+from app.core.config import Settings, get_settings
+from app.core.dependencies import (
+    get_db_session,
+    get_session_store_dep,
+    get_storage_dep,
+    require_role,
+)
+from app.core.session.session_store import AbstractSessionStore
+from app.core.storage.abstract_storage import AbstractStorage
 from app.models.user import ApprovalStatus, UserRole
+from app.repositories.file_repository import FileRepository
 from app.schemas.admin import (
     AdvertiserDetailResponse,
     AdvertiserListItem,
@@ -15,6 +24,8 @@ from app.schemas.admin import (
     AgencyListResponse,
     ApprovalResponse,
     ApproveRequest,
+    BulkApprovalResponse,
+    BulkApproveRequest,
     MappedAdvertiserItem,
     MappedAgencyItem,
     RejectRequest,
@@ -25,6 +36,7 @@ from app.schemas.admin import (
 from app.schemas.pagination import PaginationMeta
 from app.schemas.file import FileResponse
 from app.services.admin_member_service import AdminMemberService
+from app.services.file_service import FileService
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -39,6 +51,14 @@ def get_admin_service(
     return AdminMemberService(db)
 
 
+def get_file_service(
+    db: AsyncSession = Depends(get_db_session),
+    storage: AbstractStorage = Depends(get_storage_dep),
+    settings: Settings = Depends(get_settings),
+) -> FileService:
+    return FileService(FileRepository(db), storage, settings)
+
+
 # === 회원가입 승인 요청 ===
 
 
@@ -144,6 +164,31 @@ async def approve_signup(
         )
 
 
+@router.post(
+    "/signup-requests/approve",
+    response_model=BulkApprovalResponse,
+    dependencies=[Depends(require_role("admin"))],
+)
+async def approve_signups(
+    request: BulkApproveRequest,
+    service: AdminMemberService = Depends(get_admin_service),
+) -> BulkApprovalResponse:
+    """회원가입 일괄 승인 (광고주 매핑 없음, 업체 매핑은 개별 승인 사용)
+
+    Request Body:
+        BulkApproveRequest
+
+    Response:
+        BulkApprovalResponse
+    """
+    approved_ids = await service.approve_signups(request.user_ids)
+    approved = set(approved_ids)
+    return BulkApprovalResponse(
+        approved_ids=sorted(approved),
+        skipped_ids=sorted(set(request.user_ids) - approved),
+    )
+
+
 @router.post(
     "/signup-requests/{user_id}/reject",
     response_model=ApprovalResponse,
@@ -185,6 +230,7 @@ async def list_advertisers(
     search: Optional[str] = Query(None, description="이름/회사명/이메일 검색"),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=1000, description="페이지당 항목 수"),
+    estimate_total: bool = Query(False, description="필터가 없을 때 추정 전체 개수 사용"),
     service: AdminMemberService = Depends(get_admin_service),
 ) -> AdvertiserListResponse:
     """광고주 목록 (검색)
@@ -193,7 +239,7 @@ async def list_advertisers(
         AdvertiserListResponse
     """
     advertisers, total = await service.get_advertisers(
-        approval_status, search, page, page_size
+        approval_status, search, page, page_size, estimate_total
     )
 
     items = []
@@ -370,3 +416,38 @@ async def get_agency_detail(
         created_at=agency.user.created_at,
         mapped_advertisers=mapped_advertisers,
     )
+
+
+# === 회원 삭제 ===
+
+
+@router.delete(
+    "/members/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_role("admin"))],
+)
+async def delete_member(
+    user_id: int,
+    background_tasks: BackgroundTasks,
+    service: AdminMemberService = Depends(get_admin_service),
+    file_service: FileService = Depends(get_file_service),
+    session_store: AbstractSessionStore = Depends(get_session_store_dep),
+) -> None:
+    """회원 삭제 (업체/광고주 및 소유 데이터 일괄 삭제)
+
+    - DB 삭제는 한 트랜잭션으로 처리
+    - 삭제된 회원의 세션을 모두 삭제 (세션의 agency_id/advertiser_id 무효화)
+    - 스토리지 파일은 응답 후 백그라운드에서 정리
+    """
+    try:
+        storage_paths = await service.delete_member(user_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+
+    await session_store.delete_by_user(user_id)
+
+    if storage_paths:
+        background_tasks.add_task(file_service.delete_storage_files, storage_paths)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
+from typing import TYPE_CHECKING, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query
 
-from app.core.dependencies import get_db_session, require_role
-from app.repositories.advertiser_repository import AdvertiserRepository
+from app.core.dependencies import get_advertiser_id, get_db_session
 from app.schemas.work_records import BlogPostingListResponse
 from app.services.work_records import BlogPostingService
 
@@ -22,21 +21,6 @@ def get_blog_posting_service(
     return BlogPostingService(db)
 
 
-async def get_advertiser_id(
-    current_user: Dict[str, Any] = Depends(require_role("advertiser")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 광고주의 advertiser_id 반환"""
-    advertiser_repo = AdvertiserRepository(db)
-    advertiser = await advertiser_repo.get_by_id(current_user["user_id"])
-    if not advertiser:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="광고주 정보를 찾을 수 없습니다.",
-        )
-    return advertiser.id
-
-
 @router.get(
     "",
     response_model=BlogPostingListResponse,
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-
-from app.core.dependencies import get_db_session, require_role
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Optional, Union
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+
+from app.core.conditional import ConditionalRequest, get_conditional_request
+from app.core.dependencies import get_advertiser_id, get_db_session
+from app.core.wire_format import (
+    WIRE_FORMAT_RESPONSES,
+    WireFormat,
+    get_wire_format,
+    render,
+)
 from app.models.tracking import RankType, TrackingStatus
-from app.repositories.advertiser_repository import AdvertiserRepository
 from app.schemas.tracking import (
+    HistoryView,
     RealtimeRankResponse,
     TrackingDetailResponse,
     TrackingListResponse,
@@ -27,24 +35,6 @@ def get_rank_service(
     return RankService(db)
 
 
-async def get_advertiser_id(
-    current_user: Dict[str, Any] = Depends(require_role("advertiser")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 광고주의 advertiser_id 반환
-
-    Note: advertiser.id = user.id 이므로 get_by_id 사용
-    """
-    advertiser_repo = AdvertiserRepository(db)
-    advertiser = await advertiser_repo.get_by_id(current_user["user_id"])
-    if not advertiser:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="광고주 정보를 찾을 수 없습니다.",
-        )
-    return advertiser.id
-
-
 @router.get(
     "/realtime",
     response_model=RealtimeRankResponse,
@@ -66,51 +56,94 @@ async def get_realtime_rank(
 @router.get(
     "/tracking",
     response_model=TrackingListResponse,
+    responses=WIRE_FORMAT_RESPONSES,
 )
 async def list_trackings(
     status: Optional[TrackingStatus] = Query(None, description="상태 필터"),
     keyword: Optional[str] = Query(None, description="키워드 검색"),
+    since: Optional[datetime] = Query(
+        None, description="delta sync 커서 (이전 응답의 next_cursor) - 이후 변경된 추적만"
+    ),
     page: int = Query(1, ge=1, description="페이지 번호"),
     page_size: int = Query(20, ge=1, le=1000, description="페이지당 항목 수"),
     advertiser_id: int = Depends(get_advertiser_id),
+    wire_format: WireFormat = Depends(get_wire_format),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     service: RankService = Depends(get_rank_service),
-) -> TrackingListResponse:
+) -> Union[TrackingListResponse, Response]:
     """카페 글 순위 추적 목록 (본인 광고주만)
 
     Response:
-        TrackingListResponse
+        TrackingListResponse (Accept 헤더로 columnar/msgpack 선택, If-None-Match 일치 시 304)
     """
-    return await service.get_tracking_list(
+    version = await service.get_tracking_list_version(
         rank_type=RankType.CAFE,
         status=status,
         advertiser_id=advertiser_id,
         keyword=keyword,
+    )
+    if conditional.is_not_modified(version):
+        return conditional.not_modified_response()
+
+    result = await service.get_tracking_list(
+        rank_type=RankType.CAFE,
+        status=status,
+        advertiser_id=advertiser_id,
+        keyword=keyword,
+        since=since,
         page=page,
         page_size=page_size,
     )
+    return conditional.attach(render(result, wire_format))
 
 
 @router.get(
     "/tracking/{tracking_id}",
     response_model=TrackingDetailResponse,
+    responses=WIRE_FORMAT_RESPONSES,
 )
 async def get_tracking_detail(
     tracking_id: int,
+    start_date: Optional[date] = Query(None, description="히스토리 시작 날짜 (KST)"),
+    end_date: Optional[date] = Query(None, description="히스토리 종료 날짜 (KST, 포함)"),
+    session_number: Optional[int] = Query(None, ge=1, description="회차 필터"),
+    view: HistoryView = Query(HistoryView.LIST, description="list: 히스토리 목록, summary: 회차별 요약"),
+    limit: int = Query(100, ge=1, le=1000, description="히스토리 최대 개수 (view=list)"),
+    offset: int = Query(0, ge=0, description="히스토리 건너뛸 개수 (view=list)"),
+    since: Optional[datetime] = Query(
+        None, description="delta sync 커서 (view=list, 이전 응답의 next_cursor) - 이후 변경된 히스토리만"
+    ),
     advertiser_id: int = Depends(get_advertiser_id),
+    wire_format: WireFormat = Depends(get_wire_format),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     service: RankService = Depends(get_rank_service),
-) -> TrackingDetailResponse:
-    """카페 글 순위 추적 상세 (히스토리 전체 포함)
+) -> Union[TrackingDetailResponse, Response]:
+    """카페 글 순위 추적 상세 (히스토리 기간/회차 필터, 회차별 요약 지원)
 
     Response:
-        TrackingDetailResponse
+        TrackingDetailResponse (Accept 헤더로 columnar/msgpack 선택, If-None-Match 일치 시 304)
     """
+    version = await service.get_tracking_detail_version(
+        tracking_id=tracking_id,
+        advertiser_id=advertiser_id,
+    )
+    if version is not None and conditional.is_not_modified(version):
+        return conditional.not_modified_response()
+
     result = await service.get_tracking_detail(
         tracking_id=tracking_id,
         advertiser_id=advertiser_id,
+        start_date=start_date,
+        end_date=end_date,
+        session_number=session_number,
+        view=view,
+        limit=limit,
+        offset=offset,
+        since=since,
     )
     if not result:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="추적 정보를 찾을 수 없습니다.",
         )
-    return result
+    return conditional.attach(render(result, wire_format))
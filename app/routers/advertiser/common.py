@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
 
-from app.core.dependencies import get_db_session, require_role
-from app.repositories.advertiser_repository import AdvertiserRepository
+from app.core.dependencies import get_advertiser_id, get_db_session
 from app.repositories.agency_advertiser_mapping_repository import (
     AgencyAdvertiserMappingRepository,
 )
@@ -18,24 +17,6 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="", tags=["advertiser-common"])
 
 
-async def get_advertiser_id(
-    current_user: Dict[str, Any] = Depends(require_role("advertiser")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 광고주의 advertiser_id 반환
-
-    Note: advertiser.id = user.id 이므로 get_by_id 사용
-    """
-    advertiser_repo = AdvertiserRepository(db)
-    advertiser = await advertiser_repo.get_by_id(current_user["user_id"])
-    if not advertiser:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="광고주 정보를 찾을 수 없습니다.",
-        )
-    return advertiser.id
-
-
 @router.get(
     "/agencies",
     response_model=MappedAgencyListResponse,
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Response
 
-from app.core.dependencies import get_db_session, require_role
-from app.repositories.advertiser_repository import AdvertiserRepository
+from app.core.conditional import ConditionalRequest, get_conditional_request
+from app.core.dependencies import get_advertiser_id, get_db_session
 from app.schemas.dashboard import AdvertiserDashboardResponse
 from app.services.dashboard import AdvertiserDashboardService
 
@@ -22,32 +22,20 @@ def get_dashboard_service(
     return AdvertiserDashboardService(db)
 
 
-async def get_advertiser_id(
-    current_user: Dict[str, Any] = Depends(require_role("advertiser")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 광고주의 advertiser_id 반환"""
-    advertiser_repo = AdvertiserRepository(db)
-    advertiser = await advertiser_repo.get_by_id(current_user["user_id"])
-    if not advertiser:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="광고주 정보를 찾을 수 없습니다.",
-        )
-    return advertiser.id
-
-
 @router.get(
     "",
     response_model=AdvertiserDashboardResponse,
 )
 async def get_dashboard(
     advertiser_id: int = Depends(get_advertiser_id),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     service: AdvertiserDashboardService = Depends(get_dashboard_service),
-) -> AdvertiserDashboardResponse:
+) -> Union[AdvertiserDashboardResponse, Response]:
     """광고주 대시보드 (통계 + 최근 추적 현황 5건)
 
     Response:
-        AdvertiserDashboardResponse
+        AdvertiserDashboardResponse (If-None-Match 일치 시 304)
     """
+    if conditional.is_not_modified(await service.get_dashboard_version(advertiser_id)):
+        return conditional.not_modified_response()
     return await service.get_dashboard(advertiser_id)
@@ -1,15 +1,13 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends
 
-from app.core.dependencies import get_db_session, require_role
-from app.repositories.agency_advertiser_mapping_repository import (
-    AgencyAdvertiserMappingRepository,
-)
-from app.repositories.agency_repository import AgencyRepository
+from app.core.dependencies import get_agency_id, get_db_session
+from app.repositories.advertiser_repository import AdvertiserRepository
 from app.schemas.agency import MappedAdvertiserItem, MappedAdvertiserListResponse
+from app.services.cache import get_mapping_index, get_user_profile_cache
 
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
@@ -18,24 +16,6 @@ if TYPE_CHECKING:
 router = APIRouter(prefix="", tags=["agency-common"])
 
 
-async def get_agency_id(
-    current_user: Dict[str, Any] = Depends(require_role("agency")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 업체의 agency_id 반환
-
-    Note: agency.id = user.id 이므로 get_by_id 사용
-    """
-    agency_repo = AgencyRepository(db)
-    agency = await agency_repo.get_by_id(current_user["user_id"])
-    if not agency:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="업체 정보를 찾을 수 없습니다.",
-        )
-    return agency.id
-
-
 @router.get(
     "/advertisers",
     response_model=MappedAdvertiserListResponse,
@@ -49,20 +29,23 @@ async def list_mapped_advertisers(
     Response:
         MappedAdvertiserListResponse
     """
-    mapping_repo = AgencyAdvertiserMappingRepository(db)
-    mappings = await mapping_repo.get_by_agency_id(agency_id)
+    # 매핑 ID는 매핑 캐시, 이름은 프로필 캐시에서 조회 (join 없음)
+    advertiser_ids = await get_mapping_index().get_advertiser_ids(db, agency_id)
+    # 광고주 프로필이 있는 매핑만 (사용자는 프로필 캐시에 없으면 제외)
+    existing_ids = await AdvertiserRepository(db).get_existing_ids(list(advertiser_ids))
+    profiles = await get_user_profile_cache().get_many(db, existing_ids)
 
     items = []
-    for mapping in mappings:
-        if mapping.advertiser and mapping.advertiser.user:
-            # Note: advertiser.id = user.id 이므로 user_id 필드 제거됨
-            items.append(
-                MappedAdvertiserItem(
-                    id=mapping.advertiser.id,
-                    login_id=mapping.advertiser.user.login_id,
-                    name=mapping.advertiser.user.name,
-                    company_name=mapping.advertiser.user.company_name,
-                )
+    for advertiser_id in sorted(profiles):
+        profile = profiles[advertiser_id]
+        # Note: advertiser.id = user.id 이므로 user_id 필드 제거됨
+        items.append(
+            MappedAdvertiserItem(
+                id=advertiser_id,
+                login_id=profile.login_id,
+                name=profile.name,
+                company_name=profile.company_name,
             )
+        )
 
     return MappedAdvertiserListResponse(items=items, total=len(items))
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Union
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Response
 
-from app.core.dependencies import get_db_session, require_role
-from app.repositories.agency_repository import AgencyRepository
+from app.core.conditional import ConditionalRequest, get_conditional_request
+from app.core.dependencies import get_agency_id, get_db_session
 from app.schemas.dashboard import AgencyDashboardResponse
 from app.services.dashboard import AgencyDashboardService
 
@@ -22,32 +22,20 @@ def get_dashboard_service(
     return AgencyDashboardService(db)
 
 
-async def get_agency_id(
-    current_user: Dict[str, Any] = Depends(require_role("agency")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 업체의 agency_id 반환"""
-    agency_repo = AgencyRepository(db)
-    agency = await agency_repo.get_by_id(current_user["user_id"])
-    if not agency:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="업체 정보를 찾을 수 없습니다.",
-        )
-    return agency.id
-
-
 @router.get(
     "",
     response_model=AgencyDashboardResponse,
 )
 async def get_dashboard(
     agency_id: int = Depends(get_agency_id),
+    conditional: ConditionalRequest = Depends(get_conditional_request),
     service: AgencyDashboardService = Depends(get_dashboard_service),
-) -> AgencyDashboardResponse:
+) -> Union[AgencyDashboardResponse, Response]:
     """업체 대시보드 (통계 + 최근 추적 현황 5건)
 
     Response:
-        AgencyDashboardResponse
+        AgencyDashboardResponse (If-None-Match 일치 시 304)
     """
+    if conditional.is_not_modified(await service.get_dashboard_version(agency_id)):
+        return conditional.not_modified_response()
     return await service.get_dashboard(agency_id)
@@ -1,11 +1,10 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, Query
 
-from app.core.dependencies import get_db_session, require_role
-from app.repositories.agency_repository import AgencyRepository
+from app.core.dependencies import get_agency_id, get_db_session
 from app.schemas.work_records import PressArticleCalendarResponse
 from app.services.work_records import PressArticleService
 
@@ -22,21 +21,6 @@ def get_press_article_service(
     return PressArticleService(db)
 
 
-async def get_agency_id(
-    current_user: Dict[str, Any] = Depends(require_role("agency")),
-    db: AsyncSession = Depends(get_db_session),
-) -> int:
-    """현재 로그인한 업체의 agency_id 반환"""
-    agency_repo = AgencyRepository(db)
-    agency = await agency_repo.get_by_id(current_user["user_id"])
-    if not agency:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="업체 정보를 찾을 수 없습니다.",
-        )
-    return agency.id
-
-
 @router.get(
     "",
     response_model=PressArticleCalendarResponse,
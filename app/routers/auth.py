@@ -5,7 +5,11 @@ from typing import TYPE_CHECKING, Optional
 from fastapi import APIRouter, Cookie, Depends, HTTPException, Response, status
 
 from app.core.config import Settings, get_settings
-from app.core.dependencies import get_db_session, get_session_store_dep
+from app.core.dependencies import (
+    get_db_session,
+    get_session_store_dep,
+    set_session_cookie,
+)
 from app.schemas.auth import (
     LoginRequest,
     LoginResponse,
@@ -59,14 +63,7 @@ async def login(
             if request.remember_me
             else settings.SESSION_EXPIRE_SECONDS
         )
-        response.set_cookie(
-            key=settings.SESSION_COOKIE_NAME,
-            value=session_id,
-            max_age=max_age,
-            httponly=True,
-            samesite="lax",
-            secure=False,
-        )
+        set_session_cookie(response, settings, session_id, max_age)
 
         return result
 
@@ -107,15 +104,20 @@ async def logout(
 
 @router.get("/session", response_model=SessionResponse)
 async def get_session(
+    response: Response,
     session_id: Optional[str] = Cookie(None, alias="session_id"),
     auth_service: AuthService = Depends(get_auth_service),
+    settings: Settings = Depends(get_settings),
 ) -> SessionResponse:
     """
     현재 세션 확인
 
-    쿠키의 세션 ID로 인증 상태 확인
+    쿠키의 세션 ID로 인증 상태 확인 (슬라이딩 만료면 세션과 쿠키 만료 연장)
 
     Response:
         SessionResponse
     """
-    return await auth_service.get_session(session_id)
+    result, remaining = await auth_service.get_session(session_id)
+    if remaining is not None:
+        set_session_cookie(response, settings, session_id, int(remaining.total_seconds()))
+    return result
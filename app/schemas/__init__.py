@@ -19,6 +19,8 @@ from app.schemas.admin import (
     SignupRequestListResponse,
     SignupRequestDetailResponse,
     ApproveRequest,
+    BulkApproveRequest,
+    BulkApprovalResponse,
     RejectRequest,
     ApprovalResponse,
     AdvertiserListItem,
@@ -91,6 +93,8 @@ __all__ = [
     "SignupRequestListResponse",
     "SignupRequestDetailResponse",
     "ApproveRequest",
+    "BulkApproveRequest",
+    "BulkApprovalResponse",
     "RejectRequest",
     "ApprovalResponse",
     "AdvertiserListItem",
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.models.agency import AgencyCategory
 from app.schemas.pagination import PaginationMeta
@@ -63,6 +63,19 @@ class ApproveRequest(BaseModel):
     advertiser_ids: Optional[List[int]] = None
 
 
+class BulkApproveRequest(BaseModel):
+    """일괄 승인 요청 (광고주 매핑 없음)"""
+
+    user_ids: List[int] = Field(..., min_length=1, max_length=1000)
+
+
+class BulkApprovalResponse(BaseModel):
+    """일괄 승인 응답"""
+
+    approved_ids: List[int]
+    skipped_ids: List[int]  # 없거나 승인 대기 상태가 아닌 사용자
+
+
 class RejectRequest(BaseModel):
     """거절 요청"""
 
@@ -1,5 +1,7 @@
 from app.schemas.tracking.common import (
+    HistoryView,
     RankHistoryItem,
+    RankSessionSummaryItem,
     RealtimeRankResponse,
     TrackingCreateRequest,
     TrackingCreateResponse,
@@ -35,7 +37,9 @@ from app.schemas.tracking.blog_rank import (
 
 __all__ = [
     # Common
+    "HistoryView",
     "RankHistoryItem",
+    "RankSessionSummaryItem",
     "RealtimeRankResponse",
     "TrackingCreateRequest",
     "TrackingCreateResponse",
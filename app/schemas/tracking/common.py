@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
@@ -44,6 +45,10 @@ class TrackingListItem(BaseModel):
     latest_rank: Optional[int] = None
     latest_checked_at: Optional[datetime] = None
 
+    # 현재 회차 진행률 (회차 요약 테이블)
+    session_exposures: int = Field(0, description="현재 회차 노출 횟수")
+    session_target: int = Field(0, description="회차 전환 기준 노출 횟수")
+
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -55,6 +60,9 @@ class TrackingListResponse(BaseModel):
     items: List[TrackingListItem]
     total: int
     pagination: PaginationMeta
+    next_cursor: Optional[datetime] = Field(
+        None, description="다음 delta sync 요청에 since로 전달할 커서"
+    )
 
 
 class RankHistoryItem(BaseModel):
@@ -68,6 +76,28 @@ class RankHistoryItem(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class RankSessionSummaryItem(BaseModel):
+    """회차별 순위 요약 (회차 요약 테이블 또는 기간 필터 시 SQL 집계)"""
+
+    session_number: int = Field(..., description="회차 번호")
+    check_count: int = Field(..., description="체크 횟수")
+    exposure_count: int = Field(..., description="노출 횟수 (rank not null)")
+    best_rank: Optional[int] = Field(None, description="최고 순위")
+    worst_rank: Optional[int] = Field(None, description="최저 순위")
+    avg_rank: Optional[float] = Field(None, description="평균 순위 (노출 기준)")
+    first_checked_at: datetime
+    last_checked_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class HistoryView(str, Enum):
+    """상세 히스토리 조회 방식"""
+
+    LIST = "list"  # 히스토리 목록 (페이징)
+    SUMMARY = "summary"  # 회차별 요약
+
+
 class TrackingDetailResponse(BaseModel):
     """추적 상세 응답"""
 
@@ -87,9 +117,17 @@ class TrackingDetailResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    # 히스토리
+    # 현재 회차 진행률 (회차 요약 테이블)
+    session_exposures: int = Field(0, description="현재 회차 노출 횟수")
+    session_target: int = Field(0, description="회차 전환 기준 노출 횟수")
+
+    # 히스토리 (view=list: 페이징된 목록, view=summary: 회차별 요약)
     histories: List[RankHistoryItem] = []
-    history_total: int = 0
+    history_total: int = Field(0, description="필터 적용 히스토리 전체 개수")
+    session_summaries: List[RankSessionSummaryItem] = []
+    next_cursor: Optional[datetime] = Field(
+        None, description="다음 delta sync 요청에 since로 전달할 커서 (view=list)"
+    )
 
 
 # === 추적 등록 (Agency) ===
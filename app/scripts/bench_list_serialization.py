@@ -0,0 +1,122 @@
+"""
+추적 목록 응답 직렬화 마이크로 벤치마크 (1000건)
+
+- per_item: 항목마다 모델 생성 (기존 방식)
+- single_pass: dict 행을 모아 응답 전체를 한 번에 검증 (현재 목록 서비스 방식)
+- constructed: model_construct로 검증 없이 생성
+- 위 세 경우는 FastAPI 응답 처리와 같이 response_model 검증 후 JSON 바이트로 직렬화
+- 참고용: jsonable_encoder + json.dumps (dump_json 도입 전 FastAPI), orjson.dumps
+
+사용법:
+    python -m app.scripts.bench_list_serialization [--items 1000] [--repeat 50]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import timeit
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import structlog
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.core.logging import configure_logging
+from app.models.tracking import RankType, TrackingStatus
+from app.schemas.pagination import PaginationMeta
+from app.schemas.tracking import TrackingListItem, TrackingListResponse
+
+logger = structlog.get_logger()
+
+
+def make_rows(count: int) -> list[dict]:
+    """DB에서 읽은 것과 같은 형태의 목록 행 생성"""
+    now = datetime.now(timezone.utc)
+    return [
+        {
+            "id": i,
+            "type": RankType.PLACE,
+            "keyword": f"키워드 {i}",
+            "url": f"https://m.place.naver.com/restaurant/{1000000 + i}",
+            "status": TrackingStatus.ACTIVE,
+            "current_session": 1 + i % 5,
+            "agency_id": 1 + i % 10,
+            "agency_name": f"업체 {i % 10}",
+            "advertiser_id": 100 + i % 50,
+            "advertiser_name": f"광고주 {i % 50}",
+            "latest_rank": i % 30 or None,
+            "latest_checked_at": now - timedelta(hours=i),
+            "session_exposures": i % 25,
+            "session_target": 25,
+            "created_at": now - timedelta(days=i),
+        }
+        for i in range(count)
+    ]
+
+
+def build_per_item(rows: list[dict]) -> TrackingListResponse:
+    items = [TrackingListItem(**row) for row in rows]
+    pagination = PaginationMeta.create(total=len(rows), page=1, page_size=len(rows))
+    return TrackingListResponse(items=items, total=len(rows), pagination=pagination)
+
+
+def build_single_pass(rows: list[dict]) -> TrackingListResponse:
+    items = [dict(row) for row in rows]  # 서비스에서 ORM 객체로 dict를 만드는 비용
+    pagination = PaginationMeta.create(total=len(rows), page=1, page_size=len(rows))
+    return TrackingListResponse.model_validate(
+        {"items": items, "total": len(rows), "pagination": pagination}
+    )
+
+
+def build_constructed(rows: list[dict]) -> TrackingListResponse:
+    items = [TrackingListItem.model_construct(**row) for row in rows]
+    pagination = PaginationMeta.create(total=len(rows), page=1, page_size=len(rows))
+    return TrackingListResponse.model_construct(
+        items=items, total=len(rows), pagination=pagination
+    )
+
+
+def main() -> None:
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="목록 직렬화 벤치마크")
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    configure_logging()
+    rows = make_rows(args.items)
+    # FastAPI response_model 필드와 같은 검증/직렬화 경로
+    adapter = TypeAdapter(TrackingListResponse)
+
+    def fastapi_path(response: TrackingListResponse) -> bytes:
+        return adapter.dump_json(adapter.validate_python(response))
+
+    cases = {
+        "per_item": lambda: fastapi_path(build_per_item(rows)),
+        "single_pass": lambda: fastapi_path(build_single_pass(rows)),
+        "constructed": lambda: fastapi_path(build_constructed(rows)),
+        "single_pass_jsonable_encoder": lambda: json.dumps(
+            jsonable_encoder(build_single_pass(rows))
+        ).encode(),
+        "single_pass_orjson": lambda: orjson.dumps(
+            build_single_pass(rows).model_dump(mode="json")
+        ),
+    }
+
+    expected = json.loads(cases["per_item"]())
+    assert json.loads(cases["single_pass"]()) == expected
+    assert json.loads(cases["constructed"]()) == expected
+
+    for name, case in cases.items():
+        elapsed = timeit.timeit(case, number=args.repeat)
+        logger.info(
+            "list_serialization_benchmark",
+            case=name,
+            items=args.items,
+            ms_per_response=round(elapsed / args.repeat * 1000, 3),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+세션 코덱 / 메모리 세션 저장소 마이크로 벤치마크
+
+- 코덱별 인코딩/디코딩 시간 (Redis 세션 저장소의 요청당 CPU 비용)
+- 메모리 저장소 get (읽기 전용 뷰 반환)과 기존 방식(dict 복사) 비교
+
+사용법:
+    python -m app.scripts.bench_session_codec [--iterations 200000]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import timeit
+
+import structlog
+
+from app.core.config import SessionCodecType
+from app.core.logging import configure_logging
+from app.core.session.codec import SessionCodec
+from app.core.session.memory_store import MemorySessionStore
+
+logger = structlog.get_logger()
+
+# 로그인 시 저장하는 세션 데이터와 같은 형태
+SAMPLE_SESSION = {
+    "user_id": 12345,
+    "login_id": "agency_user",
+    "email": "agency_user@example.com",
+    "name": "홍길동",
+    "role": "agency",
+    "approval_status": "approved",
+    "categories": ["place", "blog", "cafe"],
+    "agency_id": 12345,
+    "advertiser_id": None,
+}
+
+
+def bench_codecs(iterations: int) -> None:
+    """코덱별 인코딩/디코딩 1회당 시간 (마이크로초)"""
+    for codec_type in SessionCodecType:
+        try:
+            codec = SessionCodec(codec_type)
+        except RuntimeError as e:
+            logger.warning("codec_skipped", codec=codec_type.value, reason=str(e))
+            continue
+
+        payload = codec.encode(SAMPLE_SESSION)
+        encode = timeit.timeit(lambda: codec.encode(SAMPLE_SESSION), number=iterations)
+        decode = timeit.timeit(lambda: codec.decode(payload), number=iterations)
+        logger.info(
+            "codec_benchmark",
+            codec=codec_type.value,
+            payload_bytes=len(payload),
+            encode_us=round(encode / iterations * 1e6, 3),
+            decode_us=round(decode / iterations * 1e6, 3),
+        )
+
+
+async def bench_memory_store(iterations: int) -> None:
+    """메모리 저장소 get 1회당 시간 (마이크로초)"""
+    store = MemorySessionStore()
+    await store.set("bench", SAMPLE_SESSION)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    for _ in range(iterations):
+        await store.get("bench")
+    view = loop.time() - start
+
+    # 기존 방식: 조회마다 dict 복사
+    data = await store.get("bench")
+    copy = timeit.timeit(lambda: dict(data), number=iterations)
+
+    logger.info(
+        "memory_store_benchmark",
+        get_us=round(view / iterations * 1e6, 3),
+        dict_copy_us=round(copy / iterations * 1e6, 3),
+    )
+
+
+async def main() -> None:
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="세션 코덱 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200_000)
+    args = parser.parse_args()
+
+    configure_logging()
+    bench_codecs(args.iterations)
+    await bench_memory_store(args.iterations)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,53 @@
+"""
+회차 요약(tracking_session_summaries) 재구축 스크립트
+
+- 도입 시점의 기존 히스토리 백필 / 불일치 복구용
+- 보존 기간이 지나 원본 히스토리가 삭제된 구간은 반영되지 않음
+
+사용법:
+    python -m app.scripts.rebuild_session_summaries
+"""
+from __future__ import annotations
+
+import asyncio
+
+import structlog
+
+from app.core.config import get_settings
+from app.core.factory import get_database, close_all
+from app.core.logging import configure_logging
+from app.repositories.tracking import TrackingSessionSummaryRepository
+
+logger = structlog.get_logger()
+
+
+async def rebuild_session_summaries() -> None:
+    """전체 히스토리에서 회차 요약 재계산"""
+    settings = get_settings()
+
+    logger.info("rebuild_session_summaries_starting", db=settings.DB_TYPE.value)
+
+    # 데이터베이스 연결
+    db = await get_database(settings)
+
+    # 테이블 생성 (없으면)
+    await db.create_tables()
+    logger.info("db_tables_verified")
+
+    # 세션 열기 (get_session이 종료 시 커밋)
+    async for session in db.get_session():
+        rebuilt = await TrackingSessionSummaryRepository(session).rebuild()
+        logger.info("session_summaries_rebuilt", sessions=rebuilt)
+
+
+async def main() -> None:
+    """메인 함수"""
+    configure_logging()
+    try:
+        await rebuild_session_summaries()
+    finally:
+        await close_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
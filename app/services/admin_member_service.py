@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from typing import List, Optional, Tuple
 
+import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -14,7 +15,23 @@ from app.repositories.agency_advertiser_mapping_repository import (
     AgencyAdvertiserMappingRepository,
 )
 from app.repositories.agency_repository import AgencyRepository
+from app.repositories.file_repository import FileRepository
+from app.repositories.helpers import invalidate_list_totals
+from app.repositories.tracking import (
+    RankHistoryRepository,
+    RankHistoryRollupRepository,
+    RankTrackingRepository,
+    TrackingSessionSummaryRepository,
+)
 from app.repositories.user_repository import UserRepository
+from app.repositories.work_records import (
+    BlogPostingRepository,
+    CafeInfiltrationRepository,
+    PressArticleRepository,
+)
+from app.services.cache import get_mapping_index, get_user_profile_cache
+
+logger = structlog.get_logger()
 
 
 class AdminMemberService:
@@ -26,6 +43,14 @@ class AdminMemberService:
         self._advertiser_repo = AdvertiserRepository(db_session)
         self._agency_repo = AgencyRepository(db_session)
         self._mapping_repo = AgencyAdvertiserMappingRepository(db_session)
+        self._file_repo = FileRepository(db_session)
+        self._tracking_repo = RankTrackingRepository(db_session)
+        self._history_repo = RankHistoryRepository(db_session)
+        self._rollup_repo = RankHistoryRollupRepository(db_session)
+        self._summary_repo = TrackingSessionSummaryRepository(db_session)
+        self._blog_repo = BlogPostingRepository(db_session)
+        self._press_repo = PressArticleRepository(db_session)
+        self._cafe_repo = CafeInfiltrationRepository(db_session)
 
     # === 회원가입 승인 요청 ===
 
@@ -81,28 +106,41 @@ class AdminMemberService:
         user.approval_status = ApprovalStatus.APPROVED
         user = await self._user_repo.update(user)
 
-        # 업체인 경우 광고주 매핑
-        if user.role == UserRole.AGENCY and advertiser_ids:
-            # Note: agency.id = user.id 이므로 get_by_id 사용
-            agency = await self._agency_repo.get_by_id(user.id)
-            if agency:
-                # 유효한 광고주만 매핑
-                for advertiser_id in advertiser_ids:
-                    advertiser = await self._advertiser_repo.get_by_id(advertiser_id)
-                    if advertiser:
-                        # 중복 매핑 방지
-                        if not await self._mapping_repo.exists(
-                            agency.id, advertiser_id
-                        ):
-                            mapping = AgencyAdvertiserMapping(
-                                agency_id=agency.id,
-                                advertiser_id=advertiser_id,
-                            )
-                            await self._mapping_repo.create(mapping)
+        # 업체인 경우 광고주 매핑 (유효 ID 검증 1회 + 일괄 INSERT 1회)
+        # Note: agency.id = user.id
+        if (
+            user.role == UserRole.AGENCY
+            and advertiser_ids
+            and await self._agency_repo.exists(user.id)
+        ):
+            valid_ids = await self._advertiser_repo.get_existing_ids(advertiser_ids)
+            await self._mapping_repo.create_bulk(user.id, valid_ids)
+            mapped_ids = valid_ids
+        else:
+            mapped_ids = []
 
         await self._db.commit()
+        invalidate_list_totals(Advertiser.__tablename__)
+        if mapped_ids:
+            get_mapping_index().invalidate([user.id])
         return user
 
+    async def approve_signups(self, user_ids: List[int]) -> List[int]:
+        """
+        회원가입 일괄 승인 (광고주 매핑 없음)
+
+        - 승인 대기 상태인 사용자만 승인 (UPDATE 한 번)
+
+        Returns:
+            승인된 사용자 ID 목록
+        """
+        approved_ids = await self._user_repo.set_status_for_pending(
+            user_ids, ApprovalStatus.APPROVED
+        )
+        await self._db.commit()
+        invalidate_list_totals(Advertiser.__tablename__)
+        return approved_ids
+
     async def reject_signup(self, user_id: int) -> User:
         """
         회원가입 거절
@@ -120,6 +158,7 @@ class AdminMemberService:
         user.approval_status = ApprovalStatus.REJECTED
         user = await self._user_repo.update(user)
         await self._db.commit()
+        invalidate_list_totals(Advertiser.__tablename__)
         return user
 
     # === 광고주 관리 ===
@@ -130,14 +169,22 @@ class AdminMemberService:
         search: Optional[str] = None,
         page: int = 1,
         page_size: int = 20,
+        estimate_total: bool = False,
     ) -> Tuple[List[Advertiser], int]:
-        """광고주 목록 조회"""
+        """광고주 목록 조회
+
+        Note: estimate_total=True 이고 필터가 없으면 통계 기반 추정 개수 반환
+        """
         skip = (page - 1) * page_size
-        advertisers = await self._advertiser_repo.get_all(
+
+        if estimate_total and not (approval_status or search):
+            advertisers = await self._advertiser_repo.get_all(skip=skip, limit=page_size)
+            total = await self._advertiser_repo.estimate_count()
+            return advertisers, total
+
+        return await self._advertiser_repo.get_all_with_total(
             approval_status, search, skip, page_size
         )
-        total = await self._advertiser_repo.count_all(approval_status, search)
-        return advertisers, total
 
     async def get_advertiser_detail(
         self, advertiser_id: int
@@ -185,3 +232,75 @@ class AdminMemberService:
                 await self._db.refresh(mapping.advertiser, ["user"])
 
         return agency, mappings
+
+    # === 회원 삭제 ===
+
+    async def delete_member(self, user_id: int) -> List[str]:
+        """
+        회원 삭제 (업체/광고주와 소유 데이터 전체)
+
+        - FK CASCADE가 없으므로 하위 테이블부터 테이블당 DELETE 한 번씩 실행
+        - 전체를 한 트랜잭션으로 커밋
+        - 스토리지 파일은 커밋 후 호출자가 백그라운드로 정리
+
+        Returns:
+            삭제된 파일의 저장 경로 목록
+
+        Raises:
+            ValueError: 사용자 없음 또는 관리자 계정
+        """
+        user = await self._user_repo.get_by_id(user_id)
+        if not user:
+            raise ValueError("사용자를 찾을 수 없습니다.")
+
+        if user.role == UserRole.ADMIN:
+            raise ValueError("관리자 계정은 삭제할 수 없습니다.")
+
+        # 추적 하위 데이터 (히스토리, 주간 집계, 회차 요약) → 추적
+        tracking_ids = RankTrackingRepository.owned_ids_stmt(user_id)
+        deleted = {
+            "rank_histories": await self._history_repo.delete_by_tracking_ids(
+                tracking_ids
+            ),
+            "rank_history_rollups": await self._rollup_repo.delete_by_tracking_ids(
+                tracking_ids
+            ),
+            "session_summaries": await self._summary_repo.delete_by_tracking_ids(
+                tracking_ids
+            ),
+            "rank_trackings": (
+                await self._tracking_repo.delete_by_agency_or_advertiser_id(user_id)
+            ),
+            "blog_postings": (
+                await self._blog_repo.delete_by_agency_or_advertiser_id(user_id)
+            ),
+            "press_articles": await self._press_repo.delete_by_advertiser_id(user_id),
+            "cafe_infiltrations": await self._cafe_repo.delete_by_advertiser_id(
+                user_id
+            ),
+        }
+        deleted_mappings = await self._mapping_repo.delete_by_agency_or_advertiser_id(
+            user_id
+        )
+        deleted["mappings"] = len(deleted_mappings)
+
+        # 프로필 (advertiser.id / agency.id = user.id)
+        file_ids: List[int] = []
+        if user.role == UserRole.ADVERTISER:
+            file_ids = await self._advertiser_repo.get_file_ids(user_id)
+            await self._advertiser_repo.delete(user_id)
+        elif user.role == UserRole.AGENCY:
+            await self._agency_repo.delete(user_id)
+
+        storage_paths = await self._file_repo.delete_by_ids(file_ids)
+        await self._user_repo.delete(user_id)
+
+        await self._db.commit()
+        invalidate_list_totals(Advertiser.__tablename__)
+        get_user_profile_cache().invalidate(user_id)
+        get_mapping_index().invalidate(
+            [agency_id for agency_id, _ in deleted_mappings]
+        )
+
+        logger.info("member_deleted", user_id=user_id, role=user.role.value, **deleted)
+        return storage_paths
@@ -6,7 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings
 from app.core.session.session_store import AbstractSessionStore
-from app.core.security import generate_session_id, verify_password
+from app.core.security import generate_session_id, verify_and_update_password
 from app.models.user import ApprovalStatus, UserRole
 from app.repositories.user_repository import UserRepository
 from app.schemas.auth import (
@@ -50,10 +50,18 @@ class AuthService:
         if user is None:
             raise ValueError("아이디가 올바르지 않습니다.")
 
-        # 2. 비밀번호 검증
-        if not verify_password(request.password, user.password_hash):
+        # 2. 비밀번호 검증 (스레드 풀에서 실행)
+        verified, new_hash = await verify_and_update_password(
+            request.password, user.password_hash
+        )
+        if not verified:
             raise ValueError("비밀번호가 올바르지 않습니다.")
 
+        # cost 설정이 바뀐 해시는 로그인 성공 시 재해싱 (요청 종료 시 커밋)
+        if new_hash:
+            user.password_hash = new_hash
+            await self._user_repo.update(user)
+
         # 3. 승인 상태 확인 (admin은 제외)
         if (
             user.role != UserRole.ADMIN
@@ -64,6 +72,8 @@ class AuthService:
             raise PermissionError("승인이 거절된 계정입니다.")
 
         # 4. 세션 생성
+        # 역할별 프로필 ID를 함께 저장해 요청마다 프로필을 조회하지 않도록 함
+        # (agency.id / advertiser.id = user.id, 프로필이 없으면 None)
         session_id = generate_session_id()
         session_data = {
             "user_id": user.id,
@@ -73,6 +83,8 @@ class AuthService:
             "role": user.role.value,
             "approval_status": user.approval_status.value,
             "categories": user.agency.categories if user.agency else None,
+            "agency_id": user.agency.id if user.agency else None,
+            "advertiser_id": user.advertiser.id if user.advertiser else None,
         }
 
         # Remember Me에 따른 만료 시간 설정
@@ -100,14 +112,35 @@ class AuthService:
         await self._session_store.delete(session_id)
         return True
 
-    async def get_session(self, session_id: str | None) -> SessionResponse:
-        """현재 세션 정보 조회"""
+    async def get_session(
+        self, session_id: str | None
+    ) -> tuple[SessionResponse, timedelta | None]:
+        """
+        현재 세션 정보 조회
+
+        - SESSION_SLIDING_EXPIRATION이면 조회와 만료 연장을 한 번에 처리
+          (인증 필수 엔드포인트의 get_current_user와 동일)
+
+        Returns:
+            tuple[SessionResponse, timedelta | None]: (세션 응답, 연장 후 남은 만료 - 쿠키 연장용)
+        """
         if not session_id:
-            return SessionResponse(authenticated=False)
+            return SessionResponse(authenticated=False), None
+
+        remaining = None
+        if self._settings.SESSION_SLIDING_EXPIRATION:
+            result = await self._session_store.get_and_extend(
+                session_id,
+                expire=timedelta(seconds=self._settings.SESSION_EXPIRE_SECONDS),
+            )
+            session_data = None
+            if result is not None:
+                session_data, remaining = result
+        else:
+            session_data = await self._session_store.get(session_id)
 
-        session_data = await self._session_store.get(session_id)
         if session_data is None:
-            return SessionResponse(authenticated=False)
+            return SessionResponse(authenticated=False), None
 
         return SessionResponse(
             authenticated=True,
@@ -120,7 +153,7 @@ class AuthService:
                 approval_status=session_data["approval_status"],
                 categories=session_data.get("categories"),
             ),
-        )
+        ), remaining
 
     async def refresh_session(self, session_id: str, remember_me: bool = False) -> bool:
         """세션 만료 시간 갱신"""
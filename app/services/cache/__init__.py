@@ -0,0 +1,14 @@
+from app.services.cache.mapping_index import MappingIndex, get_mapping_index
+from app.services.cache.user_profile_cache import (
+    UserProfile,
+    UserProfileCache,
+    get_user_profile_cache,
+)
+
+__all__ = [
+    "MappingIndex",
+    "get_mapping_index",
+    "UserProfile",
+    "UserProfileCache",
+    "get_user_profile_cache",
+]
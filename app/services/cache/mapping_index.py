@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import FrozenSet, Iterable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.repositories.agency_advertiser_mapping_repository import (
+    AgencyAdvertiserMappingRepository,
+)
+
+
+class MappingIndex:
+    """
+    업체-광고주 매핑 인덱스 캐시 (agency_id → advertiser_id 집합)
+
+    - 권한 범위 조회(업체의 광고주 목록 등)가 ID만 필요할 때 join 없이 사용
+    - 매핑 쓰기 후 관련 키만 무효화
+    - 다른 레플리카의 쓰기는 TTL 이내로만 반영됨
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._advertisers: TTLCache[int, FrozenSet[int]] = TTLCache(
+            maxsize=maxsize, ttl=ttl
+        )
+
+    async def get_advertiser_ids(
+        self,
+        session: AsyncSession,
+        agency_id: int,
+    ) -> FrozenSet[int]:
+        """업체에 매핑된 광고주 ID 집합"""
+        advertiser_ids = self._advertisers.get(agency_id)
+        if advertiser_ids is None:
+            repo = AgencyAdvertiserMappingRepository(session)
+            advertiser_ids = frozenset(await repo.get_advertiser_ids(agency_id))
+            self._advertisers.set(agency_id, advertiser_ids)
+        return advertiser_ids
+
+    def invalidate(self, agency_ids: Iterable[int]) -> None:
+        """매핑 쓰기 후 무효화 (변경된 매핑의 업체 ID 전달)"""
+        for agency_id in agency_ids:
+            self._advertisers.delete(agency_id)
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        self._advertisers.clear()
+
+
+_mapping_index: MappingIndex | None = None
+
+
+def get_mapping_index() -> MappingIndex:
+    """MappingIndex 싱글턴"""
+    global _mapping_index
+
+    if _mapping_index is None:
+        settings = get_settings()
+        _mapping_index = MappingIndex(
+            maxsize=settings.MAPPING_INDEX_CACHE_MAX_ENTRIES,
+            ttl=settings.MAPPING_INDEX_CACHE_TTL_SECONDS,
+        )
+    return _mapping_index
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, NamedTuple, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import get_settings
+from app.repositories.user_repository import UserRepository
+
+
+class UserProfile(NamedTuple):
+    """목록 표시용 사용자 프로필"""
+
+    name: str
+    company_name: Optional[str]
+    login_id: str
+
+
+class UserProfileCache:
+    """
+    사용자 프로필 캐시 (user_id → 이름/회사명/로그인 ID)
+
+    - 목록 조회가 업체/광고주 → 사용자 join 없이 이름을 채우도록 사용
+    - 최대 개수/TTL 제한, 같은 프로세스의 사용자 수정은 즉시 무효화
+    - 다른 레플리카의 수정은 TTL 이내로만 반영됨
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._cache: TTLCache[int, UserProfile] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    async def get_many(
+        self,
+        session: AsyncSession,
+        user_ids: Iterable[Optional[int]],
+    ) -> Dict[int, UserProfile]:
+        """
+        프로필 일괄 조회 (캐시에 없는 ID만 한 번의 쿼리로 로드)
+
+        Returns:
+            Dict[int, UserProfile]: 존재하는 사용자만 포함
+        """
+        profiles: Dict[int, UserProfile] = {}
+        missing = set()
+        for user_id in user_ids:
+            if user_id is None or user_id in profiles:
+                continue
+            profile = self._cache.get(user_id)
+            if profile is None:
+                missing.add(user_id)
+            else:
+                profiles[user_id] = profile
+
+        if missing:
+            for row in await UserRepository(session).get_profiles(list(missing)):
+                profile = UserProfile(row.name, row.company_name, row.login_id)
+                self._cache.set(row.id, profile)
+                profiles[row.id] = profile
+
+        return profiles
+
+    async def get_company_names(
+        self,
+        session: AsyncSession,
+        user_ids: Iterable[Optional[int]],
+    ) -> Dict[int, Optional[str]]:
+        """회사명 일괄 조회 (응답 표시용)"""
+        profiles = await self.get_many(session, user_ids)
+        return {user_id: profile.company_name for user_id, profile in profiles.items()}
+
+    def invalidate(self, *user_ids: int) -> None:
+        """사용자 수정/삭제 후 무효화"""
+        for user_id in user_ids:
+            self._cache.delete(user_id)
+
+    def clear(self) -> None:
+        """전체 무효화"""
+        self._cache.clear()
+
+
+_user_profile_cache: UserProfileCache | None = None
+
+
+def get_user_profile_cache() -> UserProfileCache:
+    """UserProfileCache 싱글턴"""
+    global _user_profile_cache
+
+    if _user_profile_cache is None:
+        settings = get_settings()
+        _user_profile_cache = UserProfileCache(
+            maxsize=settings.USER_PROFILE_CACHE_MAX_ENTRIES,
+            ttl=settings.USER_PROFILE_CACHE_TTL_SECONDS,
+        )
+    return _user_profile_cache
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import Tuple
+
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -15,6 +17,16 @@ class AdminDashboardService:
     def __init__(self, db_session: AsyncSession):
         self._db = db_session
 
+    async def get_dashboard_version(self) -> Tuple:
+        """
+        대시보드 버전 마커 (조건부 GET ETag 계산용, 쿼리 한 번)
+
+        - 대시보드는 사용자 테이블만 사용: 개수(가입/삭제) + 최대 updated_at(승인/반려)
+        """
+        stmt = select(func.count(User.id), func.max(User.updated_at))
+        result = await self._db.execute(stmt)
+        return tuple(result.one())
+
     async def get_dashboard(self) -> AdminDashboardResponse:
         """
         관리자 대시보드 통합 조회
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from sqlalchemy import func, select
+from typing import Tuple
+
+from sqlalchemy import and_, func, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models.advertiser import Advertiser
 from app.models.agency_advertiser_mapping import AgencyAdvertiserMapping
-from app.models.tracking import RankTracking, TrackingStatus
+from app.models.tracking import RankTracking, TrackingSessionSummary, TrackingStatus
 from app.models.work_records import BlogPosting
 from app.repositories.tracking import RankHistoryRepository
 from app.schemas.dashboard.agency import AgencyDashboardResponse, RecentTracking
@@ -19,6 +21,52 @@ class AgencyDashboardService:
         self._db = db_session
         self._history_repo = RankHistoryRepository(db_session)
 
+    async def get_dashboard_version(self, agency_id: int) -> Tuple:
+        """
+        대시보드 버전 마커 (조건부 GET ETag 계산용, 집계 서브쿼리를 묶어 쿼리 한 번)
+
+        - 매핑/추적/블로그 포스팅: 개수 + 최대 updated_at (추가/삭제/변경 반영)
+        - 순위: 현재 회차 요약의 최근 체크 시각 (배치 결과 반영)
+        """
+        mappings = (
+            select(
+                func.count(AgencyAdvertiserMapping.advertiser_id).label("count"),
+                func.max(AgencyAdvertiserMapping.updated_at).label("updated_at"),
+            )
+            .where(AgencyAdvertiserMapping.agency_id == agency_id)
+            .subquery()
+        )
+        trackings = (
+            select(
+                func.count(RankTracking.id).label("count"),
+                func.max(RankTracking.updated_at).label("updated_at"),
+                func.max(TrackingSessionSummary.last_checked_at).label("checked_at"),
+            )
+            .outerjoin(
+                TrackingSessionSummary,
+                and_(
+                    TrackingSessionSummary.tracking_id == RankTracking.id,
+                    TrackingSessionSummary.session_number == RankTracking.current_session,
+                ),
+            )
+            .where(RankTracking.agency_id == agency_id)
+            .subquery()
+        )
+        postings = (
+            select(
+                func.count(BlogPosting.id).label("count"),
+                func.max(BlogPosting.updated_at).label("updated_at"),
+            )
+            .where(BlogPosting.agency_id == agency_id)
+            .subquery()
+        )
+        # 각 서브쿼리는 항상 1행 → 조인 조건 없이 묶어 한 행으로 조회
+        stmt = select(mappings, trackings, postings).select_from(
+            mappings.join(trackings, true()).join(postings, true())
+        )
+        result = await self._db.execute(stmt)
+        return tuple(result.one())
+
     async def get_dashboard(self, agency_id: int) -> AgencyDashboardResponse:
         """
         업체 대시보드 통합 조회
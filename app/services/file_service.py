@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
+import structlog
 from fastapi import UploadFile
 
 from app.core.config import Settings
@@ -9,6 +10,8 @@ from app.core.storage.abstract_storage import AbstractStorage
 from app.models.file import File, FileType
 from app.repositories.file_repository import FileRepository
 
+logger = structlog.get_logger()
+
 
 class FileService:
     """파일 서비스"""
@@ -91,3 +94,28 @@ class FileService:
         await self._storage.delete(file.storage_path)
         await self._file_repo.delete(file)
         return True
+
+    async def delete_storage_files(self, storage_paths: List[str]) -> int:
+        """
+        스토리지 파일 일괄 삭제 (메타데이터는 이미 삭제된 경우, 백그라운드 정리용)
+
+        - 개별 실패는 로그만 남기고 계속 진행
+
+        Returns:
+            삭제된 파일 수
+        """
+        deleted = 0
+        for storage_path in storage_paths:
+            try:
+                if await self._storage.delete(storage_path):
+                    deleted += 1
+            except Exception:
+                logger.warning(
+                    "storage_file_delete_failed",
+                    storage_path=storage_path,
+                    exc_info=True,
+                )
+        logger.info(
+            "storage_files_deleted", requested=len(storage_paths), deleted=deleted
+        )
+        return deleted
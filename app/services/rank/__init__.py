@@ -1,5 +1,7 @@
+from app.services.rank.history_retention_service import RankHistoryRetentionService
 from app.services.rank.rank_service import RankService
 
 __all__ = [
     "RankService",
+    "RankHistoryRetentionService",
 ]
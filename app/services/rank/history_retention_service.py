@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import date
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import get_settings
+from app.core.timezone import kst_day_start_utc, today_kst
+from app.repositories.helpers import get_dialect_name
+from app.repositories.tracking import (
+    RankHistoryPartitionRepository,
+    RankHistoryRepository,
+    RankHistoryRollupRepository,
+)
+from app.repositories.tracking.rank_history_partition_repository import next_month
+
+logger = structlog.get_logger()
+
+
+def _add_months(month_start: date, months: int) -> date:
+    """월 시작일 기준 months개월 이동 (음수 가능)"""
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+class RankHistoryRetentionService:
+    """
+    순위 히스토리 보존 정책 서비스 (배치용)
+
+    - PostgreSQL 파티션 테이블: 미래 월 파티션 미리 생성
+      + 보존 기간이 지난 파티션을 주간 집계 후 분리/삭제
+    - 파티션이 없는 DB (SQLite 등): 보존 기간 이전 행을 주간 집계 후 삭제
+    - 집계와 원본 삭제는 같은 트랜잭션 (파티션 단위 커밋)
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self._db = db_session
+        self._history_repo = RankHistoryRepository(db_session)
+        self._rollup_repo = RankHistoryRollupRepository(db_session)
+        self._partition_repo = RankHistoryPartitionRepository(db_session)
+
+    async def run(self) -> dict:
+        """
+        파티션 생성 + 보존 기간 초과 데이터 집계/삭제
+
+        Returns:
+            dict: created_partitions, dropped_partitions, rolled_up_rows, deleted_rows
+        """
+        settings = get_settings()
+        current_month = today_kst().replace(day=1)
+        cutoff_month = _add_months(current_month, -settings.RANK_HISTORY_RETENTION_MONTHS)
+
+        result = {
+            "created_partitions": 0,
+            "dropped_partitions": 0,
+            "rolled_up_rows": 0,
+            "deleted_rows": 0,
+        }
+
+        if (
+            get_dialect_name(self._db) == "postgresql"
+            and await self._partition_repo.is_partitioned()
+        ):
+            result["created_partitions"] = await self._ensure_partitions(
+                current_month, settings.RANK_HISTORY_PARTITION_MONTHS_AHEAD
+            )
+            dropped, rolled_up = await self._retire_partitions(cutoff_month)
+            result["dropped_partitions"] = dropped
+            result["rolled_up_rows"] = rolled_up
+        else:
+            rolled_up, deleted = await self._retire_rows(cutoff_month)
+            result["rolled_up_rows"] = rolled_up
+            result["deleted_rows"] = deleted
+
+        return result
+
+    async def _ensure_partitions(self, current_month: date, months_ahead: int) -> int:
+        """
+        이번 달 ~ months_ahead개월 뒤까지 월 파티션 생성
+
+        - 월 단위 커밋, 실패한 월은 롤백 후 건너뜀 (보존 정책 처리는 계속 진행)
+        """
+        existing = set(await self._partition_repo.get_month_partitions())
+        created = 0
+
+        for offset in range(months_ahead + 1):
+            month_start = _add_months(current_month, offset)
+            if month_start in existing:
+                continue
+
+            try:
+                moved = await self._partition_repo.create_month_partition(month_start)
+                await self._db.commit()
+            except Exception:
+                await self._db.rollback()
+                logger.error(
+                    "rank_history_partition_create_failed",
+                    month=month_start.isoformat(),
+                    exc_info=True,
+                )
+                continue
+
+            created += 1
+            logger.info(
+                "rank_history_partition_created",
+                month=month_start.isoformat(),
+                moved_from_default=moved,
+            )
+
+        return created
+
+    async def _retire_partitions(self, cutoff_month: date) -> tuple[int, int]:
+        """cutoff_month 이전 월 파티션: 주간 집계 → 분리/삭제"""
+        dropped = 0
+        rolled_up = 0
+
+        for month_start in await self._partition_repo.get_month_partitions():
+            if month_start >= cutoff_month:
+                break
+
+            try:
+                rows = await self._rollup_repo.rollup_range(
+                    kst_day_start_utc(month_start),
+                    kst_day_start_utc(next_month(month_start)),
+                )
+                await self._partition_repo.drop_month_partition(month_start)
+                await self._db.commit()
+            except Exception:
+                await self._db.rollback()
+                raise
+
+            dropped += 1
+            rolled_up += rows
+            logger.info(
+                "rank_history_partition_retired",
+                month=month_start.isoformat(),
+                rollup_rows=rows,
+            )
+
+        return dropped, rolled_up
+
+    async def _retire_rows(self, cutoff_month: date) -> tuple[int, int]:
+        """cutoff_month 이전 행: 주간 집계 → 삭제 (파티션 없는 DB)"""
+        cutoff = kst_day_start_utc(cutoff_month)
+        try:
+            rolled_up = await self._rollup_repo.rollup_range(None, cutoff)
+            deleted = await self._history_repo.delete_before(cutoff)
+            await self._db.commit()
+        except Exception:
+            await self._db.rollback()
+            raise
+
+        if deleted:
+            logger.info(
+                "rank_history_rows_retired",
+                cutoff=cutoff.isoformat(),
+                rollup_rows=rolled_up,
+                deleted_rows=deleted,
+            )
+        return rolled_up, deleted
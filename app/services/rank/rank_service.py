@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from typing import List, Optional, Tuple
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import get_settings
+from app.core.timezone import now_kst, to_utc
 from app.crawler.naver import (
     extract_blog_id,
     extract_cafe_id,
@@ -14,18 +16,25 @@ from app.crawler.naver import (
     get_place_rank,
 )
 from app.models.tracking import RankHistory, RankTracking, RankType, TrackingStatus
-from app.repositories.tracking import RankHistoryRepository, RankTrackingRepository
+from app.repositories.helpers import LoadProfile
+from app.repositories.tracking import (
+    RankHistoryRepository,
+    RankTrackingRepository,
+    TrackingSessionSummaryRepository,
+)
 from app.schemas.pagination import PaginationMeta
 from app.schemas.tracking.common import (
+    HistoryView,
     RankHistoryItem,
+    RankSessionSummaryItem,
     RealtimeRankResponse,
     TrackingCreateRequest,
     TrackingCreateResponse,
     TrackingDetailResponse,
-    TrackingListItem,
     TrackingListResponse,
     TrackingStopResponse,
 )
+from app.services.cache import get_user_profile_cache
 
 
 class RankService:
@@ -35,6 +44,8 @@ class RankService:
         self._db = db_session
         self._tracking_repo = RankTrackingRepository(db_session)
         self._history_repo = RankHistoryRepository(db_session)
+        self._summary_repo = TrackingSessionSummaryRepository(db_session)
+        self._profiles = get_user_profile_cache()
 
     # === 실시간 순위 조회 ===
 
@@ -74,6 +85,7 @@ class RankService:
         agency_id: Optional[int] = None,
         advertiser_id: Optional[int] = None,
         keyword: Optional[str] = None,
+        since: Optional[datetime] = None,
         page: int = 1,
         page_size: int = 20,
     ) -> TrackingListResponse:
@@ -86,28 +98,30 @@ class RankService:
             agency_id: 업체 필터 (업체용)
             advertiser_id: 광고주 필터
             keyword: 키워드 검색
+            since: delta sync 커서 (이후 변경되거나 새 순위가 기록된 추적만)
             page: 페이지 번호 (1부터 시작)
             page_size: 페이지당 항목 수
 
         Returns:
-            TrackingListResponse: 추적 목록
+            TrackingListResponse: 추적 목록 (+ 다음 동기화 커서)
         """
+        next_cursor = self._next_sync_cursor()
         skip = (page - 1) * page_size
-        trackings = await self._tracking_repo.get_list(
+        trackings, total = await self._tracking_repo.get_list_with_total(
             rank_type=rank_type,
             status=status,
             agency_id=agency_id,
             advertiser_id=advertiser_id,
             keyword=keyword,
+            updated_since=to_utc(since) if since else None,
             skip=skip,
             limit=page_size,
+            profile=LoadProfile.LEAN,
         )
-        total = await self._tracking_repo.count(
-            rank_type=rank_type,
-            status=status,
-            agency_id=agency_id,
-            advertiser_id=advertiser_id,
-            keyword=keyword,
+        # 업체명/광고주명은 join 대신 프로필 캐시에서 채움
+        names = await self._profiles.get_company_names(
+            self._db,
+            [t.agency_id for t in trackings] + [t.advertiser_id for t in trackings],
         )
 
         # 최신 히스토리 일괄 조회 (N+1 문제 해결)
@@ -115,12 +129,18 @@ class RankService:
         latest_histories = await self._history_repo.get_latest_by_tracking_ids(
             tracking_ids
         )
+        # 현재 회차 진행률 일괄 조회
+        current_summaries = await self._summary_repo.get_current_by_trackings(trackings)
+        session_target = get_settings().SESSION_EXPOSURE_TARGET
 
+        # 항목은 dict로 모아 응답 전체를 한 번에 검증 (항목별 모델 생성 비용 제거)
+        # - FastAPI는 검증된 응답을 response_model 직렬화기로 바로 JSON 바이트로 변환
         items = []
         for tracking in trackings:
             latest_history = latest_histories.get(tracking.id)
+            current_summary = current_summaries.get(tracking.id)
 
-            item = TrackingListItem(
+            item = dict(
                 id=tracking.id,
                 type=tracking.type,
                 keyword=tracking.keyword,
@@ -128,27 +148,47 @@ class RankService:
                 status=tracking.status,
                 current_session=tracking.current_session,
                 agency_id=tracking.agency_id,
-                agency_name=(
-                    tracking.agency.user.company_name
-                    if tracking.agency and tracking.agency.user
-                    else None
-                ),
+                agency_name=names.get(tracking.agency_id),
                 advertiser_id=tracking.advertiser_id,
-                advertiser_name=(
-                    tracking.advertiser.user.company_name
-                    if tracking.advertiser and tracking.advertiser.user
-                    else None
-                ),
+                advertiser_name=names.get(tracking.advertiser_id),
                 latest_rank=latest_history.rank if latest_history else None,
                 latest_checked_at=(
                     latest_history.checked_at if latest_history else None
                 ),
+                session_exposures=(
+                    current_summary.exposure_count if current_summary else 0
+                ),
+                session_target=session_target,
                 created_at=tracking.created_at,
             )
             items.append(item)
 
         pagination = PaginationMeta.create(total=total, page=page, page_size=page_size)
-        return TrackingListResponse(items=items, total=total, pagination=pagination)
+        return TrackingListResponse.model_validate(
+            {
+                "items": items,
+                "total": total,
+                "pagination": pagination,
+                "next_cursor": next_cursor,
+            }
+        )
+
+    async def get_tracking_list_version(
+        self,
+        rank_type: RankType,
+        status: Optional[TrackingStatus] = None,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+        keyword: Optional[str] = None,
+    ) -> Tuple:
+        """추적 목록 버전 마커 (조건부 GET ETag 계산용, 집계 쿼리 한 번)"""
+        return await self._tracking_repo.get_list_version(
+            rank_type=rank_type,
+            status=status,
+            agency_id=agency_id,
+            advertiser_id=advertiser_id,
+            keyword=keyword,
+        )
 
     # === 추적 상세 ===
 
@@ -157,18 +197,36 @@ class RankService:
         tracking_id: int,
         agency_id: Optional[int] = None,
         advertiser_id: Optional[int] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        session_number: Optional[int] = None,
+        view: HistoryView = HistoryView.LIST,
+        limit: int = 100,
+        offset: int = 0,
+        since: Optional[datetime] = None,
     ) -> Optional[TrackingDetailResponse]:
         """
         추적 상세 조회
 
+        - view=list: 기간/회차 필터 + limit/offset으로 제한된 히스토리 목록
+        - view=summary: 회차별 집계(노출 수, 최고/최저/평균 순위)만 반환
+
         Args:
             tracking_id: 추적 ID
             agency_id: 업체 ID (업체 접근 시 권한 체크용)
             advertiser_id: 광고주 ID (광고주 접근 시 권한 체크용)
+            start_date: 히스토리 시작 날짜 (KST, 포함)
+            end_date: 히스토리 종료 날짜 (KST, 포함)
+            session_number: 회차 필터
+            view: 히스토리 조회 방식 (list/summary)
+            limit: 히스토리 최대 개수 (view=list)
+            offset: 히스토리 건너뛸 개수 (view=list)
+            since: delta sync 커서 (view=list, 이후 생성/갱신된 히스토리만)
 
         Returns:
             TrackingDetailResponse: 추적 상세 (없거나 권한 없으면 None)
         """
+        next_cursor = self._next_sync_cursor()
         tracking = await self._tracking_repo.get_by_id(tracking_id)
         if not tracking:
             return None
@@ -179,9 +237,65 @@ class RankService:
         if advertiser_id and tracking.advertiser_id != advertiser_id:
             return None
 
-        # 히스토리 전체 가져오기
-        histories = await self._history_repo.get_all_by_tracking_id(tracking_id)
-        history_total = len(histories)
+        range_filters = dict(
+            start_date=start_date,
+            end_date=end_date,
+            session_number=session_number,
+        )
+        # delta sync 커서는 히스토리 목록(view=list)에만 적용 (회차 집계는 항상 전체)
+        updated_since = to_utc(since) if since and view == HistoryView.LIST else None
+        history_total = await self._history_repo.count_filtered_by_tracking_id(
+            tracking_id, updated_since=updated_since, **range_filters
+        )
+
+        histories: List[RankHistoryItem] = []
+        session_summaries: List[RankSessionSummaryItem] = []
+        if view == HistoryView.SUMMARY and not (start_date or end_date):
+            # 기간 필터가 없으면 회차 요약 테이블에서 바로 조회
+            summaries = await self._summary_repo.get_by_tracking_id(
+                tracking_id, session_number=session_number
+            )
+            session_summaries = [
+                RankSessionSummaryItem.model_validate(summary) for summary in summaries
+            ]
+        elif view == HistoryView.SUMMARY:
+            rows = await self._history_repo.get_session_summaries(
+                tracking_id, **range_filters
+            )
+            session_summaries = [
+                RankSessionSummaryItem(
+                    **{
+                        **row,
+                        "avg_rank": (
+                            round(float(row["avg_rank"]), 2)
+                            if row["avg_rank"] is not None
+                            else None
+                        ),
+                    }
+                )
+                for row in rows
+            ]
+        else:
+            rows = await self._history_repo.get_filtered_by_tracking_id(
+                tracking_id,
+                updated_since=updated_since,
+                skip=offset,
+                limit=limit,
+                **range_filters,
+            )
+            histories = [
+                RankHistoryItem(
+                    id=h.id,
+                    rank=h.rank,
+                    session_number=h.session_number,
+                    checked_at=h.checked_at,
+                )
+                for h in rows
+            ]
+
+        current_summary = await self._summary_repo.get(
+            tracking.id, tracking.current_session
+        )
 
         return TrackingDetailResponse(
             id=tracking.id,
@@ -204,16 +318,41 @@ class RankService:
             ),
             created_at=tracking.created_at,
             updated_at=tracking.updated_at,
-            histories=[
-                RankHistoryItem(
-                    id=h.id,
-                    rank=h.rank,
-                    session_number=h.session_number,
-                    checked_at=h.checked_at,
-                )
-                for h in histories
-            ],
+            session_exposures=(
+                current_summary.exposure_count if current_summary else 0
+            ),
+            session_target=get_settings().SESSION_EXPOSURE_TARGET,
+            histories=histories,
             history_total=history_total,
+            session_summaries=session_summaries,
+            next_cursor=next_cursor,
+        )
+
+    async def get_tracking_detail_version(
+        self,
+        tracking_id: int,
+        agency_id: Optional[int] = None,
+        advertiser_id: Optional[int] = None,
+    ) -> Optional[Tuple]:
+        """
+        추적 상세 버전 마커 (조건부 GET ETag 계산용, 쿼리 한 번)
+
+        Returns:
+            버전 마커 (없거나 권한 없으면 None → 호출자는 일반 조회 경로로 404 처리)
+        """
+        row = await self._tracking_repo.get_detail_version(tracking_id)
+        if row is None:
+            return None
+        if agency_id and row.agency_id != agency_id:
+            return None
+        if advertiser_id and row.advertiser_id != advertiser_id:
+            return None
+        return (
+            row.version,
+            row.last_checked_at,
+            row.check_count,
+            row.agency_updated_at,
+            row.advertiser_updated_at,
         )
 
     # === 추적 등록 (Agency) ===
@@ -261,6 +400,12 @@ class RankService:
             checked_at=checked_at,
         )
         await self._history_repo.create(history)
+        await self._summary_repo.record_check(
+            tracking_id=tracking.id,
+            session_number=1,
+            rank=initial_rank,
+            checked_at=checked_at,
+        )
 
         await self._db.commit()
 
@@ -289,7 +434,9 @@ class RankService:
         Returns:
             TrackingStopResponse: 중단 결과 (없으면 None)
         """
-        tracking = await self._tracking_repo.get_by_id(tracking_id)
+        tracking = await self._tracking_repo.get_by_id(
+            tracking_id, profile=LoadProfile.LEAN
+        )
         if not tracking:
             return None
 
@@ -312,6 +459,17 @@ class RankService:
 
     # === 내부 헬퍼 메서드 ===
 
+    @staticmethod
+    def _next_sync_cursor() -> datetime:
+        """
+        다음 delta sync 커서 (조회 시작 시각 - 지연 여유)
+
+        - updated_at은 트랜잭션 시작 시각이므로 조회 시점에 아직 커밋되지 않은 행은
+          커서보다 이전 시각을 가질 수 있음 → 여유만큼 겹쳐 조회 (클라이언트는 id로 병합)
+        """
+        lag = get_settings().DELTA_SYNC_CURSOR_LAG_SECONDS
+        return now_kst() - timedelta(seconds=lag)
+
     async def _crawl_rank(
         self,
         rank_type: RankType,
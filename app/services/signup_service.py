@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.security import hash_password
+from app.core.security import hash_password_async
 from app.models.advertiser import Advertiser
 from app.models.agency import Agency
 from app.models.user import ApprovalStatus, User, UserRole
@@ -36,6 +36,9 @@ class SignupService:
         Raises:
             ValueError: 중복 ID/이메일
         """
+        # 비밀번호 해싱은 DB 연결을 잡기 전에 스레드 풀에서 실행
+        password_hash = await hash_password_async(request.password)
+
         # 1. 중복 확인
         if await self._user_repo.exists_by_login_id(request.login_id):
             raise ValueError("이미 사용 중인 아이디입니다.")
@@ -47,7 +50,7 @@ class SignupService:
         user = User(
             login_id=request.login_id,
             email=request.email,
-            password_hash=hash_password(request.password),
+            password_hash=password_hash,
             name=request.name,
             phone=request.phone,
             company_name=request.company_name,
@@ -75,6 +78,9 @@ class SignupService:
         Raises:
             ValueError: 중복 ID/이메일
         """
+        # 비밀번호 해싱은 DB 연결을 잡기 전에 스레드 풀에서 실행
+        password_hash = await hash_password_async(request.password)
+
         # 1. 중복 확인
         if await self._user_repo.exists_by_login_id(request.login_id):
             raise ValueError("이미 사용 중인 아이디입니다.")
@@ -86,7 +92,7 @@ class SignupService:
         user = User(
             login_id=request.login_id,
             email=request.email,
-            password_hash=hash_password(request.password),
+            password_hash=password_hash,
             name=request.name,
             phone=request.phone,
             company_name=request.company_name,
@@ -5,15 +5,16 @@ from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.work_records import BlogPosting
+from app.repositories.helpers import LoadProfile
 from app.repositories.work_records import BlogPostingRepository
 from app.schemas.pagination import PaginationMeta
 from app.schemas.work_records.blog_posting import (
     BlogPostingCreateRequest,
     BlogPostingDetailResponse,
-    BlogPostingListItem,
     BlogPostingListResponse,
     BlogPostingUpdateRequest,
 )
+from app.services.cache import get_user_profile_cache
 
 
 class BlogPostingService:
@@ -22,6 +23,7 @@ class BlogPostingService:
     def __init__(self, db_session: AsyncSession):
         self._db = db_session
         self._repo = BlogPostingRepository(db_session)
+        self._profiles = get_user_profile_cache()
 
     async def get_list(
         self,
@@ -30,6 +32,7 @@ class BlogPostingService:
         keyword: Optional[str] = None,
         page: int = 1,
         page_size: int = 20,
+        estimate_total: bool = False,
     ) -> BlogPostingListResponse:
         """
         블로그 포스팅 목록 조회
@@ -40,49 +43,55 @@ class BlogPostingService:
             keyword: 검색어
             page: 페이지 번호 (1부터 시작)
             page_size: 페이지당 항목 수
+            estimate_total: 필터가 없을 때 추정 전체 개수 사용 (관리자용)
 
         Returns:
             BlogPostingListResponse: 포스팅 목록
         """
         skip = (page - 1) * page_size
-        postings = await self._repo.get_list(
-            agency_id=agency_id,
-            advertiser_id=advertiser_id,
-            keyword=keyword,
-            skip=skip,
-            limit=page_size,
-        )
-        total = await self._repo.count(
-            agency_id=agency_id,
-            advertiser_id=advertiser_id,
-            keyword=keyword,
+        unfiltered = not (agency_id or advertiser_id or keyword)
+
+        # 업체명/광고주명은 join 대신 프로필 캐시에서 채움
+        if estimate_total and unfiltered:
+            postings = await self._repo.get_list(
+                skip=skip, limit=page_size, profile=LoadProfile.LEAN
+            )
+            total = await self._repo.estimate_count()
+        else:
+            postings, total = await self._repo.get_list_with_total(
+                agency_id=agency_id,
+                advertiser_id=advertiser_id,
+                keyword=keyword,
+                skip=skip,
+                limit=page_size,
+                profile=LoadProfile.LEAN,
+            )
+
+        names = await self._profiles.get_company_names(
+            self._db,
+            [p.agency_id for p in postings] + [p.advertiser_id for p in postings],
         )
 
+        # 항목은 dict로 모아 응답 전체를 한 번에 검증 (항목별 모델 생성 비용 제거)
         items = []
         for posting in postings:
-            item = BlogPostingListItem(
+            item = dict(
                 id=posting.id,
                 keyword=posting.keyword,
                 url=posting.url,
                 posting_date=posting.posting_date,
                 agency_id=posting.agency_id,
-                agency_name=(
-                    posting.agency.user.company_name
-                    if posting.agency and posting.agency.user
-                    else None
-                ),
+                agency_name=names.get(posting.agency_id),
                 advertiser_id=posting.advertiser_id,
-                advertiser_name=(
-                    posting.advertiser.user.company_name
-                    if posting.advertiser and posting.advertiser.user
-                    else None
-                ),
+                advertiser_name=names.get(posting.advertiser_id),
                 created_at=posting.created_at,
             )
             items.append(item)
 
         pagination = PaginationMeta.create(total=total, page=page, page_size=page_size)
-        return BlogPostingListResponse(items=items, total=total, pagination=pagination)
+        return BlogPostingListResponse.model_validate(
+            {"items": items, "total": total, "pagination": pagination}
+        )
 
     async def get_detail(
         self,
@@ -157,8 +166,10 @@ class BlogPostingService:
         posting = await self._repo.create(posting)
         await self._db.commit()
 
-        # 관계 정보 로드를 위해 다시 조회
-        posting = await self._repo.get_by_id(posting.id)
+        # 회사명만 조회 (관계 재조회 없이 응답 구성)
+        names = await self._profiles.get_company_names(
+            self._db, [posting.agency_id, posting.advertiser_id]
+        )
 
         return BlogPostingDetailResponse(
             id=posting.id,
@@ -166,17 +177,9 @@ class BlogPostingService:
             url=posting.url,
             posting_date=posting.posting_date,
             agency_id=posting.agency_id,
-            agency_name=(
-                posting.agency.user.company_name
-                if posting.agency and posting.agency.user
-                else None
-            ),
+            agency_name=names.get(posting.agency_id),
             advertiser_id=posting.advertiser_id,
-            advertiser_name=(
-                posting.advertiser.user.company_name
-                if posting.advertiser and posting.advertiser.user
-                else None
-            ),
+            advertiser_name=names.get(posting.advertiser_id),
             created_at=posting.created_at,
             updated_at=posting.updated_at,
         )
@@ -198,7 +201,7 @@ class BlogPostingService:
         Returns:
             BlogPostingDetailResponse: 수정된 포스팅 (없거나 권한 없으면 None)
         """
-        posting = await self._repo.get_by_id(posting_id)
+        posting = await self._repo.get_by_id(posting_id, profile=LoadProfile.LEAN)
         if not posting:
             return None
 
@@ -219,8 +222,10 @@ class BlogPostingService:
         posting = await self._repo.update(posting)
         await self._db.commit()
 
-        # 관계 정보 로드를 위해 다시 조회
-        posting = await self._repo.get_by_id(posting.id)
+        # 회사명만 조회 (관계 재조회 없이 응답 구성)
+        names = await self._profiles.get_company_names(
+            self._db, [posting.agency_id, posting.advertiser_id]
+        )
 
         return BlogPostingDetailResponse(
             id=posting.id,
@@ -228,17 +233,9 @@ class BlogPostingService:
             url=posting.url,
             posting_date=posting.posting_date,
             agency_id=posting.agency_id,
-            agency_name=(
-                posting.agency.user.company_name
-                if posting.agency and posting.agency.user
-                else None
-            ),
+            agency_name=names.get(posting.agency_id),
             advertiser_id=posting.advertiser_id,
-            advertiser_name=(
-                posting.advertiser.user.company_name
-                if posting.advertiser and posting.advertiser.user
-                else None
-            ),
+            advertiser_name=names.get(posting.advertiser_id),
             created_at=posting.created_at,
             updated_at=posting.updated_at,
         )
@@ -258,7 +255,7 @@ class BlogPostingService:
         Returns:
             bool: 삭제 성공 여부
         """
-        posting = await self._repo.get_by_id(posting_id)
+        posting = await self._repo.get_by_id(posting_id, profile=LoadProfile.LEAN)
         if not posting:
             return False
 
@@ -5,9 +5,7 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.work_records import CafeInfiltration
-from app.repositories.agency_advertiser_mapping_repository import (
-    AgencyAdvertiserMappingRepository,
-)
+from app.repositories.helpers import LoadProfile
 from app.repositories.work_records import CafeInfiltrationRepository
 from app.schemas.work_records.cafe_infiltration import (
     CafeInfiltrationCalendarResponse,
@@ -16,7 +14,7 @@ from app.schemas.work_records.cafe_infiltration import (
     CafeInfiltrationUpdateRequest,
 )
 from app.schemas.work_records.common import DailyCount
-
+from app.services.cache import get_mapping_index, get_user_profile_cache
 
 # 요일 한글 매핑
 DAY_OF_WEEK_KO = ["월", "화", "수", "목", "금", "토", "일"]
@@ -28,7 +26,8 @@ class CafeInfiltrationService:
     def __init__(self, db_session: AsyncSession):
         self._db = db_session
         self._repo = CafeInfiltrationRepository(db_session)
-        self._mapping_repo = AgencyAdvertiserMappingRepository(db_session)
+        self._mapping_index = get_mapping_index()
+        self._profiles = get_user_profile_cache()
 
     async def get_calendar_list_admin(
         self,
@@ -48,13 +47,14 @@ class CafeInfiltrationService:
         infiltrations = await self._repo.get_calendar_list(
             year=year,
             month=month,
+            profile=LoadProfile.LEAN,
         )
         daily_counts_raw = await self._repo.get_daily_counts(
             year=year,
             month=month,
         )
 
-        return self._build_response(infiltrations, daily_counts_raw)
+        return await self._build_response(infiltrations, daily_counts_raw)
 
     async def get_calendar_list_agency(
         self,
@@ -74,8 +74,9 @@ class CafeInfiltrationService:
             CafeInfiltrationCalendarResponse: 침투 목록 + daily_counts
         """
         # 매핑된 광고주 ID 조회
-        mappings = await self._mapping_repo.get_by_agency_id(agency_id)
-        advertiser_ids = [m.advertiser_id for m in mappings]
+        advertiser_ids = sorted(
+            await self._mapping_index.get_advertiser_ids(self._db, agency_id)
+        )
 
         if not advertiser_ids:
             return CafeInfiltrationCalendarResponse(items=[], total=0, daily_counts=[])
@@ -83,6 +84,7 @@ class CafeInfiltrationService:
         infiltrations = await self._repo.get_calendar_list(
             year=year,
             month=month,
+            profile=LoadProfile.LEAN,
             advertiser_ids=advertiser_ids,
         )
         daily_counts_raw = await self._repo.get_daily_counts(
@@ -91,7 +93,7 @@ class CafeInfiltrationService:
             advertiser_ids=advertiser_ids,
         )
 
-        return self._build_response(infiltrations, daily_counts_raw)
+        return await self._build_response(infiltrations, daily_counts_raw)
 
     async def get_calendar_list_advertiser(
         self,
@@ -113,6 +115,7 @@ class CafeInfiltrationService:
         infiltrations = await self._repo.get_calendar_list(
             year=year,
             month=month,
+            profile=LoadProfile.LEAN,
             advertiser_id=advertiser_id,
         )
         daily_counts_raw = await self._repo.get_daily_counts(
@@ -121,7 +124,7 @@ class CafeInfiltrationService:
             advertiser_id=advertiser_id,
         )
 
-        return self._build_response(infiltrations, daily_counts_raw)
+        return await self._build_response(infiltrations, daily_counts_raw)
 
     async def create(
         self,
@@ -147,8 +150,10 @@ class CafeInfiltrationService:
         infiltration = await self._repo.create(infiltration)
         await self._db.commit()
 
-        # 관계 정보 로드를 위해 다시 조회
-        infiltration = await self._repo.get_by_id(infiltration.id)
+        # 회사명만 조회 (관계 재조회 없이 응답 구성)
+        names = await self._profiles.get_company_names(
+            self._db, [infiltration.advertiser_id]
+        )
 
         return CafeInfiltrationListItem(
             id=infiltration.id,
@@ -158,11 +163,7 @@ class CafeInfiltrationService:
             cafe_name=infiltration.cafe_name,
             url=infiltration.url,
             advertiser_id=infiltration.advertiser_id,
-            advertiser_name=(
-                infiltration.advertiser.user.company_name
-                if infiltration.advertiser and infiltration.advertiser.user
-                else None
-            ),
+            advertiser_name=names.get(infiltration.advertiser_id),
             created_at=infiltration.created_at,
         )
 
@@ -181,7 +182,9 @@ class CafeInfiltrationService:
         Returns:
             CafeInfiltrationListItem: 수정된 침투 기록 (없으면 None)
         """
-        infiltration = await self._repo.get_by_id(infiltration_id)
+        infiltration = await self._repo.get_by_id(
+            infiltration_id, profile=LoadProfile.LEAN
+        )
         if not infiltration:
             return None
 
@@ -200,8 +203,10 @@ class CafeInfiltrationService:
         infiltration = await self._repo.update(infiltration)
         await self._db.commit()
 
-        # 관계 정보 로드를 위해 다시 조회
-        infiltration = await self._repo.get_by_id(infiltration.id)
+        # 회사명만 조회 (관계 재조회 없이 응답 구성)
+        names = await self._profiles.get_company_names(
+            self._db, [infiltration.advertiser_id]
+        )
 
         return CafeInfiltrationListItem(
             id=infiltration.id,
@@ -211,11 +216,7 @@ class CafeInfiltrationService:
             cafe_name=infiltration.cafe_name,
             url=infiltration.url,
             advertiser_id=infiltration.advertiser_id,
-            advertiser_name=(
-                infiltration.advertiser.user.company_name
-                if infiltration.advertiser and infiltration.advertiser.user
-                else None
-            ),
+            advertiser_name=names.get(infiltration.advertiser_id),
             created_at=infiltration.created_at,
         )
 
@@ -229,7 +230,9 @@ class CafeInfiltrationService:
         Returns:
             bool: 삭제 성공 여부
         """
-        infiltration = await self._repo.get_by_id(infiltration_id)
+        infiltration = await self._repo.get_by_id(
+            infiltration_id, profile=LoadProfile.LEAN
+        )
         if not infiltration:
             return False
 
@@ -237,12 +240,16 @@ class CafeInfiltrationService:
         await self._db.commit()
         return True
 
-    def _build_response(
+    async def _build_response(
         self,
         infiltrations: List[CafeInfiltration],
         daily_counts_raw: List[tuple],
     ) -> CafeInfiltrationCalendarResponse:
-        """응답 생성"""
+        """응답 생성 (광고주명은 프로필 캐시에서 채움)"""
+        names = await self._profiles.get_company_names(
+            self._db, [i.advertiser_id for i in infiltrations]
+        )
+
         items = []
         for infiltration in infiltrations:
             item = CafeInfiltrationListItem(
@@ -253,11 +260,7 @@ class CafeInfiltrationService:
                 cafe_name=infiltration.cafe_name,
                 url=infiltration.url,
                 advertiser_id=infiltration.advertiser_id,
-                advertiser_name=(
-                    infiltration.advertiser.user.company_name
-                    if infiltration.advertiser and infiltration.advertiser.user
-                    else None
-                ),
+                advertiser_name=names.get(infiltration.advertiser_id),
                 created_at=infiltration.created_at,
             )
             items.append(item)
@@ -5,9 +5,7 @@ from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.work_records import PressArticle
-from app.repositories.agency_advertiser_mapping_repository import (
-    AgencyAdvertiserMappingRepository,
-)
+from app.repositories.helpers import LoadProfile
 from app.repositories.work_records import PressArticleRepository
 from app.schemas.work_records.common import DailyCount
 from app.schemas.work_records.press_article import (
@@ -16,7 +14,7 @@ from app.schemas.work_records.press_article import (
     PressArticleListItem,
     PressArticleUpdateRequest,
 )
-
+from app.services.cache import get_mapping_index, get_user_profile_cache
 
 # 요일 한글 매핑
 DAY_OF_WEEK_KO = ["월", "화", "수", "목", "금", "토", "일"]
@@ -28,7 +26,8 @@ class PressArticleService:
     def __init__(self, db_session: AsyncSession):
         self._db = db_session
         self._repo = PressArticleRepository(db_session)
-        self._mapping_repo = AgencyAdvertiserMappingRepository(db_session)
+        self._mapping_index = get_mapping_index()
+        self._profiles = get_user_profile_cache()
 
     async def get_calendar_list_admin(
         self,
@@ -48,13 +47,14 @@ class PressArticleService:
         articles = await self._repo.get_calendar_list(
             year=year,
             month=month,
+            profile=LoadProfile.LEAN,
         )
         daily_counts_raw = await self._repo.get_daily_counts(
             year=year,
             month=month,
         )
 
-        return self._build_response(articles, daily_counts_raw)
+        return await self._build_response(articles, daily_counts_raw)
 
     async def get_calendar_list_agency(
         self,
@@ -74,8 +74,9 @@ class PressArticleService:
             PressArticleCalendarResponse: 기사 목록 + daily_counts
         """
         # 매핑된 광고주 ID 조회
-        mappings = await self._mapping_repo.get_by_agency_id(agency_id)
-        advertiser_ids = [m.advertiser_id for m in mappings]
+        advertiser_ids = sorted(
+            await self._mapping_index.get_advertiser_ids(self._db, agency_id)
+        )
 
         if not advertiser_ids:
             return PressArticleCalendarResponse(items=[], total=0, daily_counts=[])
@@ -83,6 +84,7 @@ class PressArticleService:
         articles = await self._repo.get_calendar_list(
             year=year,
             month=month,
+            profile=LoadProfile.LEAN,
             advertiser_ids=advertiser_ids,
         )
         daily_counts_raw = await self._repo.get_daily_counts(
@@ -91,7 +93,7 @@ class PressArticleService:
             advertiser_ids=advertiser_ids,
         )
 
-        return self._build_response(articles, daily_counts_raw)
+        return await self._build_response(articles, daily_counts_raw)
 
     async def get_calendar_list_advertiser(
         self,
@@ -113,6 +115,7 @@ class PressArticleService:
         articles = await self._repo.get_calendar_list(
             year=year,
             month=month,
+            profile=LoadProfile.LEAN,
             advertiser_id=advertiser_id,
         )
         daily_counts_raw = await self._repo.get_daily_counts(
@@ -121,7 +124,7 @@ class PressArticleService:
             advertiser_id=advertiser_id,
         )
 
-        return self._build_response(articles, daily_counts_raw)
+        return await self._build_response(articles, daily_counts_raw)
 
     async def create(
         self,
@@ -146,8 +149,10 @@ class PressArticleService:
         article = await self._repo.create(article)
         await self._db.commit()
 
-        # 관계 정보 로드를 위해 다시 조회
-        article = await self._repo.get_by_id(article.id)
+        # 회사명만 조회 (관계 재조회 없이 응답 구성)
+        names = await self._profiles.get_company_names(
+            self._db, [article.advertiser_id]
+        )
 
         return PressArticleListItem(
             id=article.id,
@@ -156,11 +161,7 @@ class PressArticleService:
             content=article.content,
             url=article.url,
             advertiser_id=article.advertiser_id,
-            advertiser_name=(
-                article.advertiser.user.company_name
-                if article.advertiser and article.advertiser.user
-                else None
-            ),
+            advertiser_name=names.get(article.advertiser_id),
             created_at=article.created_at,
         )
 
@@ -179,7 +180,7 @@ class PressArticleService:
         Returns:
             PressArticleListItem: 수정된 기사 (없으면 None)
         """
-        article = await self._repo.get_by_id(article_id)
+        article = await self._repo.get_by_id(article_id, profile=LoadProfile.LEAN)
         if not article:
             return None
 
@@ -196,8 +197,10 @@ class PressArticleService:
         article = await self._repo.update(article)
         await self._db.commit()
 
-        # 관계 정보 로드를 위해 다시 조회
-        article = await self._repo.get_by_id(article.id)
+        # 회사명만 조회 (관계 재조회 없이 응답 구성)
+        names = await self._profiles.get_company_names(
+            self._db, [article.advertiser_id]
+        )
 
         return PressArticleListItem(
             id=article.id,
@@ -206,11 +209,7 @@ class PressArticleService:
             content=article.content,
             url=article.url,
             advertiser_id=article.advertiser_id,
-            advertiser_name=(
-                article.advertiser.user.company_name
-                if article.advertiser and article.advertiser.user
-                else None
-            ),
+            advertiser_name=names.get(article.advertiser_id),
             created_at=article.created_at,
         )
 
@@ -224,7 +223,7 @@ class PressArticleService:
         Returns:
             bool: 삭제 성공 여부
         """
-        article = await self._repo.get_by_id(article_id)
+        article = await self._repo.get_by_id(article_id, profile=LoadProfile.LEAN)
         if not article:
             return False
 
@@ -232,12 +231,16 @@ class PressArticleService:
         await self._db.commit()
         return True
 
-    def _build_response(
+    async def _build_response(
         self,
         articles: List[PressArticle],
         daily_counts_raw: List[tuple],
     ) -> PressArticleCalendarResponse:
-        """응답 생성"""
+        """응답 생성 (광고주명은 프로필 캐시에서 채움)"""
+        names = await self._profiles.get_company_names(
+            self._db, [article.advertiser_id for article in articles]
+        )
+
         items = []
         for article in articles:
             item = PressArticleListItem(
@@ -247,11 +250,7 @@ class PressArticleService:
                 content=article.content,
                 url=article.url,
                 advertiser_id=article.advertiser_id,
-                advertiser_name=(
-                    article.advertiser.user.company_name
-                    if article.advertiser and article.advertiser.user
-                    else None
-                ),
+                advertiser_name=names.get(article.advertiser_id),
                 created_at=article.created_at,
             )
             items.append(item)
@@ -77,4 +77,11 @@ celery_app.conf.beat_schedule = {
             minute=settings.CRAWL_SCHEDULE_MINUTE,
         ),
     },
+    "maintain-rank-histories": {
+        "task": "app.tasks.rank_tasks.maintain_rank_histories",
+        "schedule": crontab(
+            hour=settings.RANK_HISTORY_MAINTENANCE_HOUR,
+            minute=settings.RANK_HISTORY_MAINTENANCE_MINUTE,
+        ),
+    },
 }
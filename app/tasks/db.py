@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+import structlog
+from celery import signals
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import QueuePool
+
+from app.core.config import DatabaseType, get_settings
+from app.core.timezone import _set_timezone
+
+logger = structlog.get_logger()
+
+T = TypeVar("T")
+
+# 워커 프로세스 단위 싱글턴 (fork 이후 worker_process_init에서 생성)
+_loop: asyncio.AbstractEventLoop | None = None
+_engine: AsyncEngine | None = None
+_engine_loop: asyncio.AbstractEventLoop | None = None
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def _create_engine() -> None:
+    """워커용 비동기 엔진/세션 팩토리 생성 (연결은 첫 사용 시 생성)"""
+    global _engine, _session_factory
+
+    settings = get_settings()
+    _engine = create_async_engine(
+        settings.database_url,
+        pool_pre_ping=True,
+        pool_size=settings.CELERY_DB_POOL_SIZE,
+        max_overflow=settings.CELERY_DB_MAX_OVERFLOW,
+    )
+    if settings.DB_TYPE == DatabaseType.POSTGRESQL:
+        event.listen(_engine.sync_engine, "connect", _set_timezone)
+
+    _session_factory = async_sessionmaker(
+        bind=_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+def get_event_loop() -> asyncio.AbstractEventLoop:
+    """워커 프로세스 수명 동안 유지되는 이벤트 루프"""
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    태스크의 async 로직을 워커 이벤트 루프에서 실행
+
+    태스크마다 asyncio.run()으로 새 루프를 만들면 풀의 연결(루프에 묶임)을
+    재사용할 수 없으므로 워커 루프 하나를 계속 사용
+    """
+    return get_event_loop().run_until_complete(coro)
+
+
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    워커 공용 세션 팩토리 (실행 중인 이벤트 루프 안에서 호출)
+
+    - 엔진이 없으면 생성 (solo/threads 풀처럼 worker_process_init이 없는 경우)
+    - 다른 루프에서 만든 연결은 쓸 수 없으므로 루프가 바뀌면 풀을 교체
+    """
+    global _engine_loop
+
+    loop = asyncio.get_running_loop()
+    if _engine is None:
+        _create_engine()
+    elif _engine_loop is not None and _engine_loop is not loop:
+        # 이전 루프의 연결은 닫을 수 없으므로 닫지 않고 버림
+        _engine.sync_engine.dispose(close=False)
+        logger.warning("task_db_pool_rebound")
+    _engine_loop = loop
+    return _session_factory
+
+
+def pool_stats() -> dict:
+    """워커 엔진 커넥션 풀 상태 (로그/모니터링용)"""
+    if _engine is None:
+        return {"initialized": False}
+
+    pool = _engine.sync_engine.pool
+    if isinstance(pool, QueuePool):
+        return {
+            "initialized": True,
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            "overflow": pool.overflow(),
+        }
+    return {"initialized": True, "status": pool.status()}
+
+
+async def dispose_engine() -> None:
+    """워커 엔진 종료 (풀의 연결 모두 닫기)"""
+    global _engine, _engine_loop, _session_factory
+
+    if _engine is None:
+        return
+
+    await _engine.dispose()
+    _engine = None
+    _engine_loop = None
+    _session_factory = None
+
+
+@signals.worker_process_init.connect
+def on_worker_process_init(**kwargs) -> None:
+    """워커 프로세스 시작 (fork 이후): 이벤트 루프/엔진 생성"""
+    get_event_loop()
+    _create_engine()
+    logger.info("task_db_engine_created")
+
+
+@signals.worker_process_shutdown.connect
+@signals.worker_shutdown.connect
+def on_worker_shutdown(**kwargs) -> None:
+    """워커 종료: 엔진 정리 후 이벤트 루프 종료"""
+    global _loop
+
+    if _loop is None or _loop.is_closed():
+        return
+
+    stats = pool_stats()
+    _loop.run_until_complete(dispose_engine())
+    _loop.close()
+    _loop = None
+    logger.info("task_db_engine_disposed", **stats)
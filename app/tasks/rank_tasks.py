@@ -5,11 +5,10 @@ import time
 from datetime import datetime, timezone
 
 import structlog
-from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import get_settings
-from app.core.timezone import _set_timezone
 from app.crawler.browser_pool import BrowserPool
 from app.crawler.naver import (
     extract_blog_id,
@@ -19,165 +18,268 @@ from app.crawler.naver import (
     get_cafe_rank,
     get_place_rank,
 )
-from app.models.tracking import RankHistory, RankTracking, RankType, TrackingStatus
+from app.models.tracking import RankHistory, RankType
 from app.repositories.tracking.rank_history_repository import RankHistoryRepository
 from app.repositories.tracking.rank_tracking_repository import RankTrackingRepository
+from app.repositories.tracking.tracking_session_summary_repository import (
+    TrackingSessionSummaryRepository,
+)
+from app.services.rank.history_retention_service import RankHistoryRetentionService
 from app.tasks.celery_app import celery_app
+from app.tasks.db import get_session_factory, pool_stats, run_async
 
 logger = structlog.get_logger()
 
 
-def _create_session_factory() -> async_sessionmaker[AsyncSession]:
-    """Celery 태스크용 비동기 DB 세션 팩토리 생성"""
-    settings = get_settings()
-    engine = create_async_engine(
-        settings.database_url,
-        pool_pre_ping=True,
-        pool_size=5,
-        max_overflow=10,
-    )
-    event.listen(engine.sync_engine, "connect", _set_timezone)
-    return async_sessionmaker(
-        bind=engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-        autocommit=False,
-        autoflush=False,
-    )
-
-
-async def _crawl_single_tracking(
-    tracking: RankTracking,
-    session: AsyncSession,
-) -> bool:
+async def _crawl_tracking_rank(tracking: Row) -> tuple[bool, int | None]:
     """
-    단일 추적 항목 크롤링 및 히스토리 저장
+    단일 추적 항목 순위 크롤링 (DB 접근 없음)
+
+    Args:
+        tracking: 배치용 추적 행 (id, type, keyword, url, current_session)
 
     Returns:
-        True: 성공, False: 실패
+        (성공 여부, 순위) - URL이 잘못된 경우 (False, None)
     """
-    history_repo = RankHistoryRepository(session)
-    tracking_repo = RankTrackingRepository(session)
-
-    # type별 크롤링
-    rank: int | None = None
-
     if tracking.type == RankType.PLACE:
         place_id = extract_place_id(tracking.url)
         if not place_id:
             logger.error("invalid_url", tracking_id=tracking.id, url=tracking.url)
-            return False
-        rank = await get_place_rank(tracking.keyword, place_id)
+            return False, None
+        return True, await get_place_rank(tracking.keyword, place_id)
 
     elif tracking.type == RankType.BLOG:
         blog_info = extract_blog_id(tracking.url)
         if not blog_info:
             logger.error("invalid_url", tracking_id=tracking.id, url=tracking.url)
-            return False
+            return False, None
         blog_id, log_no = blog_info
-        rank = await get_blog_rank(tracking.keyword, blog_id, log_no)
+        return True, await get_blog_rank(tracking.keyword, blog_id, log_no)
 
     elif tracking.type == RankType.CAFE:
         cafe_info = extract_cafe_id(tracking.url)
         if not cafe_info:
             logger.error("invalid_url", tracking_id=tracking.id, url=tracking.url)
-            return False
+            return False, None
         cafe_id, article_id = cafe_info
-        rank = await get_cafe_rank(tracking.keyword, cafe_id, article_id)
+        return True, await get_cafe_rank(tracking.keyword, cafe_id, article_id)
+
+    return True, None
+
+
+async def _save_tracking_result(
+    tracking: Row,
+    rank: int | None,
+    checked_at: datetime,
+    session: AsyncSession,
+) -> None:
+    """
+    크롤링 결과 1건 저장 (히스토리, 회차 요약, 회차 전환)
+
+    Args:
+        tracking: 배치용 추적 행
+        rank: 크롤링 순위 (미노출 시 None)
+        checked_at: 크롤링 시각
+        session: 쓰기 세션 (커밋은 호출자가 담당)
+    """
+    history_repo = RankHistoryRepository(session)
+    tracking_repo = RankTrackingRepository(session)
+    summary_repo = TrackingSessionSummaryRepository(session)
 
-    # 오늘자 히스토리가 있으면 업데이트, 없으면 생성
+    # 오늘자 히스토리가 있으면 업데이트, 없으면 생성 (회차 요약도 함께 갱신)
     existing_history = await history_repo.get_today_by_tracking_id(
         tracking_id=tracking.id,
         session_number=tracking.current_session,
     )
     if existing_history:
         existing_history.rank = rank
-        existing_history.checked_at = datetime.now(timezone.utc)
+        existing_history.checked_at = checked_at
         await session.flush()
+        # 기존 순위가 바뀌므로 해당 회차만 재계산
+        await summary_repo.rebuild(tracking.id, tracking.current_session)
+        summary = await summary_repo.get(tracking.id, tracking.current_session)
+        exposed_count = summary.exposure_count if summary else 0
     else:
         history = RankHistory(
             tracking_id=tracking.id,
             rank=rank,
             session_number=tracking.current_session,
-            checked_at=datetime.now(timezone.utc),
+            checked_at=checked_at,
         )
         await history_repo.create(history)
-
-    # 회차 전환 체크: rank != null인 히스토리가 25개 이상이면 다음 회차
-    exposed_count = await history_repo.count_exposures_in_session(
-        tracking_id=tracking.id,
-        session_number=tracking.current_session,
-    )
-    if exposed_count >= 25:
-        tracking.current_session += 1
-        await tracking_repo.update(tracking)
-        logger.info(
-            "session_advanced",
+        exposed_count = await summary_repo.record_check(
             tracking_id=tracking.id,
-            new_session=tracking.current_session,
+            session_number=tracking.current_session,
+            rank=rank,
+            checked_at=checked_at,
         )
 
+    # 회차 전환 체크: 회차 노출 횟수가 기준 이상이면 다음 회차
+    session_number = tracking.current_session
+    if exposed_count >= get_settings().SESSION_EXPOSURE_TARGET:
+        if await tracking_repo.advance_session(tracking.id, tracking.current_session):
+            session_number += 1
+            logger.info(
+                "session_advanced",
+                tracking_id=tracking.id,
+                new_session=session_number,
+            )
+
     logger.info(
         "tracking_crawled",
         tracking_id=tracking.id,
         keyword=tracking.keyword,
         type=tracking.type.value,
         rank=rank,
-        session_number=tracking.current_session,
+        session_number=session_number,
     )
-    return True
+
+
+class _BufferedResultWriter:
+    """
+    배치 크롤링 결과 버퍼
+
+    - 결과를 메모리에 모았다가 chunk_size마다 짧은 트랜잭션 하나로 저장/커밋
+    - 크롤링(네트워크 대기) 동안에는 DB 연결/트랜잭션을 잡지 않음
+    - 결과마다 SAVEPOINT: 한 건 저장 실패 시 그 건만 롤백 (같은 청크의 나머지는 커밋)
+    - 저장 직전 활성 상태 재확인: 청크 조회 후 중단/삭제된 추적은 건너뜀
+    """
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        chunk_size: int,
+    ):
+        self._session_factory = session_factory
+        self._chunk_size = chunk_size
+        self._buffer: list[tuple[Row, int | None, datetime]] = []
+        self.saved = 0
+        self.failed = 0
+        self.skipped = 0
+
+    async def add(self, tracking: Row, rank: int | None, checked_at: datetime) -> None:
+        """결과 추가 (버퍼가 차면 저장)"""
+        self._buffer.append((tracking, rank, checked_at))
+        if len(self._buffer) >= self._chunk_size:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """버퍼의 결과를 한 트랜잭션으로 저장 후 커밋"""
+        if not self._buffer:
+            return
+
+        chunk, self._buffer = self._buffer, []
+        saved = failed = skipped = 0
+        async with self._session_factory() as session:
+            try:
+                active_ids = await RankTrackingRepository(session).get_active_ids(
+                    [tracking.id for tracking, _, _ in chunk]
+                )
+                for tracking, rank, checked_at in chunk:
+                    if tracking.id not in active_ids:
+                        skipped += 1
+                        logger.info("tracking_result_skipped", tracking_id=tracking.id)
+                        continue
+
+                    try:
+                        async with session.begin_nested():
+                            await _save_tracking_result(tracking, rank, checked_at, session)
+                    except Exception:
+                        failed += 1
+                        logger.error(
+                            "tracking_result_save_failed",
+                            tracking_id=tracking.id,
+                            exc_info=True,
+                        )
+                        continue
+                    saved += 1
+
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                self.failed += len(chunk) - skipped
+                self.skipped += skipped
+                logger.error(
+                    "batch_chunk_save_failed",
+                    tracking_ids=[tracking.id for tracking, _, _ in chunk],
+                    exc_info=True,
+                )
+                return
+
+        self.saved += saved
+        self.failed += failed
+        self.skipped += skipped
+        logger.info(
+            "batch_chunk_committed",
+            size=len(chunk),
+            saved=saved,
+            failed=failed,
+            skipped=skipped,
+            saved_total=self.saved,
+        )
 
 
 async def _crawl_all() -> dict:
     """모든 활성 추적 항목 크롤링 (async 메인 로직)"""
     settings = get_settings()
-    session_factory = _create_session_factory()
+    session_factory = get_session_factory()
+    chunk_size = settings.CRAWL_COMMIT_CHUNK_SIZE
+    writer = _BufferedResultWriter(session_factory, chunk_size)
 
     total = 0
-    success = 0
-    fail = 0
+    crawl_fail = 0
 
-    async with session_factory() as session:
-        try:
-            tracking_repo = RankTrackingRepository(session)
-
-            for rank_type in RankType:
-                trackings = await tracking_repo.get_active_trackings_by_type(rank_type)
-                logger.info(
-                    "batch_type_start",
-                    rank_type=rank_type.value,
-                    count=len(trackings),
+    try:
+        for rank_type in RankType:
+            async with session_factory() as session:
+                count = await RankTrackingRepository(session).count_active_by_type(
+                    rank_type
                 )
+            logger.info("batch_type_start", rank_type=rank_type.value, count=count)
+
+            # 키셋 청크 단위로 대상 조회 (조회 세션은 청크마다 바로 반납)
+            after_id = 0
+            while True:
+                async with session_factory() as session:
+                    trackings = await RankTrackingRepository(session).get_active_chunk(
+                        rank_type, after_id=after_id, limit=chunk_size
+                    )
+                if not trackings:
+                    break
+                after_id = trackings[-1].id
 
                 for tracking in trackings:
                     total += 1
                     try:
-                        ok = await _crawl_single_tracking(tracking, session)
-                        if ok:
-                            success += 1
-                        else:
-                            fail += 1
+                        ok, rank = await _crawl_tracking_rank(tracking)
                     except Exception:
-                        fail += 1
+                        ok, rank = False, None
                         logger.error(
                             "tracking_crawl_failed",
                             tracking_id=tracking.id,
                             exc_info=True,
                         )
 
+                    if ok:
+                        await writer.add(tracking, rank, datetime.now(timezone.utc))
+                    else:
+                        crawl_fail += 1
+
                     # 크롤링 간 딜레이
                     await asyncio.sleep(settings.CRAWL_DELAY_SECONDS)
 
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            # 브라우저 풀 정리
-            if BrowserPool.is_initialized():
-                await BrowserPool.close()
+        await writer.flush()
+    finally:
+        # 브라우저 풀 정리
+        if BrowserPool.is_initialized():
+            await BrowserPool.close()
 
-    return {"total": total, "success": success, "fail": fail}
+    return {
+        "total": total,
+        "success": writer.saved,
+        "fail": crawl_fail + writer.failed,
+        "skipped": writer.skipped,
+    }
 
 
 @celery_app.task(name="app.tasks.rank_tasks.crawl_all_active_trackings")
@@ -185,12 +287,12 @@ def crawl_all_active_trackings() -> dict:
     """
     모든 활성 추적 항목 크롤링 (Celery 태스크)
 
-    Celery는 동기 환경이므로 asyncio.run()으로 async 코드 실행
+    Celery는 동기 환경이므로 워커 이벤트 루프에서 async 코드 실행
     """
     logger.info("batch_start")
     start_time = time.time()
 
-    result = asyncio.run(_crawl_all())
+    result = run_async(_crawl_all())
 
     elapsed = round(time.time() - start_time, 1)
     logger.info(
@@ -198,6 +300,39 @@ def crawl_all_active_trackings() -> dict:
         total=result["total"],
         success=result["success"],
         fail=result["fail"],
+        skipped=result["skipped"],
+        elapsed_seconds=elapsed,
+        pool=pool_stats(),
+    )
+    return result
+
+
+async def _maintain_histories() -> dict:
+    """순위 히스토리 파티션/보존 정책 실행 (async 메인 로직)"""
+    session_factory = get_session_factory()
+
+    async with session_factory() as session:
+        return await RankHistoryRetentionService(session).run()
+
+
+@celery_app.task(name="app.tasks.rank_tasks.maintain_rank_histories")
+def maintain_rank_histories() -> dict:
+    """
+    순위 히스토리 유지보수 (Celery 태스크)
+
+    - 미래 월 파티션 생성
+    - 보존 기간이 지난 히스토리를 주간 집계 후 분리/삭제
+    """
+    logger.info("history_maintenance_start")
+    start_time = time.time()
+
+    result = run_async(_maintain_histories())
+
+    elapsed = round(time.time() - start_time, 1)
+    logger.info(
+        "history_maintenance_complete",
         elapsed_seconds=elapsed,
+        pool=pool_stats(),
+        **result,
     )
     return result
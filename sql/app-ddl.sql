@@ -7,9 +7,19 @@
 --   - ENUM: PostgreSQL 네이티브 ENUM 타입 사용
 --   - JSONB: agencies.categories는 JSONB (인덱싱 가능)
 --   - updated_at: 트리거로 자동 갱신
+--   - 목록 키워드 검색: pg_trgm GIN 인덱스 (ILIKE '%검색어%' 인덱스 처리)
+--   - 기존 DB 업그레이드: sql/migrations/ (번호 순서로 실행)
 -- =============================================================================
 
 
+-- =============================================================================
+-- 확장
+-- =============================================================================
+
+-- 목록 키워드/URL/회사명 부분 일치 검색용 trigram 인덱스
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+
 -- =============================================================================
 -- ENUM 타입
 -- =============================================================================
@@ -109,6 +119,8 @@ CREATE TABLE users (
 -- (모델의 index=True 반영)
 CREATE INDEX idx_users_login_id ON users (login_id);
 CREATE INDEX idx_users_email    ON users (email);
+-- 목록 검색 (광고주명/업체명 부분 일치)
+CREATE INDEX idx_users_company_name_trgm ON users USING gin (company_name gin_trgm_ops);
 
 CREATE TRIGGER trg_users_updated_at
     BEFORE UPDATE ON users
@@ -188,6 +200,7 @@ COMMENT ON COLUMN agency_advertiser_mappings.advertiser_id IS 'ref: advertisers.
 
 -- -----------------------------------------------------------------------------
 -- rank_trackings: 순위 추적 설정
+--   - 변경 카운터(version) 도입 전에 설치된 DB는 sql/migrations/004_rank_trackings_version.sql로 추가
 -- -----------------------------------------------------------------------------
 CREATE TABLE rank_trackings (
     id              BIGSERIAL       PRIMARY KEY,
@@ -198,6 +211,7 @@ CREATE TABLE rank_trackings (
     url             TEXT            NOT NULL,              -- 추적 URL
     status          tracking_status NOT NULL DEFAULT 'ACTIVE', -- 추적 상태
     current_session INT             NOT NULL DEFAULT 1,    -- 현재 회차 (배치 로직 상태값)
+    version         INT             NOT NULL DEFAULT 1,    -- 변경 카운터 (UPDATE마다 +1)
     created_at      TIMESTAMPTZ     NOT NULL DEFAULT NOW(),
     updated_at      TIMESTAMPTZ     NOT NULL DEFAULT NOW()
 );
@@ -206,6 +220,11 @@ CREATE INDEX idx_rank_trackings_type          ON rank_trackings (type);
 CREATE INDEX idx_rank_trackings_agency_id     ON rank_trackings (agency_id);
 CREATE INDEX idx_rank_trackings_advertiser_id ON rank_trackings (advertiser_id);
 CREATE INDEX idx_rank_trackings_status        ON rank_trackings (status);
+-- delta sync (since 커서 이후 변경된 추적)
+CREATE INDEX idx_rank_trackings_updated_at    ON rank_trackings (updated_at);
+-- 목록 검색 (키워드/URL 부분 일치)
+CREATE INDEX idx_rank_trackings_keyword_trgm  ON rank_trackings USING gin (keyword gin_trgm_ops);
+CREATE INDEX idx_rank_trackings_url_trgm      ON rank_trackings USING gin (url gin_trgm_ops);
 
 CREATE TRIGGER trg_rank_trackings_updated_at
     BEFORE UPDATE ON rank_trackings
@@ -216,26 +235,116 @@ COMMENT ON COLUMN rank_trackings.type IS 'ref: rank_type ENUM — place: 플레
 COMMENT ON COLUMN rank_trackings.agency_id IS 'ref: agencies.id';
 COMMENT ON COLUMN rank_trackings.advertiser_id IS 'ref: advertisers.id';
 COMMENT ON COLUMN rank_trackings.current_session IS '현재 회차 번호 (배치 상태값). 크롤러가 관리';
+COMMENT ON COLUMN rank_trackings.version IS '변경 카운터. 앱이 UPDATE마다 +1 (조건부 GET ETag 버전 마커)';
 
 
 -- -----------------------------------------------------------------------------
--- rank_histories: 순위 추적 결과 히스토리 (TimestampMixin 없음)
+-- rank_histories: 순위 추적 결과 히스토리 (TimestampMixin 없음, updated_at만 보유)
+--   - checked_at 기준 월 단위 범위 파티션 (KST 월 경계, rank_histories_YYYYMM)
+--   - 미래 파티션 생성 / 보존 기간 초과 파티션 집계·분리는 배치
+--     (app.tasks.rank_tasks.maintain_rank_histories)가 담당
+--   - 파티션 키를 포함해야 하므로 PK는 (id, checked_at)
+--   - 파티셔닝 이전에 설치된 DB는 sql/migrations/001_partition_rank_histories.sql로 전환
+--   - updated_at(delta sync) 도입 전에 설치된 DB는 sql/migrations/003_delta_sync_updated_at.sql로 추가
 -- -----------------------------------------------------------------------------
 CREATE TABLE rank_histories (
-    id             BIGSERIAL   PRIMARY KEY,
+    id             BIGSERIAL   NOT NULL,
     tracking_id    BIGINT      NOT NULL,                   -- ref: rank_trackings.id
     rank           INT         NULL,                       -- 순위 (NULL = 해당 회차 미노출)
     session_number INT         NOT NULL DEFAULT 1,         -- 회차 번호
-    checked_at     TIMESTAMPTZ NOT NULL                    -- 체크 일시 (크롤러가 기록)
-);
-
+    checked_at     TIMESTAMPTZ NOT NULL,                   -- 체크 일시 (크롤러가 기록)
+    updated_at     TIMESTAMPTZ NOT NULL DEFAULT NOW(),     -- 변경 일시 (delta sync 커서 기준)
+    PRIMARY KEY (id, checked_at)
+) PARTITION BY RANGE (checked_at);
+
+-- 월 파티션이 없는 범위의 행을 받는 기본 파티션 (배치가 파티션을 미리 만들므로 평소엔 비어 있음)
+CREATE TABLE rank_histories_default PARTITION OF rank_histories DEFAULT;
+
+-- 이번 달 + 3개월(RANK_HISTORY_PARTITION_MONTHS_AHEAD) 월 파티션 미리 생성
+-- (설치 직후 첫 유지보수 배치 전에 들어오는 행이 DEFAULT 파티션에 쌓이지 않도록)
+DO $$
+DECLARE
+    month_start DATE := date_trunc('month', NOW() AT TIME ZONE 'Asia/Seoul')::DATE;
+BEGIN
+    FOR i IN 0..3 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF rank_histories FOR VALUES FROM (%L) TO (%L)',
+            'rank_histories_' || to_char(month_start + make_interval(months => i), 'YYYYMM'),
+            to_char(month_start + make_interval(months => i), 'YYYY-MM-DD') || ' 00:00:00+09',
+            to_char(month_start + make_interval(months => i + 1), 'YYYY-MM-DD') || ' 00:00:00+09'
+        );
+    END LOOP;
+END $$;
+
+-- 파티션별 인덱스로 생성됨
 CREATE INDEX idx_rank_histories_tracking_id ON rank_histories (tracking_id);
+-- 최신 순위 / 오늘자 히스토리 조회
+CREATE INDEX idx_rank_histories_tracking_id_checked_at ON rank_histories (tracking_id, checked_at DESC);
+-- delta sync (추적별 since 커서 이후 변경된 히스토리)
+CREATE INDEX idx_rank_histories_tracking_id_updated_at ON rank_histories (tracking_id, updated_at);
+
+-- 같은 날 재크롤링으로 갱신 시 updated_at 갱신 (파티션 테이블 행 트리거, PostgreSQL 13+)
+CREATE TRIGGER trg_rank_histories_updated_at
+    BEFORE UPDATE ON rank_histories
+    FOR EACH ROW EXECUTE FUNCTION trigger_set_updated_at();
 
-COMMENT ON TABLE rank_histories IS '일일 크롤링 순위 결과. created_at/updated_at 없음';
+COMMENT ON TABLE rank_histories IS '일일 크롤링 순위 결과 (checked_at 월 파티션). created_at 없음';
 COMMENT ON COLUMN rank_histories.tracking_id IS 'ref: rank_trackings.id';
 COMMENT ON COLUMN rank_histories.rank IS '순위. NULL이면 해당 회차에서 미노출';
 COMMENT ON COLUMN rank_histories.session_number IS '회차 번호 (rank_trackings.current_session 기준)';
-COMMENT ON COLUMN rank_histories.checked_at IS '크롤러가 순위를 확인한 일시';
+COMMENT ON COLUMN rank_histories.checked_at IS '크롤러가 순위를 확인한 일시 (파티션 키)';
+COMMENT ON COLUMN rank_histories.updated_at IS '행 생성/갱신 일시. delta sync(since 커서) 기준';
+
+
+-- -----------------------------------------------------------------------------
+-- tracking_session_summaries: 추적 회차별 요약 (히스토리 저장 시 증분 갱신)
+--   - 요약 도입 전에 설치된 DB는 sql/migrations/002_backfill_tracking_session_summaries.sql로 백필
+--   - updated_at(delta sync)은 sql/migrations/003_delta_sync_updated_at.sql로 추가
+-- -----------------------------------------------------------------------------
+CREATE TABLE tracking_session_summaries (
+    tracking_id      BIGINT      NOT NULL,                 -- ref: rank_trackings.id
+    session_number   INT         NOT NULL,                 -- 회차 번호
+    check_count      INT         NOT NULL DEFAULT 0,       -- 체크 횟수
+    exposure_count   INT         NOT NULL DEFAULT 0,       -- 노출 횟수 (회차 전환 기준)
+    best_rank        INT         NULL,                     -- 최고 순위
+    worst_rank       INT         NULL,                     -- 최저 순위
+    rank_sum         INT         NOT NULL DEFAULT 0,       -- 순위 합계 (평균 = rank_sum / exposure_count)
+    first_checked_at TIMESTAMPTZ NOT NULL,                 -- 회차 첫 체크 일시
+    last_checked_at  TIMESTAMPTZ NOT NULL,                 -- 회차 마지막 체크 일시
+    updated_at       TIMESTAMPTZ NOT NULL DEFAULT NOW(),   -- 변경 일시 (upsert/재계산)
+    PRIMARY KEY (tracking_id, session_number)
+);
+
+-- 목록 delta sync (since 커서 이후 새 순위가 기록된 추적)
+CREATE INDEX idx_tracking_session_summaries_updated_at ON tracking_session_summaries (updated_at);
+
+CREATE TRIGGER trg_tracking_session_summaries_updated_at
+    BEFORE UPDATE ON tracking_session_summaries
+    FOR EACH ROW EXECUTE FUNCTION trigger_set_updated_at();
+
+COMMENT ON TABLE tracking_session_summaries IS '회차별 노출/순위 요약. 배치·추적 등록 시 upsert로 갱신, 회차 전환과 진행률 표시에 사용';
+COMMENT ON COLUMN tracking_session_summaries.tracking_id IS 'ref: rank_trackings.id';
+COMMENT ON COLUMN tracking_session_summaries.exposure_count IS 'SESSION_EXPOSURE_TARGET(기본 25) 이상이면 다음 회차로 전환';
+
+
+-- -----------------------------------------------------------------------------
+-- rank_history_rollups: 보존 기간이 지난 순위 히스토리의 주간 집계
+-- -----------------------------------------------------------------------------
+CREATE TABLE rank_history_rollups (
+    tracking_id    BIGINT NOT NULL,                        -- ref: rank_trackings.id
+    session_number INT    NOT NULL,                        -- 회차 번호
+    period_start   DATE   NOT NULL,                        -- 주 시작일 (KST 월요일)
+    check_count    INT    NOT NULL DEFAULT 0,              -- 체크 횟수
+    exposure_count INT    NOT NULL DEFAULT 0,              -- 노출 횟수 (rank NOT NULL)
+    best_rank      INT    NULL,                            -- 최고 순위
+    worst_rank     INT    NULL,                            -- 최저 순위
+    rank_sum       INT    NOT NULL DEFAULT 0,              -- 순위 합계 (평균 = rank_sum / exposure_count)
+    PRIMARY KEY (tracking_id, session_number, period_start)
+);
+
+COMMENT ON TABLE rank_history_rollups IS '파티션 분리 전 rank_histories를 (추적, 회차, 주) 단위로 집계한 결과';
+COMMENT ON COLUMN rank_history_rollups.tracking_id IS 'ref: rank_trackings.id';
+COMMENT ON COLUMN rank_history_rollups.period_start IS 'KST 기준 주 시작일 (월요일)';
 
 
 -- -----------------------------------------------------------------------------
@@ -255,6 +364,9 @@ CREATE TABLE blog_postings (
 CREATE INDEX idx_blog_postings_agency_id     ON blog_postings (agency_id);
 CREATE INDEX idx_blog_postings_advertiser_id ON blog_postings (advertiser_id);
 CREATE INDEX idx_blog_postings_posting_date  ON blog_postings (posting_date);
+-- 목록 검색 (키워드/URL 부분 일치)
+CREATE INDEX idx_blog_postings_keyword_trgm  ON blog_postings USING gin (keyword gin_trgm_ops);
+CREATE INDEX idx_blog_postings_url_trgm      ON blog_postings USING gin (url gin_trgm_ops);
 
 CREATE TRIGGER trg_blog_postings_updated_at
     BEFORE UPDATE ON blog_postings
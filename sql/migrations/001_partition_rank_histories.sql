@@ -0,0 +1,104 @@
+-- =============================================================================
+-- 마이그레이션 001: rank_histories → checked_at 월 범위 파티션 테이블
+-- =============================================================================
+-- 대상: 파티셔닝 이전 DDL로 설치된 DB (rank_histories가 일반 테이블)
+--   - 새로 설치하는 DB는 sql/app-ddl.sql에 이미 반영되어 있으므로 실행 불필요
+--   - 이미 파티션 테이블이면 첫 단계에서 중단 (데이터 변경 없음)
+--   - 마이그레이션은 번호 순서로 실행 (001 → 002 → 003 → 004)
+--
+-- 처리:
+--   1. 기존 테이블을 rank_histories_legacy로 이름 변경 (id 시퀀스는 새 테이블로 이관)
+--   2. 파티션 테이블 + DEFAULT 파티션 + (가장 오래된 행의 월 ~ 이번 달 + 3개월) 월 파티션 생성
+--   3. 기존 행 복사, 기존 테이블 삭제
+--   4. 인덱스 / 주간 집계 테이블(rank_history_rollups) 생성
+--
+-- 전체가 한 트랜잭션이며 rank_histories에 ACCESS EXCLUSIVE 잠금을 잡으므로
+-- 배치(크롤링/유지보수)가 돌지 않는 시간에 실행
+--
+-- 사용법:
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f sql/migrations/001_partition_rank_histories.sql
+-- =============================================================================
+
+BEGIN;
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_partitioned_table
+        WHERE partrelid = to_regclass('rank_histories')
+    ) THEN
+        RAISE EXCEPTION 'rank_histories is already partitioned';
+    END IF;
+END $$;
+
+LOCK TABLE rank_histories IN ACCESS EXCLUSIVE MODE;
+
+-- 1. 기존 테이블 분리 (새 테이블과 이름이 겹치는 PK / 인덱스도 이름 변경)
+ALTER TABLE rank_histories RENAME TO rank_histories_legacy;
+ALTER TABLE rank_histories_legacy RENAME CONSTRAINT rank_histories_pkey TO rank_histories_legacy_pkey;
+ALTER INDEX IF EXISTS idx_rank_histories_tracking_id RENAME TO idx_rank_histories_legacy_tracking_id;
+
+-- 2. 파티션 테이블 (id는 기존 시퀀스를 이어서 사용)
+CREATE TABLE rank_histories (
+    id             BIGINT      NOT NULL DEFAULT nextval('rank_histories_id_seq'),
+    tracking_id    BIGINT      NOT NULL,                   -- ref: rank_trackings.id
+    rank           INT         NULL,                       -- 순위 (NULL = 해당 회차 미노출)
+    session_number INT         NOT NULL DEFAULT 1,         -- 회차 번호
+    checked_at     TIMESTAMPTZ NOT NULL,                   -- 체크 일시 (크롤러가 기록)
+    PRIMARY KEY (id, checked_at)
+) PARTITION BY RANGE (checked_at);
+
+ALTER SEQUENCE rank_histories_id_seq OWNED BY rank_histories.id;
+
+CREATE TABLE rank_histories_default PARTITION OF rank_histories DEFAULT;
+
+DO $$
+DECLARE
+    month_start DATE := COALESCE(
+        (SELECT date_trunc('month', MIN(checked_at) AT TIME ZONE 'Asia/Seoul')::DATE
+         FROM rank_histories_legacy),
+        date_trunc('month', NOW() AT TIME ZONE 'Asia/Seoul')::DATE
+    );
+    last_month DATE := (date_trunc('month', NOW() AT TIME ZONE 'Asia/Seoul') + INTERVAL '3 months')::DATE;
+BEGIN
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE %I PARTITION OF rank_histories FOR VALUES FROM (%L) TO (%L)',
+            'rank_histories_' || to_char(month_start, 'YYYYMM'),
+            to_char(month_start, 'YYYY-MM-DD') || ' 00:00:00+09',
+            to_char(month_start + INTERVAL '1 month', 'YYYY-MM-DD') || ' 00:00:00+09'
+        );
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+END $$;
+
+-- 3. 기존 행 복사
+INSERT INTO rank_histories (id, tracking_id, rank, session_number, checked_at)
+SELECT id, tracking_id, rank, session_number, checked_at
+FROM rank_histories_legacy;
+
+DROP TABLE rank_histories_legacy;
+
+-- 4. 인덱스 (sql/app-ddl.sql과 동일)
+CREATE INDEX idx_rank_histories_tracking_id ON rank_histories (tracking_id);
+CREATE INDEX idx_rank_histories_tracking_id_checked_at ON rank_histories (tracking_id, checked_at DESC);
+
+COMMENT ON TABLE rank_histories IS '일일 크롤링 순위 결과 (checked_at 월 파티션). created_at/updated_at 없음';
+COMMENT ON COLUMN rank_histories.tracking_id IS 'ref: rank_trackings.id';
+COMMENT ON COLUMN rank_histories.rank IS '순위. NULL이면 해당 회차에서 미노출';
+COMMENT ON COLUMN rank_histories.session_number IS '회차 번호 (rank_trackings.current_session 기준)';
+COMMENT ON COLUMN rank_histories.checked_at IS '크롤러가 순위를 확인한 일시 (파티션 키)';
+
+CREATE TABLE IF NOT EXISTS rank_history_rollups (
+    tracking_id    BIGINT NOT NULL,                        -- ref: rank_trackings.id
+    session_number INT    NOT NULL,                        -- 회차 번호
+    period_start   DATE   NOT NULL,                        -- 주 시작일 (KST 월요일)
+    check_count    INT    NOT NULL DEFAULT 0,              -- 체크 횟수
+    exposure_count INT    NOT NULL DEFAULT 0,              -- 노출 횟수 (rank NOT NULL)
+    best_rank      INT    NULL,                            -- 최고 순위
+    worst_rank     INT    NULL,                            -- 최저 순위
+    rank_sum       INT    NOT NULL DEFAULT 0,              -- 순위 합계 (평균 = rank_sum / exposure_count)
+    PRIMARY KEY (tracking_id, session_number, period_start)
+);
+
+COMMIT;
@@ -0,0 +1,49 @@
+-- =============================================================================
+-- 마이그레이션 002: tracking_session_summaries 생성 + 기존 히스토리로 백필
+-- =============================================================================
+-- 대상: 회차 요약 도입 전에 설치된 DB
+--   - 회차 전환/진행률이 요약 테이블만 읽으므로, 백필하지 않으면 기존 추적이
+--     배포 직후 노출 0회부터 다시 세어짐 (배치는 새 요약 행을 만들 때 해당 회차를
+--     히스토리에서 재계산하지만, 목록 진행률은 배치가 돌기 전까지 비어 있음)
+--   - 이미 있는 요약 행은 건드리지 않음 (여러 번 실행해도 안전)
+--   - 마이그레이션은 번호 순서로 실행 (001 → 002 → 003 → 004)
+--   - 재계산이 필요하면 python -m app.scripts.rebuild_session_summaries
+--
+-- 사용법:
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f sql/migrations/002_backfill_tracking_session_summaries.sql
+-- =============================================================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS tracking_session_summaries (
+    tracking_id      BIGINT      NOT NULL,                 -- ref: rank_trackings.id
+    session_number   INT         NOT NULL,                 -- 회차 번호
+    check_count      INT         NOT NULL DEFAULT 0,       -- 체크 횟수
+    exposure_count   INT         NOT NULL DEFAULT 0,       -- 노출 횟수 (회차 전환 기준)
+    best_rank        INT         NULL,                     -- 최고 순위
+    worst_rank       INT         NULL,                     -- 최저 순위
+    rank_sum         INT         NOT NULL DEFAULT 0,       -- 순위 합계 (평균 = rank_sum / exposure_count)
+    first_checked_at TIMESTAMPTZ NOT NULL,                 -- 회차 첫 체크 일시
+    last_checked_at  TIMESTAMPTZ NOT NULL,                 -- 회차 마지막 체크 일시
+    PRIMARY KEY (tracking_id, session_number)
+);
+
+INSERT INTO tracking_session_summaries (
+    tracking_id, session_number, check_count, exposure_count,
+    best_rank, worst_rank, rank_sum, first_checked_at, last_checked_at
+)
+SELECT
+    tracking_id,
+    session_number,
+    COUNT(*),
+    COUNT(rank),
+    MIN(rank),
+    MAX(rank),
+    COALESCE(SUM(rank), 0),
+    MIN(checked_at),
+    MAX(checked_at)
+FROM rank_histories
+GROUP BY tracking_id, session_number
+ON CONFLICT (tracking_id, session_number) DO NOTHING;
+
+COMMIT;
@@ -0,0 +1,60 @@
+-- =============================================================================
+-- 마이그레이션 003: delta sync(since 커서)용 updated_at 컬럼 / 인덱스 / 트리거
+-- =============================================================================
+-- 대상: delta sync 도입 전에 설치된 DB
+--   - 새로 설치하는 DB는 sql/app-ddl.sql에 이미 반영되어 있으므로 실행 불필요
+--   - 마이그레이션은 번호 순서로 실행 (001 → 002 → 003 → 004)
+--   - 여러 번 실행해도 안전 (IF NOT EXISTS / 트리거 재생성)
+--
+-- 처리:
+--   1. rank_histories.updated_at 추가 (기존 행은 checked_at으로 채움)
+--   2. tracking_session_summaries.updated_at 추가 (기존 행은 last_checked_at으로 채움)
+--   3. delta sync 인덱스 3개 생성
+--   4. updated_at 자동 갱신 트리거 생성
+--
+-- 기존 행을 NOW()가 아닌 체크 시각으로 채우므로 배포 직후 첫 since 요청이
+-- 전체 목록을 변경분으로 돌려주지 않음
+--
+-- rank_histories 전체 UPDATE가 포함되므로 배치(크롤링/유지보수)가 돌지 않는 시간에 실행
+--
+-- 사용법:
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f sql/migrations/003_delta_sync_updated_at.sql
+-- =============================================================================
+
+BEGIN;
+
+-- 1. rank_histories (파티션 테이블이면 모든 파티션에 함께 추가)
+ALTER TABLE rank_histories ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NULL;
+UPDATE rank_histories SET updated_at = checked_at WHERE updated_at IS NULL;
+ALTER TABLE rank_histories ALTER COLUMN updated_at SET DEFAULT NOW();
+ALTER TABLE rank_histories ALTER COLUMN updated_at SET NOT NULL;
+
+COMMENT ON TABLE rank_histories IS '일일 크롤링 순위 결과 (checked_at 월 파티션). created_at 없음';
+COMMENT ON COLUMN rank_histories.updated_at IS '행 생성/갱신 일시. delta sync(since 커서) 기준';
+
+-- 2. tracking_session_summaries
+ALTER TABLE tracking_session_summaries ADD COLUMN IF NOT EXISTS updated_at TIMESTAMPTZ NULL;
+UPDATE tracking_session_summaries SET updated_at = last_checked_at WHERE updated_at IS NULL;
+ALTER TABLE tracking_session_summaries ALTER COLUMN updated_at SET DEFAULT NOW();
+ALTER TABLE tracking_session_summaries ALTER COLUMN updated_at SET NOT NULL;
+
+-- 3. 인덱스 (sql/app-ddl.sql과 동일)
+CREATE INDEX IF NOT EXISTS idx_rank_trackings_updated_at
+    ON rank_trackings (updated_at);
+CREATE INDEX IF NOT EXISTS idx_rank_histories_tracking_id_updated_at
+    ON rank_histories (tracking_id, updated_at);
+CREATE INDEX IF NOT EXISTS idx_tracking_session_summaries_updated_at
+    ON tracking_session_summaries (updated_at);
+
+-- 4. 트리거 (파티션 테이블 행 트리거는 PostgreSQL 13+)
+DROP TRIGGER IF EXISTS trg_rank_histories_updated_at ON rank_histories;
+CREATE TRIGGER trg_rank_histories_updated_at
+    BEFORE UPDATE ON rank_histories
+    FOR EACH ROW EXECUTE FUNCTION trigger_set_updated_at();
+
+DROP TRIGGER IF EXISTS trg_tracking_session_summaries_updated_at ON tracking_session_summaries;
+CREATE TRIGGER trg_tracking_session_summaries_updated_at
+    BEFORE UPDATE ON tracking_session_summaries
+    FOR EACH ROW EXECUTE FUNCTION trigger_set_updated_at();
+
+COMMIT;
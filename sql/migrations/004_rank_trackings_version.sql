@@ -0,0 +1,22 @@
+-- =============================================================================
+-- 마이그레이션 004: rank_trackings.version (변경 카운터) 추가
+-- =============================================================================
+-- 대상: 조건부 GET 버전 마커에 변경 카운터를 도입하기 전에 설치된 DB
+--   - 새로 설치하는 DB는 sql/app-ddl.sql에 이미 반영되어 있으므로 실행 불필요
+--   - 마이그레이션은 번호 순서로 실행 (001 → 002 → 003 → 004)
+--   - 여러 번 실행해도 안전 (IF NOT EXISTS)
+--
+-- 기본값으로 채워지므로 기존 행 UPDATE 없음 (PostgreSQL 11+ 메타데이터만 변경)
+-- 배포 직후 클라이언트가 가진 ETag는 버전 마커 형식이 바뀌어 한 번씩 200으로 다시 받음
+--
+-- 사용법:
+--     psql "$DATABASE_URL" -v ON_ERROR_STOP=1 -f sql/migrations/004_rank_trackings_version.sql
+-- =============================================================================
+
+BEGIN;
+
+ALTER TABLE rank_trackings ADD COLUMN IF NOT EXISTS version INT NOT NULL DEFAULT 1;
+
+COMMENT ON COLUMN rank_trackings.version IS '변경 카운터. 앱이 UPDATE마다 +1 (조건부 GET ETag 버전 마커)';
+
+COMMIT;
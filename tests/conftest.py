@@ -0,0 +1,163 @@
+"""테스트 공통 fixture (임시 SQLite DB, 사용자/추적 생성, 프로세스 캐시 초기화)"""
+
+import itertools
+from typing import AsyncGenerator, Awaitable, Callable
+
+import fakeredis
+import pytest
+import pytest_asyncio
+import redis.asyncio
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.database.sqlite import SQLiteDatabase
+from app.models import (
+    Advertiser,
+    Agency,
+    ApprovalStatus,
+    RankTracking,
+    RankType,
+    TrackingStatus,
+    User,
+    UserRole,
+)
+from app.repositories import helpers
+from app.services.cache import mapping_index, user_profile_cache
+
+
+@pytest.fixture(autouse=True)
+def reset_process_caches(monkeypatch) -> None:
+    """
+    프로세스 싱글턴 캐시는 테스트(DB)마다 새로 생성
+
+    - 테스트 DB는 매번 id 1부터 시작하므로 이전 테스트의 캐시 값이 섞이지 않도록
+    """
+    monkeypatch.setattr(helpers, "_list_total_cache", None)
+    monkeypatch.setattr(mapping_index, "_mapping_index", None)
+    monkeypatch.setattr(user_profile_cache, "_user_profile_cache", None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch) -> fakeredis.FakeServer:
+    """redis.asyncio.from_url → 같은 서버를 공유하는 FakeRedis (Lua 포함)"""
+    server = fakeredis.FakeServer()
+
+    def from_url(url, **kwargs):
+        return fakeredis.FakeAsyncRedis(server=server, **kwargs)
+
+    monkeypatch.setattr(redis.asyncio, "from_url", from_url)
+    return server
+
+
+@pytest_asyncio.fixture
+async def database(tmp_path) -> AsyncGenerator[SQLiteDatabase, None]:
+    """테스트마다 새로 만드는 SQLite DB (검색 인덱스 포함)"""
+    database = SQLiteDatabase(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    await database.connect()
+    await database.create_tables()
+    yield database
+    await database.disconnect()
+
+
+@pytest_asyncio.fixture
+async def db_session(database: SQLiteDatabase) -> AsyncGenerator[AsyncSession, None]:
+    """DB 세션 (커밋은 테스트에서 직접)"""
+    async with database._session_factory() as session:
+        yield session
+
+
+MakeUser = Callable[..., Awaitable[User]]
+MakeTracking = Callable[..., Awaitable[RankTracking]]
+
+
+@pytest.fixture
+def make_user(db_session: AsyncSession) -> MakeUser:
+    """
+    승인된 사용자 + 역할별 프로필(업체/광고주) 생성 후 커밋
+
+    사용 예:
+        agency = await make_user(UserRole.AGENCY, company_name="A업체")
+        pending = await make_user(approval_status=ApprovalStatus.PENDING, profile=False)
+    """
+    numbers = itertools.count(1)
+
+    async def make_user(
+        role: UserRole = UserRole.ADVERTISER,
+        profile: bool = True,
+        **fields,
+    ) -> User:
+        number = next(numbers)
+        user = User(
+            **{
+                "login_id": f"user{number}",
+                "email": f"user{number}@example.com",
+                "password_hash": "x",
+                "name": f"담당자{number}",
+                "company_name": f"회사{number}",
+                "role": role,
+                "approval_status": ApprovalStatus.APPROVED,
+                **fields,
+            }
+        )
+        db_session.add(user)
+        await db_session.flush()
+
+        if profile and role == UserRole.AGENCY:
+            db_session.add(Agency(id=user.id))
+        elif profile and role == UserRole.ADVERTISER:
+            db_session.add(Advertiser(id=user.id))
+        await db_session.commit()
+        return user
+
+    return make_user
+
+
+@pytest_asyncio.fixture
+async def agency_user(make_user: MakeUser) -> User:
+    """업체 사용자"""
+    return await make_user(UserRole.AGENCY, company_name="테스트업체")
+
+
+@pytest_asyncio.fixture
+async def advertiser_user(make_user: MakeUser) -> User:
+    """광고주 사용자"""
+    return await make_user(UserRole.ADVERTISER, company_name="테스트광고주")
+
+
+@pytest.fixture
+def make_tracking(
+    db_session: AsyncSession,
+    agency_user: User,
+    advertiser_user: User,
+) -> MakeTracking:
+    """
+    진행 중인 플레이스 추적 생성 후 커밋 (기본: agency_user / advertiser_user)
+
+    사용 예:
+        stopped = await make_tracking(keyword="중단", status=TrackingStatus.STOPPED)
+    """
+
+    async def make_tracking(**fields) -> RankTracking:
+        keyword = fields.pop("keyword", "강남 한의원")
+        tracking = RankTracking(
+            **{
+                "type": RankType.PLACE,
+                "agency_id": agency_user.id,
+                "advertiser_id": advertiser_user.id,
+                "keyword": keyword,
+                "url": f"https://map.naver.com/p/entry/place/{keyword}",
+                "status": TrackingStatus.ACTIVE,
+                "current_session": 1,
+                **fields,
+            }
+        )
+        db_session.add(tracking)
+        await db_session.commit()
+        return tracking
+
+    return make_tracking
+
+
+@pytest_asyncio.fixture
+async def tracking(make_tracking: MakeTracking) -> RankTracking:
+    """업체 1 + 광고주 1 + 진행 중인 플레이스 추적 1건"""
+    return await make_tracking()
@@ -0,0 +1,79 @@
+"""인증 서비스 테스트"""
+
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import get_settings
+from app.core.security import pwd_context
+from app.core.session.memory_store import MemorySessionStore
+from app.models import User, UserRole
+from app.schemas.auth import LoginRequest
+from app.services.auth_service import AuthService
+
+SESSION = {
+    "user_id": 1,
+    "login_id": "user1",
+    "email": "user1@example.com",
+    "name": "담당자1",
+    "role": "agency",
+    "approval_status": "approved",
+}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("sliding", [False, True])
+async def test_get_session_extends_when_sliding(db_session, sliding):
+    """슬라이딩 만료면 세션 확인도 만료를 연장하고 남은 만료를 반환"""
+    settings = get_settings().model_copy(
+        update={"SESSION_SLIDING_EXPIRATION": sliding, "SESSION_EXPIRE_SECONDS": 1800}
+    )
+    store = MemorySessionStore()
+    await store.set("s1", SESSION, expire=timedelta(minutes=1))
+    service = AuthService(db_session, store, settings)
+
+    response, remaining = await service.get_session("s1")
+
+    assert response.authenticated
+    assert response.user.login_id == "user1"
+    ttl = store._store["s1"].expires_at - time.monotonic()
+    if sliding:
+        assert timedelta(minutes=29) < remaining <= timedelta(minutes=30)
+        assert ttl > 29 * 60
+    else:
+        assert remaining is None
+        assert ttl <= 60
+
+    response, remaining = await service.get_session("missing")
+    assert not response.authenticated
+    assert remaining is None
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_cost(db_session, make_user):
+    """설정보다 낮은 cost의 해시는 로그인 성공 시 새 cost로 재해싱"""
+    settings = get_settings()
+    old_hash = pwd_context.hash("secret", rounds=4)
+    user = await make_user(UserRole.AGENCY, password_hash=old_hash)
+    service = AuthService(db_session, MemorySessionStore(), settings)
+
+    # 비밀번호가 틀리면 재해싱하지 않음
+    with pytest.raises(ValueError):
+        await service.login(LoginRequest(login_id=user.login_id, password="wrong"))
+    await db_session.commit()
+    assert (await db_session.get(User, user.id)).password_hash == old_hash
+
+    await service.login(LoginRequest(login_id=user.login_id, password="secret"))
+    await db_session.commit()
+
+    new_hash = (await db_session.get(User, user.id)).password_hash
+    assert new_hash != old_hash
+    assert pwd_context.verify("secret", new_hash)
+    assert not pwd_context.needs_update(new_hash)
+    assert f"${settings.BCRYPT_ROUNDS:02d}$" in new_hash
+
+    # 이미 새 cost면 다시 재해싱하지 않음
+    await service.login(LoginRequest(login_id=user.login_id, password="secret"))
+    await db_session.commit()
+    assert (await db_session.get(User, user.id)).password_hash == new_hash
@@ -0,0 +1,58 @@
+"""배치 크롤링 결과 버퍼 저장 테스트"""
+
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select, update
+
+from app.models import RankHistory, RankTracking, RankType, TrackingStatus
+from app.repositories.tracking import RankTrackingRepository
+from app.tasks import rank_tasks
+from app.tasks.rank_tasks import _BufferedResultWriter
+
+
+@pytest.mark.asyncio
+async def test_flush_isolates_failures_and_skips_stopped(
+    database, db_session, make_tracking, monkeypatch
+):
+    """한 건 저장 실패는 그 건만 롤백, 청크 조회 후 중단된 추적은 건너뜀"""
+    tracking = await make_tracking()
+    await make_tracking(keyword="failing")
+    await make_tracking(keyword="stopped")
+
+    rows = await RankTrackingRepository(db_session).get_active_chunk(
+        RankType.PLACE, after_id=0, limit=10
+    )
+    by_keyword = {row.keyword: row for row in rows}
+    failing_id = by_keyword["failing"].id
+    stopped_id = by_keyword["stopped"].id
+
+    # 청크 조회 이후 중단
+    await db_session.execute(
+        update(RankTracking)
+        .where(RankTracking.id == stopped_id)
+        .values(status=TrackingStatus.STOPPED)
+    )
+    await db_session.commit()
+
+    save = rank_tasks._save_tracking_result
+
+    async def save_or_fail(row, rank, checked_at, session):
+        await save(row, rank, checked_at, session)
+        if row.id == failing_id:
+            raise RuntimeError("save failed")
+
+    monkeypatch.setattr(rank_tasks, "_save_tracking_result", save_or_fail)
+
+    writer = _BufferedResultWriter(database._session_factory, chunk_size=10)
+    checked_at = datetime.now(timezone.utc)
+    for row in rows:
+        await writer.add(row, 3, checked_at)
+    await writer.flush()
+
+    assert (writer.saved, writer.failed, writer.skipped) == (1, 1, 1)
+
+    saved_ids = (
+        await db_session.execute(select(RankHistory.tracking_id))
+    ).scalars().all()
+    assert saved_ids == [tracking.id]
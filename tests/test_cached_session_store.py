@@ -0,0 +1,110 @@
+"""2단(L1 + 원본) 세션 저장소 테스트"""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+
+from app.core.session.cached_store import CachedSessionStore
+from app.core.session.memory_store import MemorySessionStore
+
+
+class CountingStore(MemorySessionStore):
+    """원본 저장소 호출 횟수 기록"""
+
+    def __init__(self):
+        super().__init__(default_expire=timedelta(minutes=30))
+        self.calls = []
+
+    async def get(self, session_id):
+        self.calls.append("get")
+        return await super().get(session_id)
+
+    async def get_and_extend(self, session_id, expire=None):
+        self.calls.append("get_and_extend")
+        return await super().get_and_extend(session_id, expire=expire)
+
+
+@pytest_asyncio.fixture
+async def origin():
+    origin = CountingStore()
+    await origin.connect()
+    yield origin
+    await origin.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_get_and_extend_hits_l1(origin):
+    """L1 적중 시 원본 연장 생략, 남은 만료는 원본 기준"""
+    store = CachedSessionStore(origin, ttl=5.0)
+    await origin.set("s1", {"user_id": 1})
+
+    first = await store.get_and_extend("s1")
+    second = await store.get_and_extend("s1")
+
+    assert origin.calls == ["get_and_extend"]
+    assert first[0] == second[0] == {"user_id": 1}
+    assert timedelta(minutes=29) < second[1] <= timedelta(minutes=30)
+
+
+@pytest.mark.asyncio
+async def test_get_only_entry_does_not_skip_extension(origin):
+    """get으로 채운 L1 항목은 만료 시각을 모르므로 get_and_extend는 원본 조회"""
+    store = CachedSessionStore(origin, ttl=5.0)
+    await origin.set("s1", {"user_id": 1})
+
+    await store.get("s1")
+    await store.get("s1")
+    await store.get_and_extend("s1")
+
+    assert origin.calls == ["get", "get_and_extend"]
+
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_l1(origin):
+    """쓰기/삭제 후에는 원본 값을 다시 읽음"""
+    store = CachedSessionStore(origin, ttl=5.0)
+    await store.set("s1", {"user_id": 1, "role": "agency"})
+    assert (await store.get("s1"))["role"] == "agency"
+
+    await store.set("s1", {"user_id": 1, "role": "admin"})
+    assert (await store.get("s1"))["role"] == "admin"
+
+    await store.delete("s1")
+    assert await store.get("s1") is None
+    assert await store.get_and_extend("s1") is None
+
+
+@pytest.mark.asyncio
+async def test_delete_by_user_clears_l1(origin):
+    """사용자 세션 전체 삭제 시 L1도 비움"""
+    store = CachedSessionStore(origin, ttl=5.0)
+    await store.set("s1", {"user_id": 1})
+    await store.get_and_extend("s1")
+
+    assert await store.delete_by_user(1) == 1
+    assert await store.get_and_extend("s1") is None
+    assert not await store.exists("s1")
+
+
+@pytest.mark.asyncio
+async def test_invalidation_reaches_other_replicas(origin, fake_redis):
+    """pub/sub 무효화 메시지로 다른 레플리카의 L1 제거"""
+    replica_a = CachedSessionStore(origin, ttl=60.0, redis_url="redis://localhost")
+    replica_b = CachedSessionStore(origin, ttl=60.0, redis_url="redis://localhost")
+    await replica_a.connect()
+    await replica_b.connect()
+
+    await replica_a.set("s1", {"user_id": 1, "role": "agency"})
+    assert (await replica_b.get("s1"))["role"] == "agency"
+
+    await replica_a.set("s1", {"user_id": 1, "role": "admin"})
+    for _ in range(100):
+        if "s1" not in replica_b._cache._data:
+            break
+        await asyncio.sleep(0.01)
+    assert (await replica_b.get("s1"))["role"] == "admin"
+
+    await replica_a.disconnect()
+    await replica_b.disconnect()
@@ -0,0 +1,114 @@
+"""조건부 GET (ETag / If-None-Match) 테스트"""
+
+import pytest
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+
+from app.core.conditional import ConditionalRequest, get_conditional_request, make_etag
+
+state = {"version": 1}
+
+
+def renew_session_cookie(response: Response) -> None:
+    """슬라이딩 만료로 세션 쿠키를 갱신하는 인증 의존성 대역"""
+    response.set_cookie("session_id", "renewed", max_age=1800, httponly=True)
+
+
+app = FastAPI(version="1.0.0")
+
+
+@app.get("/items", dependencies=[Depends(renew_session_cookie)])
+async def list_items(
+    page: int = 1,
+    conditional: ConditionalRequest = Depends(get_conditional_request),
+):
+    if conditional.is_not_modified(state["version"]):
+        return conditional.not_modified_response()
+    return {"version": state["version"], "page": page}
+
+
+@app.get("/raw", dependencies=[Depends(renew_session_cookie)])
+async def raw_items(conditional: ConditionalRequest = Depends(get_conditional_request)):
+    if conditional.is_not_modified(state["version"]):
+        return conditional.not_modified_response()
+    return conditional.attach(Response(content=b"\x93\x01", media_type="application/msgpack"))
+
+
+@pytest.fixture
+def client() -> TestClient:
+    state["version"] = 1
+    return TestClient(app)
+
+
+def test_not_modified(client):
+    """같은 버전이면 304 (본문 없음, ETag/Cache-Control 유지)"""
+    first = client.get("/items")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"')
+    assert first.headers["cache-control"] == "private, no-cache"
+
+    second = client.get("/items", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+    assert second.headers["cache-control"] == "private, no-cache"
+
+
+def test_weak_comparison_and_lists(client):
+    """W/ 접두사 무시, 여러 ETag 목록과 * 허용"""
+    etag = client.get("/items").headers["etag"]
+    opaque = etag.removeprefix("W/")
+
+    for if_none_match in (opaque, f'"other", {etag}', "*"):
+        response = client.get("/items", headers={"If-None-Match": if_none_match})
+        assert response.status_code == 304
+
+
+def test_version_change_returns_body(client):
+    """버전 마커가 바뀌면 새 ETag로 200"""
+    etag = client.get("/items").headers["etag"]
+    state["version"] = 2
+
+    response = client.get("/items", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["version"] == 2
+    assert response.headers["etag"] != etag
+
+
+def test_etag_varies_by_query_and_accept(client):
+    """쿼리 문자열/Accept가 다르면 다른 ETag"""
+    base = client.get("/items").headers["etag"]
+    page2 = client.get("/items?page=2").headers["etag"]
+    msgpack = client.get("/items", headers={"Accept": "application/msgpack"}).headers["etag"]
+
+    assert len({base, page2, msgpack}) == 3
+    response = client.get("/items?page=2", headers={"If-None-Match": base})
+    assert response.status_code == 200
+
+
+def test_not_modified_keeps_renewed_cookie(client):
+    """304에도 갱신된 세션 쿠키 유지"""
+    etag = client.get("/items").headers["etag"]
+
+    response = client.get("/items", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert "session_id=renewed" in response.headers["set-cookie"]
+
+
+def test_attach_keeps_cookie_and_etag(client):
+    """직접 만든 Response에도 ETag/Set-Cookie 적용"""
+    response = client.get("/raw")
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('W/"')
+    assert "session_id=renewed" in response.headers["set-cookie"]
+
+    not_modified = client.get("/raw", headers={"If-None-Match": response.headers["etag"]})
+    assert not_modified.status_code == 304
+    assert "session_id=renewed" in not_modified.headers["set-cookie"]
+
+
+def test_make_etag_is_stable():
+    """같은 버전 마커면 같은 ETag"""
+    assert make_etag(1, "a", None) == make_etag(1, "a", None)
+    assert make_etag(1, "a") != make_etag(1, "b")
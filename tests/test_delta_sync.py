@@ -0,0 +1,128 @@
+"""delta sync (since 커서) 테스트"""
+
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import update
+
+from app.core.config import get_settings
+from app.core.timezone import now_utc
+from app.models import (
+    RankHistory,
+    RankTracking,
+    RankType,
+    TrackingSessionSummary,
+    TrackingStatus,
+)
+from app.schemas.tracking.common import HistoryView
+from app.services.rank.rank_service import RankService
+
+
+def _summary(tracking_id: int, checked_at, updated_at) -> TrackingSessionSummary:
+    return TrackingSessionSummary(
+        tracking_id=tracking_id,
+        session_number=1,
+        check_count=1,
+        exposure_count=1,
+        best_rank=3,
+        worst_rank=3,
+        rank_sum=3,
+        first_checked_at=checked_at,
+        last_checked_at=checked_at,
+        updated_at=updated_at,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tracking_list_since(db_session, make_tracking):
+    """커서 이후 추적이 변경됐거나 새 순위가 기록된 추적만"""
+    now = now_utc()
+    old = now - timedelta(days=1)
+    since = now - timedelta(hours=1)
+
+    unchanged = await make_tracking(keyword="unchanged")
+    new_rank = await make_tracking(keyword="new-rank")
+    stopped = await make_tracking(keyword="stopped")
+    db_session.add_all(
+        [
+            _summary(unchanged.id, old, old),
+            _summary(new_rank.id, now, now),
+            _summary(stopped.id, old, old),
+        ]
+    )
+    await db_session.execute(update(RankTracking).values(updated_at=old))
+    await db_session.execute(
+        update(RankTracking)
+        .where(RankTracking.id == stopped.id)
+        .values(status=TrackingStatus.STOPPED, updated_at=now)
+    )
+    await db_session.commit()
+
+    service = RankService(db_session)
+    full = await service.get_tracking_list(RankType.PLACE)
+    delta = await service.get_tracking_list(RankType.PLACE, since=since)
+
+    assert full.total == 3
+    assert {item.id for item in delta.items} == {new_rank.id, stopped.id}
+    assert delta.total == 2
+
+    lag = timedelta(seconds=get_settings().DELTA_SYNC_CURSOR_LAG_SECONDS)
+    assert now - lag - timedelta(seconds=5) <= delta.next_cursor <= now_utc() - lag
+
+    # 다음 커서 이후 변경이 없으면 빈 목록
+    empty = await service.get_tracking_list(
+        RankType.PLACE, since=now + timedelta(minutes=1)
+    )
+    assert empty.items == []
+    assert empty.total == 0
+
+
+@pytest.mark.asyncio
+async def test_tracking_detail_since(db_session, tracking):
+    """상세 히스토리 목록은 커서 이후 생성/갱신된 것만, 회차 요약은 전체"""
+    now = now_utc()
+    old = now - timedelta(days=1)
+    since = now - timedelta(hours=1)
+
+    db_session.add_all(
+        [
+            RankHistory(
+                tracking_id=tracking.id,
+                rank=5,
+                session_number=1,
+                checked_at=old - timedelta(days=1),
+                updated_at=old,
+            ),
+            # 어제 체크한 히스토리를 오늘 재크롤링으로 갱신
+            RankHistory(
+                tracking_id=tracking.id,
+                rank=2,
+                session_number=1,
+                checked_at=old,
+                updated_at=now,
+            ),
+            RankHistory(
+                tracking_id=tracking.id,
+                rank=None,
+                session_number=1,
+                checked_at=now,
+                updated_at=now,
+            ),
+        ]
+    )
+    await db_session.commit()
+
+    service = RankService(db_session)
+    detail = await service.get_tracking_detail(tracking.id, since=since)
+
+    assert detail.history_total == 2
+    assert [h.rank for h in detail.histories] == [None, 2]
+    assert detail.next_cursor is not None
+
+    full = await service.get_tracking_detail(tracking.id)
+    assert full.history_total == 3
+
+    summary = await service.get_tracking_detail(
+        tracking.id, view=HistoryView.SUMMARY, since=since
+    )
+    assert summary.history_total == 3
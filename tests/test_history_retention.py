@@ -0,0 +1,117 @@
+"""순위 히스토리 보존 정책 테스트 (파티션 없는 DB: 행 단위 집계/삭제)"""
+
+from datetime import timedelta, timezone
+
+import pytest
+from sqlalchemy import func, select
+
+from app.core.config import get_settings
+from app.core.timezone import kst_day_start_utc, today_kst
+from app.models import RankHistory, RankHistoryRollup
+from app.repositories.tracking import RankHistoryRollupRepository
+from app.services.rank.history_retention_service import (
+    RankHistoryRetentionService,
+    _add_months,
+)
+
+KST = timezone(timedelta(hours=9))
+
+
+def _cutoff():
+    """보존 기간 경계 (UTC)"""
+    current_month = today_kst().replace(day=1)
+    months = get_settings().RANK_HISTORY_RETENTION_MONTHS
+    return kst_day_start_utc(_add_months(current_month, -months))
+
+
+def _week_start(checked_at):
+    """KST 기준 주 시작일 (월요일)"""
+    day = checked_at.astimezone(KST).date()
+    return day - timedelta(days=day.weekday())
+
+
+@pytest.mark.asyncio
+async def test_retire_rows_rolls_up_and_deletes(db_session, tracking):
+    """보존 기간 이전 행은 주간 집계 후 삭제, 이후 행은 유지"""
+    cutoff = _cutoff()
+    old = [
+        RankHistory(
+            tracking_id=tracking.id,
+            rank=(day % 4) or None,
+            session_number=1,
+            checked_at=cutoff - timedelta(days=day, hours=1),
+        )
+        for day in range(14)
+    ]
+    recent = [
+        RankHistory(
+            tracking_id=tracking.id,
+            rank=3,
+            session_number=2,
+            checked_at=cutoff + timedelta(days=day, hours=1),
+        )
+        for day in range(5)
+    ]
+    db_session.add_all(old + recent)
+    await db_session.commit()
+
+    result = await RankHistoryRetentionService(db_session).run()
+
+    assert result["created_partitions"] == 0
+    assert result["dropped_partitions"] == 0
+    assert result["deleted_rows"] == len(old)
+
+    remaining = await db_session.scalar(select(func.count(RankHistory.id)))
+    assert remaining == len(recent)
+
+    rollups = (await db_session.execute(select(RankHistoryRollup))).scalars().all()
+    expected_weeks = {_week_start(h.checked_at) for h in old}
+    assert {r.period_start for r in rollups} == expected_weeks
+    assert result["rolled_up_rows"] == len(expected_weeks)
+
+    ranks = [h.rank for h in old if h.rank is not None]
+    assert sum(r.check_count for r in rollups) == len(old)
+    assert sum(r.exposure_count for r in rollups) == len(ranks)
+    assert sum(r.rank_sum for r in rollups) == sum(ranks)
+    assert min(r.best_rank for r in rollups if r.best_rank) == min(ranks)
+    assert max(r.worst_rank for r in rollups if r.worst_rank) == max(ranks)
+    assert {(r.tracking_id, r.session_number) for r in rollups} == {(tracking.id, 1)}
+
+    # 다시 실행해도 이미 집계된 구간은 중복 집계되지 않음
+    result = await RankHistoryRetentionService(db_session).run()
+    assert result["rolled_up_rows"] == 0
+    assert result["deleted_rows"] == 0
+    total_checks = await db_session.scalar(select(func.sum(RankHistoryRollup.check_count)))
+    assert total_checks == len(old)
+
+
+@pytest.mark.asyncio
+async def test_rollup_range_accumulates_same_week(db_session, tracking):
+    """같은 주가 두 구간에 걸치면 기존 집계에 누적"""
+    monday = kst_day_start_utc(today_kst() - timedelta(days=today_kst().weekday() + 7))
+    db_session.add_all(
+        [
+            RankHistory(
+                tracking_id=tracking.id,
+                rank=rank,
+                session_number=1,
+                checked_at=monday + timedelta(days=day, hours=2),
+            )
+            for day, rank in enumerate([5, None, 2, 8])
+        ]
+    )
+    await db_session.commit()
+
+    repo = RankHistoryRollupRepository(db_session)
+    split = monday + timedelta(days=2)
+    await repo.rollup_range(None, split)
+    await repo.rollup_range(split, monday + timedelta(days=7))
+    await db_session.commit()
+
+    rollup = (await db_session.execute(select(RankHistoryRollup))).scalar_one()
+    assert rollup.period_start == monday.astimezone(KST).date()
+    assert rollup.check_count == 4
+    assert rollup.exposure_count == 3
+    assert rollup.best_rank == 2
+    assert rollup.worst_rank == 8
+    assert rollup.rank_sum == 15
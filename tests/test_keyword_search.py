@@ -0,0 +1,57 @@
+"""목록 키워드 검색 테스트 (키워드/URL/업체명/광고주명, SQLite FTS5 trigram)"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import update
+
+from app.models import RankType, User, UserRole
+from app.repositories.tracking import RankTrackingRepository
+
+
+async def _search(db_session, keyword: str) -> set:
+    trackings, total = await RankTrackingRepository(db_session).get_list_with_total(
+        RankType.PLACE, keyword=keyword
+    )
+    assert total == len(trackings)
+    return {tracking.keyword for tracking in trackings}
+
+
+@pytest_asyncio.fixture
+async def trackings(make_user, make_tracking):
+    """검색 대상: 키워드/URL/광고주명이 각각 다른 추적 3건"""
+    other = await make_user(UserRole.ADVERTISER, company_name="서초치과의원")
+    await make_tracking(keyword="강남 한의원")
+    await make_tracking(keyword="역삼 피부과", url="https://map.naver.com/p/entry/place/derma")
+    await make_tracking(keyword="잠실 안과", advertiser_id=other.id)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "keyword, expected",
+    [
+        ("강남 한의", {"강남 한의원"}),  # 키워드
+        ("derma", {"역삼 피부과"}),  # URL
+        ("치과의원", {"잠실 안과"}),  # 광고주명
+        ("테스트업체", {"강남 한의원", "역삼 피부과", "잠실 안과"}),  # 업체명
+        ("안과", {"잠실 안과"}),  # 3글자 미만 (LIKE)
+        ('"안과', set()),  # 따옴표 이스케이프
+        ("없는검색어", set()),
+    ],
+)
+async def test_keyword_search(db_session, trackings, keyword, expected):
+    """키워드, URL, 업체명, 광고주명 중 하나라도 포함하면 매칭"""
+    assert await _search(db_session, keyword) == expected
+
+
+@pytest.mark.asyncio
+async def test_search_index_follows_updates(db_session, trackings, advertiser_user):
+    """회사명 변경 후에도 검색 인덱스가 동기화"""
+    await db_session.execute(
+        update(User)
+        .where(User.id == advertiser_user.id)
+        .values(company_name="새이름광고주")
+    )
+    await db_session.commit()
+
+    assert await _search(db_session, "새이름광고") == {"강남 한의원", "역삼 피부과"}
+    assert await _search(db_session, "테스트광고주") == set()
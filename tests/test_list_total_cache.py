@@ -0,0 +1,135 @@
+"""목록 전체 개수 캐시 / TTL 캐시 테스트"""
+
+import pytest
+from sqlalchemy import select
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache
+from app.models import RankTracking
+from app.repositories import helpers
+from app.repositories.helpers import ListTotalCache, fetch_page_with_total
+
+
+class FakeClock:
+    """time.monotonic 대체 (테스트에서 시간 이동)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def list_total_cache(monkeypatch) -> ListTotalCache:
+    """프로세스 싱글턴 대신 테스트 전용 캐시"""
+    cache = ListTotalCache(maxsize=16, ttl=30.0)
+    monkeypatch.setattr(helpers, "_list_total_cache", cache)
+    return cache
+
+
+def test_ttl_cache_expires(clock):
+    """TTL이 지나면 조회되지 않고 제거됨"""
+    cache = TTLCache(maxsize=4, ttl=10.0)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=30.0)
+
+    clock.now += 9.9
+    assert cache.get("a") == 1
+
+    clock.now += 0.1
+    assert cache.get("a") is None
+    assert cache.get("a", default=-1) == -1
+    assert cache.get("b") == 2
+    assert len(cache) == 1
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    """최대 개수를 넘으면 가장 오래 사용하지 않은 항목부터 방출"""
+    cache = TTLCache(maxsize=2, ttl=10.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # a 사용 → b가 가장 오래됨
+
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_list_total_cache_invalidates_namespace(clock):
+    """무효화는 해당 네임스페이스(테이블)만 비움"""
+    cache = ListTotalCache(maxsize=16, ttl=30.0)
+    cache.set("rank_trackings", ("place", None), 10)
+    cache.set("rank_trackings", ("blog", None), 20)
+    cache.set("blog_postings", (None,), 5)
+
+    cache.invalidate("rank_trackings")
+
+    assert cache.get("rank_trackings", ("place", None)) is None
+    assert cache.get("rank_trackings", ("blog", None)) is None
+    assert cache.get("blog_postings", (None,)) == 5
+    cache.invalidate("unknown")  # 없는 네임스페이스도 오류 없음
+
+
+def test_list_total_cache_expires(clock):
+    """전체 개수는 TTL 이후 다시 계산"""
+    cache = ListTotalCache(maxsize=16, ttl=30.0)
+    cache.set("rank_trackings", "sig", 10)
+
+    clock.now += 30.0
+    assert cache.get("rank_trackings", "sig") is None
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_with_total(db_session, tracking, list_total_cache):
+    """첫 조회는 윈도 함수로 개수 계산, 이후는 캐시된 개수 사용"""
+    fallback_calls = []
+
+    async def count_fallback() -> int:
+        fallback_calls.append(1)
+        return 1
+
+    stmt = select(RankTracking).order_by(RankTracking.id)
+
+    rows, total = await fetch_page_with_total(
+        db_session, stmt, 0, 10, "rank_trackings", "all", count_fallback
+    )
+    assert [row.id for row in rows] == [tracking.id]
+    assert total == 1
+    assert list_total_cache.get("rank_trackings", "all") == 1
+
+    # 캐시 적중: 저장된 개수를 그대로 사용
+    list_total_cache.set("rank_trackings", "all", 7)
+    rows, total = await fetch_page_with_total(
+        db_session, stmt, 0, 10, "rank_trackings", "all", count_fallback
+    )
+    assert [row.id for row in rows] == [tracking.id]
+    assert total == 7
+    assert not fallback_calls
+
+
+@pytest.mark.asyncio
+async def test_fetch_page_with_total_out_of_range(db_session, tracking, list_total_cache):
+    """범위를 벗어난 페이지는 별도 count 쿼리로 보정"""
+    fallback_calls = []
+
+    async def count_fallback() -> int:
+        fallback_calls.append(1)
+        return 1
+
+    stmt = select(RankTracking).order_by(RankTracking.id)
+    rows, total = await fetch_page_with_total(
+        db_session, stmt, 20, 10, "rank_trackings", "page3", count_fallback
+    )
+
+    assert rows == []
+    assert total == 1
+    assert fallback_calls == [1]
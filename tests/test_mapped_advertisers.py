@@ -0,0 +1,33 @@
+"""업체 매핑 광고주 목록 테스트 (매핑 캐시 + 프로필 캐시)"""
+
+import pytest
+from sqlalchemy import delete
+
+from app.models import Advertiser, AgencyAdvertiserMapping, User, UserRole
+from app.routers.agency.common import list_mapped_advertisers
+
+
+@pytest.mark.asyncio
+async def test_excludes_mappings_without_profile_or_user(db_session, make_user):
+    """광고주 프로필이나 사용자가 없는 매핑은 목록에서 제외"""
+    agency = await make_user(UserRole.AGENCY)
+    mapped = await make_user(UserRole.ADVERTISER, company_name="정상광고주")
+    no_profile = await make_user(UserRole.ADVERTISER, profile=False)
+    no_user = await make_user(UserRole.ADVERTISER)
+    db_session.add_all(
+        [
+            AgencyAdvertiserMapping(agency_id=agency.id, advertiser_id=advertiser.id)
+            for advertiser in (mapped, no_profile, no_user)
+        ]
+    )
+    await db_session.execute(delete(User).where(User.id == no_user.id))
+    await db_session.commit()
+
+    response = await list_mapped_advertisers(agency_id=agency.id, db=db_session)
+
+    assert [item.id for item in response.items] == [mapped.id]
+    assert response.items[0].company_name == "정상광고주"
+    assert response.total == 1
+
+    # 프로필만 남은 광고주도 제외 확인
+    assert await db_session.get(Advertiser, no_user.id) is not None
@@ -0,0 +1,81 @@
+"""회원가입 승인 테스트 (일괄 매핑/일괄 승인)"""
+
+import pytest
+from sqlalchemy import select
+
+from app.models import AgencyAdvertiserMapping, ApprovalStatus, User, UserRole
+from app.repositories.agency_advertiser_mapping_repository import (
+    AgencyAdvertiserMappingRepository,
+)
+from app.services.admin_member_service import AdminMemberService
+from app.services.cache import get_mapping_index
+
+
+async def _mapped_ids(db_session, agency_id: int) -> set:
+    result = await db_session.execute(
+        select(AgencyAdvertiserMapping.advertiser_id).where(
+            AgencyAdvertiserMapping.agency_id == agency_id
+        )
+    )
+    return set(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_create_bulk_skips_existing(db_session, agency_user, make_user):
+    """이미 있는 매핑과 요청 내 중복은 건너뛰고 새 매핑 수만 반환 (ON CONFLICT DO NOTHING)"""
+    a, b, c = [await make_user(UserRole.ADVERTISER) for _ in range(3)]
+    repo = AgencyAdvertiserMappingRepository(db_session)
+
+    assert await repo.create_bulk(agency_user.id, [a.id, b.id, a.id]) == 2
+    assert await repo.create_bulk(agency_user.id, [a.id, b.id, c.id]) == 1
+    assert await repo.create_bulk(agency_user.id, []) == 0
+    await db_session.commit()
+
+    assert await _mapped_ids(db_session, agency_user.id) == {a.id, b.id, c.id}
+
+
+@pytest.mark.asyncio
+async def test_approve_signup_maps_valid_advertisers(db_session, make_user):
+    """업체 승인 시 존재하는 광고주만 한 번에 매핑하고 매핑 캐시 무효화"""
+    agency = await make_user(UserRole.AGENCY, approval_status=ApprovalStatus.PENDING)
+    advertiser = await make_user(UserRole.ADVERTISER)
+    no_profile = await make_user(UserRole.ADVERTISER, profile=False)
+    # 승인 전 조회로 매핑 캐시에 빈 목록 적재
+    assert not await get_mapping_index().get_advertiser_ids(db_session, agency.id)
+
+    service = AdminMemberService(db_session)
+    user = await service.approve_signup(
+        agency.id, [advertiser.id, advertiser.id, no_profile.id, 999]
+    )
+
+    assert user.approval_status == ApprovalStatus.APPROVED
+    assert await _mapped_ids(db_session, agency.id) == {advertiser.id}
+    assert await get_mapping_index().get_advertiser_ids(db_session, agency.id) == {
+        advertiser.id
+    }
+
+    with pytest.raises(ValueError):
+        await service.approve_signup(agency.id, [advertiser.id])
+
+
+@pytest.mark.asyncio
+async def test_approve_signups_only_pending(db_session, make_user):
+    """일괄 승인은 대기 상태 사용자만 승인하고 승인된 ID만 반환"""
+    pending = [
+        await make_user(approval_status=ApprovalStatus.PENDING) for _ in range(2)
+    ]
+    rejected = await make_user(approval_status=ApprovalStatus.REJECTED)
+    ids = [user.id for user in pending]
+
+    service = AdminMemberService(db_session)
+    approved = await service.approve_signups(ids + [rejected.id, 999])
+
+    assert sorted(approved) == ids
+    statuses = dict(
+        (await db_session.execute(select(User.id, User.approval_status))).all()
+    )
+    assert [statuses[user_id] for user_id in ids] == [ApprovalStatus.APPROVED] * 2
+    assert statuses[rejected.id] == ApprovalStatus.REJECTED
+
+    # 다시 실행해도 변경 없음
+    assert await service.approve_signups(ids) == []
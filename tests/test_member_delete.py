@@ -0,0 +1,168 @@
+"""관리자 회원 삭제 테스트 (테이블별 일괄 삭제, 세션 무효화, 스토리지 정리)"""
+
+import io
+from datetime import date
+
+import pytest
+from fastapi import BackgroundTasks
+from sqlalchemy import func, select
+
+from app.core.config import get_settings
+from app.core.session.memory_store import MemorySessionStore
+from app.core.storage.local_storage import LocalStorage
+from app.core.timezone import now_utc
+from app.models import (
+    Advertiser,
+    AgencyAdvertiserMapping,
+    BlogPosting,
+    CafeInfiltration,
+    File,
+    FileType,
+    PressArticle,
+    RankHistory,
+    RankHistoryRollup,
+    RankTracking,
+    TrackingSessionSummary,
+    User,
+    UserRole,
+)
+from app.repositories.file_repository import FileRepository
+from app.routers.admin.members import delete_member
+from app.services.admin_member_service import AdminMemberService
+from app.services.file_service import FileService
+
+OWNED_MODELS = [
+    RankTracking,
+    RankHistory,
+    RankHistoryRollup,
+    TrackingSessionSummary,
+    BlogPosting,
+    PressArticle,
+    CafeInfiltration,
+    AgencyAdvertiserMapping,
+]
+
+
+async def _count(db_session, model) -> int:
+    return await db_session.scalar(select(func.count()).select_from(model))
+
+
+async def _add_owned_rows(db_session, make_tracking, agency, advertiser) -> None:
+    """광고주 소유 데이터를 하위 테이블마다 한 건씩 추가"""
+    tracking = await make_tracking(agency_id=agency.id, advertiser_id=advertiser.id)
+    now = now_utc()
+    db_session.add_all(
+        [
+            RankHistory(tracking_id=tracking.id, rank=3, session_number=1, checked_at=now),
+            RankHistoryRollup(
+                tracking_id=tracking.id, session_number=1, period_start=date(2026, 1, 5)
+            ),
+            TrackingSessionSummary(
+                tracking_id=tracking.id,
+                session_number=1,
+                first_checked_at=now,
+                last_checked_at=now,
+            ),
+            BlogPosting(
+                agency_id=agency.id,
+                advertiser_id=advertiser.id,
+                keyword="강남 한의원",
+                url="https://blog.naver.com/a/1",
+                posting_date=date(2026, 1, 5),
+            ),
+            PressArticle(
+                advertiser_id=advertiser.id, article_date=date(2026, 1, 5), title="기사"
+            ),
+            CafeInfiltration(
+                advertiser_id=advertiser.id,
+                infiltration_date=date(2026, 1, 5),
+                title="침투",
+            ),
+            AgencyAdvertiserMapping(agency_id=agency.id, advertiser_id=advertiser.id),
+        ]
+    )
+    await db_session.commit()
+
+
+async def _add_logo(db_session, storage, advertiser) -> File:
+    """광고주 로고 파일 (스토리지 + 메타데이터)"""
+    storage_path = await storage.upload(io.BytesIO(b"logo"), "logo.png", "image/png")
+    logo = File(
+        original_filename="logo.png",
+        stored_filename=storage_path.rsplit("/", 1)[-1],
+        file_type=FileType.LOGO,
+        mime_type="image/png",
+        storage_path=storage_path,
+        file_size=4,
+    )
+    db_session.add(logo)
+    await db_session.flush()
+    profile = await db_session.get(Advertiser, advertiser.id)
+    profile.logo_file_id = logo.id
+    await db_session.commit()
+    return logo
+
+
+@pytest.mark.asyncio
+async def test_delete_member_removes_owned_rows(
+    db_session, make_user, make_tracking, agency_user, advertiser_user
+):
+    """삭제 대상 소유 행만 테이블별로 삭제하고 다른 광고주 데이터는 유지"""
+    target = await make_user(UserRole.ADVERTISER)
+    await _add_owned_rows(db_session, make_tracking, agency_user, target)
+    await _add_owned_rows(db_session, make_tracking, agency_user, advertiser_user)
+
+    storage_paths = await AdminMemberService(db_session).delete_member(target.id)
+
+    assert storage_paths == []
+    for model in OWNED_MODELS:
+        assert await _count(db_session, model) == 1, model.__tablename__
+    assert await db_session.get(User, target.id) is None
+    assert await db_session.get(Advertiser, target.id) is None
+    assert await db_session.get(User, advertiser_user.id) is not None
+
+
+@pytest.mark.asyncio
+async def test_delete_member_rejects_admin(db_session, make_user):
+    """관리자 계정과 없는 사용자는 삭제 거부"""
+    admin = await make_user(UserRole.ADMIN)
+    service = AdminMemberService(db_session)
+
+    with pytest.raises(ValueError):
+        await service.delete_member(admin.id)
+    with pytest.raises(ValueError):
+        await service.delete_member(admin.id + 100)
+
+
+@pytest.mark.asyncio
+async def test_delete_member_revokes_sessions_and_cleans_storage(
+    db_session, tmp_path, advertiser_user, agency_user
+):
+    """삭제된 회원의 세션을 모두 삭제하고 스토리지 파일은 응답 후 정리"""
+    storage = LocalStorage(str(tmp_path / "storage"))
+    await storage.connect()
+    logo = await _add_logo(db_session, storage, advertiser_user)
+
+    session_store = MemorySessionStore()
+    await session_store.set("a1", {"user_id": advertiser_user.id})
+    await session_store.set("a2", {"user_id": advertiser_user.id})
+    await session_store.set("b1", {"user_id": agency_user.id})
+
+    background_tasks = BackgroundTasks()
+    await delete_member(
+        advertiser_user.id,
+        background_tasks,
+        service=AdminMemberService(db_session),
+        file_service=FileService(FileRepository(db_session), storage, get_settings()),
+        session_store=session_store,
+    )
+
+    assert await session_store.get("a1") is None
+    assert await session_store.get("a2") is None
+    assert await session_store.get("b1") == {"user_id": agency_user.id}
+    assert await _count(db_session, File) == 0
+
+    # 파일은 커밋 후 백그라운드 태스크에서 삭제
+    assert await storage.exists(logo.storage_path)
+    await background_tasks()
+    assert not await storage.exists(logo.storage_path)
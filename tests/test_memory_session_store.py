@@ -0,0 +1,128 @@
+"""인메모리 세션 저장소 테스트"""
+
+from datetime import timedelta
+
+import pytest
+
+from app.core.session import memory_store
+from app.core.session.memory_store import MemorySessionStore
+
+
+class FakeClock:
+    """time.monotonic 대체 (테스트에서 시간 이동)"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> FakeClock:
+    clock = FakeClock()
+    monkeypatch.setattr(memory_store, "time", clock)
+    return clock
+
+
+@pytest.mark.asyncio
+async def test_get_returns_read_only_view(clock):
+    """저장 시 복사하고 읽기 전용 뷰를 반환"""
+    store = MemorySessionStore()
+    data = {"user_id": 1, "role": "agency"}
+    await store.set("s1", data)
+    data["role"] = "admin"
+
+    session = await store.get("s1")
+    assert session["role"] == "agency"
+    with pytest.raises(TypeError):
+        session["role"] = "admin"
+
+
+@pytest.mark.asyncio
+async def test_get_and_extend_slides_expiry(clock):
+    """남은 시간이 요청 값보다 짧을 때만 연장"""
+    store = MemorySessionStore(default_expire=timedelta(minutes=30))
+    await store.set("s1", {"user_id": 1})
+    await store.set("remember", {"user_id": 1}, expire=timedelta(days=7))
+
+    clock.now += 20 * 60
+    data, remaining = await store.get_and_extend("s1")
+    assert data["user_id"] == 1
+    assert remaining == timedelta(minutes=30)
+
+    # 연장 전 만료 시각(30분)을 지나도 유지
+    clock.now += 20 * 60
+    assert await store.exists("s1")
+
+    # 더 긴 만료(Remember Me)는 줄이지 않음
+    _, remaining = await store.get_and_extend("remember")
+    assert remaining > timedelta(days=6)
+
+    clock.now += 30 * 60
+    assert await store.get_and_extend("s1") is None
+    assert await store.get("s1") is None
+
+
+@pytest.mark.asyncio
+async def test_cleanup_removes_only_expired(clock):
+    """정리는 만료된 세션만 제거 (연장된 세션의 옛 힙 항목은 무시)"""
+    store = MemorySessionStore(default_expire=timedelta(minutes=10))
+    await store.set("s1", {"user_id": 1})
+    await store.set("s2", {"user_id": 2})
+
+    clock.now += 5 * 60
+    await store.refresh("s1")
+
+    clock.now += 6 * 60
+    store._cleanup_expired()
+
+    assert await store.exists("s1")
+    assert not await store.exists("s2")
+    assert 2 not in store._user_sessions
+
+
+@pytest.mark.asyncio
+async def test_delete_by_user(clock):
+    """사용자의 세션만 모두 삭제"""
+    store = MemorySessionStore()
+    await store.set("a1", {"user_id": 1})
+    await store.set("a2", {"user_id": 1})
+    await store.set("b1", {"user_id": 2})
+
+    assert await store.delete_by_user(1) == 2
+    assert await store.get("a1") is None
+    assert await store.get("a2") is None
+    assert await store.get("b1") is not None
+    assert await store.delete_by_user(1) == 0
+
+
+@pytest.mark.asyncio
+async def test_max_entries_evicts_least_recently_used(clock):
+    """최대 개수를 넘으면 가장 오래 사용하지 않은 세션부터 제거"""
+    store = MemorySessionStore(max_entries=2)
+    await store.set("s1", {"user_id": 1})
+    await store.set("s2", {"user_id": 2})
+    await store.get("s1")  # s1 사용 → s2가 가장 오래됨
+
+    await store.set("s3", {"user_id": 3})
+
+    assert await store.exists("s1")
+    assert not await store.exists("s2")
+    assert await store.exists("s3")
+    assert 2 not in store._user_sessions
+
+
+@pytest.mark.asyncio
+async def test_max_entries_prefers_expired(clock):
+    """초과 시 만료된 세션이 있으면 그것부터 정리"""
+    store = MemorySessionStore(max_entries=2)
+    await store.set("short", {"user_id": 1}, expire=timedelta(minutes=1))
+    await store.set("s2", {"user_id": 2})
+
+    clock.now += 2 * 60
+    await store.set("s3", {"user_id": 3})
+
+    assert not await store.exists("short")
+    assert await store.exists("s2")
+    assert await store.exists("s3")
@@ -0,0 +1,98 @@
+"""Redis 세션 저장소 테스트 (fakeredis, Lua 스크립트 포함)"""
+
+from datetime import timedelta
+
+import pytest
+import pytest_asyncio
+
+from app.core.config import SessionCodecType
+from app.core.session.codec import SessionCodec
+from app.core.session.redis_store import RedisSessionStore
+
+# fakeredis Lua에는 cmsgpack이 없으므로 인덱스 연장은 JSON 계열 코덱으로 검증
+JSON_CODECS = [SessionCodecType.JSON, SessionCodecType.ORJSON]
+
+
+@pytest_asyncio.fixture(params=JSON_CODECS)
+async def store(request, fake_redis):
+    store = RedisSessionStore(
+        "redis://localhost:6379/0",
+        default_expire=timedelta(minutes=30),
+        codec=SessionCodec(request.param),
+    )
+    await store.connect()
+    yield store
+    await store.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_get_and_extend_slides_session_and_index(store):
+    """세션 만료 연장 시 사용자 인덱스 만료도 함께 연장"""
+    client = store._client
+    await store.set("s1", {"user_id": 7, "role": "agency"}, expire=timedelta(minutes=10))
+    assert 0 < await client.pttl("user_sessions:7") <= 10 * 60 * 1000
+
+    data, remaining = await store.get_and_extend("s1")
+
+    assert data == {"user_id": 7, "role": "agency"}
+    assert remaining == timedelta(minutes=30)
+    assert await client.pttl("session:s1") > 10 * 60 * 1000
+    assert await client.pttl("user_sessions:7") > 10 * 60 * 1000
+
+
+@pytest.mark.asyncio
+async def test_get_and_extend_keeps_longer_expiry(store):
+    """남은 만료가 더 길면 (Remember Me) 줄이지 않음"""
+    await store.set("remember", {"user_id": 7}, expire=timedelta(days=7))
+
+    _, remaining = await store.get_and_extend("remember")
+
+    assert remaining > timedelta(days=6)
+    assert await store._client.pttl("user_sessions:7") > 6 * 24 * 3600 * 1000
+
+
+@pytest.mark.asyncio
+async def test_get_and_extend_missing_session(store):
+    """없는 세션은 None"""
+    assert await store.get_and_extend("missing") is None
+
+
+@pytest.mark.asyncio
+async def test_refresh_extends_index(store):
+    """refresh도 사용자 인덱스 만료를 연장"""
+    client = store._client
+    await store.set("s1", {"user_id": 7}, expire=timedelta(minutes=1))
+
+    assert await store.refresh("s1", expire=timedelta(hours=2))
+    assert await client.pttl("session:s1") > 60 * 60 * 1000
+    assert await client.pttl("user_sessions:7") > 60 * 60 * 1000
+    assert not await store.refresh("missing")
+
+
+@pytest.mark.asyncio
+async def test_set_prunes_stale_index_entries(store):
+    """로그인 시 만료/로그아웃된 세션 ID를 인덱스에서 제거"""
+    client = store._client
+    await store.set("old", {"user_id": 7})
+    await store.delete("old")
+
+    await store.set("new", {"user_id": 7})
+
+    assert await client.smembers("user_sessions:7") == {b"new"}
+
+
+@pytest.mark.asyncio
+async def test_delete_by_user(store):
+    """사용자의 세션과 인덱스를 모두 삭제"""
+    client = store._client
+    await store.set("a1", {"user_id": 7})
+    await store.set("a2", {"user_id": 7})
+    await store.set("b1", {"user_id": 8})
+
+    assert await store.delete_by_user(7) == 2
+    assert await store.get("a1") is None
+    assert await store.get("a2") is None
+    assert await store.get("b1") == {"user_id": 8}
+    assert not await client.exists("user_sessions:7")
+    assert await store.delete_by_user(7) == 0
+
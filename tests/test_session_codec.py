@@ -0,0 +1,76 @@
+"""세션 코덱 테스트"""
+
+import json
+from datetime import timedelta
+
+import pytest
+
+from app.core.config import SessionCodecType
+from app.core.session.codec import SessionCodec
+from app.core.session.redis_store import RedisSessionStore
+
+SESSION = {
+    "user_id": 42,
+    "role": "advertiser",
+    "name": "홍길동",
+    "agency_id": None,
+    "advertiser_id": 42,
+    "remember": True,
+    "scopes": ["place", "blog"],
+}
+
+
+@pytest.mark.parametrize("codec_type", list(SessionCodecType))
+def test_round_trip(codec_type):
+    """인코딩한 세션을 그대로 복원"""
+    codec = SessionCodec(codec_type)
+    assert codec.decode(codec.encode(SESSION)) == SESSION
+
+
+@pytest.mark.parametrize("codec_type", list(SessionCodecType))
+def test_decodes_every_format(codec_type):
+    """설정과 무관하게 모든 포맷을 읽음 (포맷 전환 중 기존 세션 유지)"""
+    payload = SessionCodec(codec_type).encode(SESSION)
+    for reader_type in SessionCodecType:
+        assert SessionCodec(reader_type).decode(payload) == SESSION
+
+
+def test_payload_tags():
+    """JSON은 태그 없음, orjson/msgpack은 첫 바이트 태그"""
+    assert SessionCodec(SessionCodecType.JSON).encode(SESSION)[:1] == b"{"
+    assert SessionCodec(SessionCodecType.ORJSON).encode(SESSION)[:1] == b"\x01"
+    assert SessionCodec(SessionCodecType.MSGPACK).encode(SESSION)[:1] == b"\x02"
+
+
+def test_decodes_legacy_json():
+    """코덱 도입 전 저장된 JSON 텍스트 세션 (ASCII 이스케이프 포함)"""
+    legacy = json.dumps(SESSION).encode("utf-8")
+    assert "\\u" in legacy.decode()
+
+    for codec_type in SessionCodecType:
+        assert SessionCodec(codec_type).decode(legacy) == SESSION
+
+
+@pytest.mark.asyncio
+async def test_store_reads_sessions_written_with_other_codec(fake_redis):
+    """코덱 전환 중에도 저장소가 기존 포맷 세션을 읽고 연장"""
+    old = RedisSessionStore("redis://localhost:6379/0", codec=SessionCodec())
+    new = RedisSessionStore(
+        "redis://localhost:6379/0",
+        codec=SessionCodec(SessionCodecType.MSGPACK),
+    )
+    await old.connect()
+    await new.connect()
+
+    await old.set("s1", SESSION, expire=timedelta(minutes=1))
+    data, remaining = await new.get_and_extend("s1", expire=timedelta(hours=1))
+
+    assert data == SESSION
+    assert remaining == timedelta(hours=1)
+
+    # 되돌리기(msgpack → JSON)도 가능
+    await new.set("s2", SESSION)
+    assert await old.get("s2") == SESSION
+
+    await old.disconnect()
+    await new.disconnect()
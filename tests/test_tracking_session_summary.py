@@ -0,0 +1,112 @@
+"""추적 회차 요약 저장소 테스트"""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import update
+
+from app.models import RankHistory
+from app.repositories.tracking import TrackingSessionSummaryRepository
+
+
+def _checked_at(day: int) -> datetime:
+    return datetime(2026, 3, 1, 1, tzinfo=timezone.utc) + timedelta(days=day)
+
+
+async def _add_history(session, tracking_id, rank, day, session_number=1):
+    """히스토리 1건 저장 (record_check 호출 전 flush)"""
+    history = RankHistory(
+        tracking_id=tracking_id,
+        rank=rank,
+        session_number=session_number,
+        checked_at=_checked_at(day),
+    )
+    session.add(history)
+    await session.flush()
+    return history
+
+
+@pytest.mark.asyncio
+async def test_record_check_accumulates(db_session, tracking):
+    """체크마다 노출 수/최고·최저 순위/합계 누적"""
+    repo = TrackingSessionSummaryRepository(db_session)
+
+    exposures = []
+    for day, rank in enumerate([7, None, 3, 12]):
+        await _add_history(db_session, tracking.id, rank, day)
+        exposures.append(
+            await repo.record_check(tracking.id, 1, rank, _checked_at(day))
+        )
+    await db_session.commit()
+
+    assert exposures == [1, 1, 2, 3]
+
+    summary = await repo.get(tracking.id, 1)
+    assert summary.check_count == 4
+    assert summary.exposure_count == 3
+    assert summary.best_rank == 3
+    assert summary.worst_rank == 12
+    assert summary.rank_sum == 22
+    assert summary.first_checked_at == _checked_at(0)
+    assert summary.last_checked_at == _checked_at(3)
+
+
+@pytest.mark.asyncio
+async def test_record_check_backfills_existing_histories(db_session, tracking):
+    """요약 도입 전 히스토리가 있으면 첫 체크에서 회차 전체를 재계산"""
+    for day, rank in enumerate([4, None, 6]):
+        await _add_history(db_session, tracking.id, rank, day)
+    await db_session.commit()
+
+    repo = TrackingSessionSummaryRepository(db_session)
+    await _add_history(db_session, tracking.id, 2, 3)
+    exposure_count = await repo.record_check(tracking.id, 1, 2, _checked_at(3))
+    await db_session.commit()
+
+    assert exposure_count == 3
+
+    summary = await repo.get(tracking.id, 1)
+    assert summary.check_count == 4
+    assert summary.best_rank == 2
+    assert summary.worst_rank == 6
+    assert summary.rank_sum == 12
+    assert summary.first_checked_at == _checked_at(0)
+
+    # 이후 체크는 재계산 없이 누적
+    await _add_history(db_session, tracking.id, None, 4)
+    assert await repo.record_check(tracking.id, 1, None, _checked_at(4)) == 3
+    summary = await repo.get(tracking.id, 1)
+    assert summary.check_count == 5
+
+
+@pytest.mark.asyncio
+async def test_rebuild_overwrites_from_histories(db_session, tracking):
+    """히스토리 순위가 바뀌면 해당 회차만 재계산"""
+    repo = TrackingSessionSummaryRepository(db_session)
+    first = await _add_history(db_session, tracking.id, 5, 0)
+    await repo.record_check(tracking.id, 1, 5, _checked_at(0))
+    await _add_history(db_session, tracking.id, 9, 1, session_number=2)
+    await repo.record_check(tracking.id, 2, 9, _checked_at(1))
+    await db_session.commit()
+
+    # 같은 날 재크롤링으로 미노출 처리
+    await db_session.execute(
+        update(RankHistory).where(RankHistory.id == first.id).values(rank=None)
+    )
+    assert await repo.rebuild(tracking.id, 1) == 1
+    await db_session.commit()
+
+    summary = await repo.get(tracking.id, 1)
+    assert summary.check_count == 1
+    assert summary.exposure_count == 0
+    assert summary.best_rank is None
+    assert summary.rank_sum == 0
+
+    other = await repo.get(tracking.id, 2)
+    assert other.exposure_count == 1
+    assert other.best_rank == 9
+
+    # 전체 재구축
+    assert await repo.rebuild() == 2
+    summaries = await repo.get_by_tracking_id(tracking.id)
+    assert [s.session_number for s in summaries] == [2, 1]
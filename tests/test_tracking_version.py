@@ -0,0 +1,85 @@
+"""추적 목록/상세 조건부 GET 버전 마커 테스트"""
+
+from datetime import timedelta
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from sqlalchemy import update
+
+from app.core.conditional import ConditionalRequest, get_conditional_request
+from app.core.timezone import now_utc
+from app.models import RankTracking, RankType, TrackingStatus, User
+from app.services.rank.rank_service import RankService
+
+
+@pytest.fixture
+def client(db_session):
+    """실제 RankService 버전 마커로 ETag를 계산하는 라우터 대역"""
+    app = FastAPI(version="1.0.0")
+
+    @app.get("/trackings")
+    async def list_trackings(
+        conditional: ConditionalRequest = Depends(get_conditional_request),
+    ):
+        version = await RankService(db_session).get_tracking_list_version(RankType.PLACE)
+        if conditional.is_not_modified(version):
+            return conditional.not_modified_response()
+        return {}
+
+    @app.get("/trackings/{tracking_id}")
+    async def get_tracking(
+        tracking_id: int,
+        conditional: ConditionalRequest = Depends(get_conditional_request),
+    ):
+        version = await RankService(db_session).get_tracking_detail_version(tracking_id)
+        if version is not None and conditional.is_not_modified(version):
+            return conditional.not_modified_response()
+        return {}
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app), base_url="http://test")
+
+
+async def _revalidate(client, path: str, etag: str) -> int:
+    response = await client.get(path, headers={"If-None-Match": etag})
+    return response.status_code
+
+
+@pytest.mark.asyncio
+async def test_status_change_within_same_timestamp(client, db_session, tracking):
+    """updated_at이 그대로인 상태 변경도 200 (변경 카운터로 감지)"""
+    same_timestamp = now_utc().replace(microsecond=0)
+    await db_session.execute(update(RankTracking).values(updated_at=same_timestamp))
+    await db_session.commit()
+
+    paths = ["/trackings", f"/trackings/{tracking.id}"]
+    etags = [(await client.get(path)).headers["etag"] for path in paths]
+    for path, etag in zip(paths, etags):
+        assert await _revalidate(client, path, etag) == 304
+
+    await db_session.execute(
+        update(RankTracking)
+        .where(RankTracking.id == tracking.id)
+        .values(status=TrackingStatus.STOPPED, updated_at=same_timestamp)
+    )
+    await db_session.commit()
+
+    for path, etag in zip(paths, etags):
+        assert await _revalidate(client, path, etag) == 200
+
+
+@pytest.mark.asyncio
+async def test_company_name_change(client, db_session, tracking, advertiser_user):
+    """광고주명(참조 사용자) 변경도 200"""
+    paths = ["/trackings", f"/trackings/{tracking.id}"]
+    etags = [(await client.get(path)).headers["etag"] for path in paths]
+
+    await db_session.execute(
+        update(User)
+        .where(User.id == advertiser_user.id)
+        .values(company_name="새광고주", updated_at=now_utc() + timedelta(seconds=1))
+    )
+    await db_session.commit()
+
+    for path, etag in zip(paths, etags):
+        assert await _revalidate(client, path, etag) == 200
@@ -0,0 +1,124 @@
+"""응답 전송 포맷 협상 / 인코딩 테스트"""
+
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import msgpack
+import orjson
+import pytest
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.core.wire_format import (
+    MEDIA_TYPE_COLUMNAR_JSON,
+    MEDIA_TYPE_COLUMNAR_MSGPACK,
+    MEDIA_TYPE_JSON,
+    MEDIA_TYPE_MSGPACK,
+    WIRE_FORMAT_JSON,
+    get_wire_format,
+    render,
+)
+
+
+class HistoryItem(BaseModel):
+    id: int
+    rank: Optional[int]
+    checked_at: datetime
+
+
+class DetailResponse(BaseModel):
+    id: int
+    keyword: str
+    histories: List[HistoryItem]
+
+
+DETAIL = DetailResponse(
+    id=1,
+    keyword="강남 한의원",
+    histories=[
+        HistoryItem(id=10, rank=3, checked_at=datetime(2026, 3, 1, tzinfo=timezone.utc)),
+        HistoryItem(id=11, rank=None, checked_at=datetime(2026, 3, 2, tzinfo=timezone.utc)),
+    ],
+)
+
+
+def _request(accept: Optional[str]) -> Request:
+    headers = [(b"accept", accept.encode())] if accept is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers})
+
+
+@pytest.mark.parametrize(
+    "accept, media_type",
+    [
+        (None, MEDIA_TYPE_JSON),
+        ("*/*", MEDIA_TYPE_JSON),
+        ("application/json", MEDIA_TYPE_JSON),
+        (MEDIA_TYPE_MSGPACK, MEDIA_TYPE_MSGPACK),
+        ("application/x-msgpack", MEDIA_TYPE_MSGPACK),
+        (MEDIA_TYPE_COLUMNAR_JSON, MEDIA_TYPE_COLUMNAR_JSON),
+        (f"application/json;q=0.5, {MEDIA_TYPE_COLUMNAR_MSGPACK}", MEDIA_TYPE_COLUMNAR_MSGPACK),
+        (f"{MEDIA_TYPE_MSGPACK};q=0, application/json", MEDIA_TYPE_JSON),
+        ("text/html, image/png", MEDIA_TYPE_JSON),
+    ],
+)
+def test_negotiation(accept, media_type):
+    """지원 타입 중 q가 가장 높은 것, 없으면 기본 JSON (항상 Vary: Accept)"""
+    response = Response()
+    wire_format = get_wire_format(_request(accept), response)
+
+    assert wire_format.media_type == media_type
+    assert response.headers["vary"] == "Accept"
+
+
+def test_default_json_returns_model():
+    """기본 JSON이면 모델 그대로 (FastAPI 직렬화 경로 유지)"""
+    assert render(DETAIL, WIRE_FORMAT_JSON) is DETAIL
+    assert render(None, WIRE_FORMAT_JSON) is None
+
+
+def test_columnar_json():
+    """객체 배열 필드를 열 단위 병렬 배열로 변환"""
+    wire_format = get_wire_format(_request(MEDIA_TYPE_COLUMNAR_JSON), Response())
+    response = render(DETAIL, wire_format)
+
+    assert response.media_type == MEDIA_TYPE_COLUMNAR_JSON
+    assert response.headers["vary"] == "Accept"
+    assert orjson.loads(response.body) == {
+        "id": 1,
+        "keyword": "강남 한의원",
+        "histories": {
+            "id": [10, 11],
+            "rank": [3, None],
+            "checked_at": ["2026-03-01T00:00:00Z", "2026-03-02T00:00:00Z"],
+        },
+    }
+
+
+def test_columnar_keeps_columns_for_empty_list():
+    """빈 목록에도 열 이름 유지"""
+    wire_format = get_wire_format(_request(MEDIA_TYPE_COLUMNAR_JSON), Response())
+    response = render(DetailResponse(id=2, keyword="k", histories=[]), wire_format)
+
+    assert orjson.loads(response.body)["histories"] == {
+        "id": [],
+        "rank": [],
+        "checked_at": [],
+    }
+
+
+def test_msgpack_matches_json_structure():
+    """MessagePack은 기존 JSON과 같은 구조"""
+    wire_format = get_wire_format(_request(MEDIA_TYPE_MSGPACK), Response())
+    response = render(DETAIL, wire_format)
+
+    assert response.media_type == MEDIA_TYPE_MSGPACK
+    assert msgpack.unpackb(response.body) == DETAIL.model_dump(mode="json")
+
+
+def test_columnar_msgpack():
+    """열 단위 + MessagePack"""
+    wire_format = get_wire_format(_request(MEDIA_TYPE_COLUMNAR_MSGPACK), Response())
+    response = render(DETAIL, wire_format)
+
+    assert response.media_type == MEDIA_TYPE_COLUMNAR_MSGPACK
+    assert msgpack.unpackb(response.body)["histories"]["rank"] == [3, None]